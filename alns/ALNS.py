@@ -1,23 +1,37 @@
+import copy
+import os
+import pickle
+import random
+import time
 import warnings
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import Manager
 
 import numpy as np
-import numpy.random as rnd
 
+from .CachedState import CachedState
 from .CallbackFlag import CallbackFlag
 from .CallbackMixin import CallbackMixin
+from .OperatorRuntimes import OperatorRuntimes
+from .RepairContext import RepairContext
 from .Result import Result
 from .State import State  # pylint: disable=unused-import
 from .Statistics import Statistics
 from .WeigthIndex import WeightIndex
 from .criteria import AcceptanceCriterion  # pylint: disable=unused-import
-from .exceptions_warnings import OverwriteWarning
-from .select_operator import select_operator
+from .exceptions_warnings import (ObjectiveMismatchError, OverwriteWarning,
+                                  RepairAborted)
+from .rng import draw_seed, get_rng, spawn
+from .select import OperatorSelectionScheme  # pylint: disable=unused-import
+from .select.RouletteWheel import RouletteWheel
+from .sink import TraceSink  # pylint: disable=unused-import
+from .stop import StoppingCriterion  # pylint: disable=unused-import
 
 
 class ALNS(CallbackMixin):
 
-    def __init__(self, rnd_state=rnd.RandomState()):
+    def __init__(self, rnd_state=None, check_objectives=False):
         """
         Implements the adaptive large neighbourhood search (ALNS) algorithm.
         The implementation optimises for a minimisation problem, as explained
@@ -25,11 +39,20 @@ class ALNS(CallbackMixin):
 
         Parameters
         ----------
-        rnd_state : rnd.RandomState
-            Optional random state to use for random number generation. When
-            passed, this state is used for operator selection and general
-            computations requiring random numbers. It is also passed to the
-            destroy and repair operators, as a second argument.
+        rnd_state : Generator or int
+            Optional random number generator, or a seed (an integer or
+            ``SeedSequence``) for a PCG64-based ``Generator``. This generator is
+            used for operator selection and general computations requiring
+            random numbers. Every iteration, the destroy and repair operators
+            are passed a generator seeded from it, as a second argument. When
+            not passed, a generator is seeded from fresh entropy. A legacy
+            ``RandomState`` is still accepted, but operators may assume a
+            ``Generator``.
+        check_objectives : bool
+            Debug option. When set, the cached objective of every candidate
+            `CachedState` is checked against its objective computed in full,
+            to catch operators that report incorrect objective deltas. Default
+            False, as this undoes the benefit of caching.
 
         References
         ----------
@@ -41,8 +64,10 @@ class ALNS(CallbackMixin):
 
         self._destroy_operators = OrderedDict()
         self._repair_operators = OrderedDict()
+        self._context_operators = set()
 
-        self._rnd_state = rnd_state
+        self._rnd_state = get_rng(rnd_state)
+        self._check_objectives = check_objectives
 
     @property
     def destroy_operators(self):
@@ -76,36 +101,51 @@ class ALNS(CallbackMixin):
 
         Parameters
         ----------
-        operator : Callable[[State, RandomState], State]
+        operator : Callable[[State, Generator], State]
             An operator that, when applied to the current state, returns a new
-            state reflecting its implemented destroy action. The second argument
-            is the random state constructed from the passed-in seed.
+            state reflecting its implemented destroy action. The second
+            argument is a random number generator, seeded for the iteration
+            from the generator of the ALNS instance.
         name : str
             Optional name argument, naming the operator. When not passed, the
             function name is used instead.
         """
         self._add_operator(self._destroy_operators, operator, name)
 
-    def add_repair_operator(self, operator, name=None):
+    def add_repair_operator(self, operator, name=None, context=False):
         """
         Adds a repair operator to the heuristic instance.
 
         Parameters
         ----------
-        operator : Callable[[State, RandomState], State]
+        operator : Callable[[State, Generator], State]
             An operator that, when applied to the destroyed state, returns a
             new state reflecting its implemented repair action. The second
-            argument is the random state constructed from the passed-in seed.
+            argument is the random number generator of the iteration, which is
+            also passed to the destroy operator.
         name : str
             Optional name argument, naming the operator. When not passed, the
             function name is used instead.
+        context : bool
+            Should the operator be passed a ``RepairContext``, as a third
+            argument? The context holds the objective value above which the
+            candidate is certainly rejected, so that the operator may abort
+            early by raising ``RepairAborted``. The context is None when
+            candidates are generated speculatively. Default False.
         """
-        self._add_operator(self._repair_operators, operator, name)
+        name = self._add_operator(self._repair_operators, operator, name)
+
+        if context:
+            self._context_operators.add(name)
+        else:
+            self._context_operators.discard(name)
 
 
 
     def iterate(self, initial_solution, weights, operator_decay, criterion,
-                iterations=10000, collect_stats=True):
+                iterations=10000, collect_stats=True, stop=None,
+                n_speculative=None, runtime_aware=False, sink=None,
+                scheme=None, initializer=None, initargs=()):
         """
         Runs the adaptive large neighbourhood search heuristic [1], using the
         previously set destroy and repair operators. The first solution is set
@@ -120,18 +160,74 @@ class ALNS(CallbackMixin):
             A list of four positive elements, representing the weight updates
             when the candidate solution results in a new global best (idx 0),
             is better than the current solution (idx 1), the solution is
-            accepted (idx 2), or rejected (idx 3).
+            accepted (idx 2), or rejected (idx 3). Used by the default
+            roulette wheel operator selection.
         operator_decay : float
             The operator decay parameter, as a float in the unit interval,
-            [0, 1] (inclusive).
+            [0, 1] (inclusive). Used by the default roulette wheel operator
+            selection.
         criterion : AcceptanceCriterion
             The acceptance criterion to use for candidate states. See also
             the `alns.criteria` module for an overview.
         iterations : int
-            The number of iterations. Default 10000.
-        collect_stats : bool
+            The maximum number of iterations. Default 10000. May be None when
+            a stopping criterion is passed, to iterate until it stops the run.
+        collect_stats : bool or Statistics
             Should statistics be collected during iteration? Default True, but
-            may be turned off for long runs to reduce memory consumption.
+            may be turned off for long runs to reduce memory consumption. An
+            empty ``Statistics`` object may also be passed to collect into,
+            e.g. one that decimates the objective values it stores.
+        stop : StoppingCriterion
+            Optional stopping criterion, evaluated before every iteration. The
+            run stops when either the criterion is met, or the maximum number
+            of iterations is reached. The criterion is reset when the run
+            starts. See also the `alns.stop` module for an overview.
+        n_speculative : int
+            Optional number of candidates to generate speculatively, in as
+            many worker processes. Each step, this many candidates are
+            generated in parallel from the current solution, and then
+            considered in a fixed order. Once a candidate is accepted, the
+            remaining candidates were generated from an outdated current
+            solution, so these are discarded. As most candidates tend to be
+            rejected, this mostly parallelises the search. Only considered
+            candidates count as iterations. The candidates of a step are
+            selected as a sequential run would, were the earlier candidates
+            of the step rejected, so that the run follows the same search path
+            as a sequential run with the same random state. This holds when
+            the operators only draw from the generator passed to them, the
+            selection scheme only changes when it is updated, and the weight
+            updates do not account for runtimes. The operators must be
+            picklable. Default None, which runs sequentially.
+        runtime_aware : bool
+            Should the weight updates account for the operators' runtimes?
+            When set, the reward of an operator is divided by its smoothed
+            runtime, relative to the mean smoothed runtime of the operators of
+            the same type. The weights then reflect the reward per unit of
+            time, which favours cheap operators over expensive ones that are
+            about as successful. The runtimes are smoothed as an exponential
+            moving average, using the operator decay parameter. Default False.
+        sink : TraceSink
+            Optional sink to stream the per-iteration trace to, e.g. for long
+            runs where the trace should not be held in memory. The sink is
+            opened when the run starts, and closed when it ends. As in the
+            statistics, the initial solution is recorded as iteration zero.
+            See also the `alns.sink` module for an overview.
+        scheme : OperatorSelectionScheme
+            Optional operator selection scheme, which selects the operators to
+            apply in every iteration, and learns from their outcomes. Default
+            None, which selects by roulette wheel, using the weights and
+            operator decay. See also the `alns.select` module for an overview.
+            A scheme keeps its state, so that a run may be continued.
+        initializer : callable
+            Optional callable, run in every worker process when it starts if
+            candidates are generated speculatively. The current solution is
+            pickled for every speculative candidate, and every candidate is
+            pickled back. Large read-only data that the states share, such as
+            a problem instance, can be sent to the workers once with the
+            initializer instead, if the states then pickle only a reference to
+            it. Default None.
+        initargs : tuple
+            Arguments passed to the initializer. Default empty.
 
         Raises
         ------
@@ -141,8 +237,9 @@ class ALNS(CallbackMixin):
         Returns
         -------
         Result
-            A result object, containing the best solution and some additional
-            statistics.
+            A result object, containing the best solution, the reason the run
+            stopped, its runtime, and some additional statistics. When a sink
+            is passed, the result can reload the trace from it.
 
         References
         ----------
@@ -154,53 +251,511 @@ class ALNS(CallbackMixin):
         class of vehicle routing problems with backhauls. *European Journal of
         Operational Research*, 171: 750–775, 2006.
         """
-        weights = np.asarray(weights, dtype=np.float16)
+        weights = np.asarray(weights, dtype=np.float64)
 
         self._validate_parameters(weights, operator_decay, iterations)
 
+        if iterations is None and stop is None:
+            raise ValueError("Expected a stopping criterion to iterate"
+                             " without a maximum number of iterations.")
+
+        if n_speculative is not None:
+            if n_speculative < 1:
+                raise ValueError("Expected at least one speculative"
+                                 " candidate.")
+
+            self._check_picklable()
+
+        if stop is not None:
+            stop.reset()
+
+        start = time.perf_counter()
+
         current = best = initial_solution
 
-        d_weights = np.ones(len(self.destroy_operators), dtype=np.float16)
-        r_weights = np.ones(len(self.repair_operators), dtype=np.float16)
+        scheme = self._get_scheme(weights, operator_decay, scheme)
+        runtimes = self._get_runtimes(operator_decay) if runtime_aware else None
 
-        statistics = Statistics()
+        statistics = _get_statistics(collect_stats)
 
-        if collect_stats:
+        if statistics is not None:
             statistics.collect_objective(initial_solution.objective())
 
-        for iteration in range(iterations):
-            d_idx = select_operator(self.destroy_operators, d_weights,
-                                    self._rnd_state)
+        if sink is not None:
+            sink.open()
+            sink.write_initial(initial_solution.objective())
+
+        try:
+            if n_speculative is None:
+                best, current, reason = self._iterate(best, current, scheme,
+                                                      criterion, iterations,
+                                                      statistics, stop,
+                                                      runtimes, sink)
+            else:
+                with ProcessPoolExecutor(n_speculative,
+                                         initializer=_init_speculative_worker,
+                                         initargs=(self, initializer,
+                                                   initargs)) as pool:
+                    best, current, reason = self._iterate_speculative(
+                        pool, n_speculative, best, current, scheme, criterion,
+                        iterations, statistics, stop, runtimes, sink)
+        finally:
+            if sink is not None:
+                sink.close()
+
+        return Result(best, statistics, reason, time.perf_counter() - start,
+                      sink)
+
+    def iterate_multistart(self, initial_solution, weights, operator_decay,
+                           criterion, iterations=10000, collect_stats=True,
+                           n_workers=None, seeds=None, stop=None,
+                           runtime_aware=False):
+        """
+        Runs independent replicas of the ALNS heuristic in a pool of worker
+        processes, and returns the best result found. Each replica starts from
+        the passed-in initial solution and calls ``iterate`` on its own copy
+        of this ALNS instance and of the acceptance criterion, using its own
+        random stream.
+
+        Parameters
+        ----------
+        initial_solution : State
+            The initial solution, as a State object.
+        weights: array_like
+            A list of four positive elements. See ``iterate``.
+        operator_decay : float
+            The operator decay parameter. See ``iterate``.
+        criterion : AcceptanceCriterion
+            The acceptance criterion to use for candidate states. Every
+            replica receives a fresh copy of this criterion.
+        iterations : int
+            The maximum number of iterations per replica. Default 10000.
+        collect_stats : bool or Statistics
+            Should statistics be collected during iteration? See ``iterate``.
+            Default True.
+        n_workers : int
+            Number of worker processes. When not passed, this defaults to the
+            number of processors on the machine.
+        seeds : array_like
+            Optional seeds, one for each replica. A seed may be an integer or
+            a ``SeedSequence``, and is used to seed a PCG64-based generator
+            for the replica. When not passed, one replica is run per worker,
+            with independent seed sequences spawned from this instance's
+            generator (see ``alns.rng.spawn``).
+        stop : StoppingCriterion
+            Optional stopping criterion. Every replica receives a fresh copy
+            of this criterion. See ``iterate``.
+        runtime_aware : bool
+            Should the weight updates account for the operators' runtimes?
+            See ``iterate``. Default False.
+
+        Raises
+        ------
+        ValueError
+            When the parameters do not meet requirements, or when the
+            operators, callbacks or criterion cannot be pickled. Operators
+            should then be defined at module level, rather than as lambdas or
+            nested functions.
+
+        Returns
+        -------
+        Result
+            The result of the replica that found the best solution.
+        list
+            The results of all replicas, in the order of the seeds.
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+
+        self._validate_parameters(weights, operator_decay, iterations)
+
+        if iterations is None and stop is None:
+            raise ValueError("Expected a stopping criterion to iterate"
+                             " without a maximum number of iterations.")
+
+        seeds = self._prepare_workers(n_workers, seeds, criterion, stop)
 
-            r_idx = select_operator(self.repair_operators, r_weights,
-                                    self._rnd_state)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [executor.submit(_iterate_replica, self, seed,
+                                       initial_solution, weights,
+                                       operator_decay, criterion, iterations,
+                                       collect_stats, stop, runtime_aware)
+                       for seed in seeds]
+
+            results = [future.result() for future in futures]
+
+        best = min(results, key=lambda result: result.best_state.objective())
+        return best, results
+
+    def iterate_islands(self, initial_solution, weights, operator_decay,
+                        criterion, iterations=10000, collect_stats=True,
+                        n_workers=None, seeds=None, migration_interval=100,
+                        topology="ring", share_weights=False,
+                        runtime_aware=False):
+        """
+        Runs a cooperative, island-model ALNS heuristic. Each island is a
+        worker process that runs the ALNS loop on its own copy of this ALNS
+        instance and of the acceptance criterion, using its own random stream.
+        Every ``migration_interval`` iterations, the islands send their best
+        solution to their neighbours. An island continues from a migrant
+        solution when it improves upon the island's best.
+
+        Parameters
+        ----------
+        initial_solution : State
+            The initial solution, as a State object.
+        weights: array_like
+            A list of four positive elements. See ``iterate``.
+        operator_decay : float
+            The operator decay parameter. See ``iterate``.
+        criterion : AcceptanceCriterion
+            The acceptance criterion to use for candidate states. Every
+            island receives a fresh copy of this criterion.
+        iterations : int
+            The number of iterations per island. Default 10000.
+        collect_stats : bool or Statistics
+            Should statistics be collected during iteration? See ``iterate``.
+            Default True.
+        n_workers : int
+            Number of islands, when no seeds are passed. Defaults to the number
+            of processors on the machine.
+        seeds : array_like
+            Optional seeds, one for each island. See ``iterate_multistart``.
+        migration_interval : int
+            Number of iterations between migrations. Default 100.
+        topology : str
+            The migration topology, one of {'ring', 'broadcast'}. In a ring,
+            each island sends its best solution to the next island. With
+            broadcast, it is sent to all other islands. Default 'ring'.
+        share_weights : bool
+            Should the islands also share their operator weights? When set,
+            each island replaces its weights by the average of its own and the
+            received weights after every migration. Default False.
+        runtime_aware : bool
+            Should the weight updates account for the operators' runtimes?
+            See ``iterate``. Default False.
 
-            d_name, d_operator = self.destroy_operators[d_idx]
-            destroyed = d_operator(current, self._rnd_state)
+        Raises
+        ------
+        ValueError
+            When the parameters do not meet requirements, or when the
+            operators, callbacks or criterion cannot be pickled.
 
+        Returns
+        -------
+        Result
+            The result of the island that found the best solution.
+        list
+            The results of all islands, in the order of the seeds.
+        """
+        weights = np.asarray(weights, dtype=np.float64)
+
+        self._validate_parameters(weights, operator_decay, iterations)
+
+        if iterations is None:
+            raise ValueError("Islands need a maximum number of iterations.")
+
+        if migration_interval < 1:
+            raise ValueError("Migration interval must be at least one.")
+
+        if topology not in ("ring", "broadcast"):
+            raise ValueError("Topology `{0}' not understood.".format(topology))
+
+        seeds = self._prepare_workers(n_workers, seeds, criterion)
+
+        # Islands block on each other at every migration, so each island
+        # needs its own process.
+        with Manager() as manager, \
+                ProcessPoolExecutor(max_workers=len(seeds)) as executor:
+            inboxes = [manager.Queue() for _ in seeds]
+
+            futures = [executor.submit(_iterate_island, self, seed, island,
+                                       inboxes, initial_solution, weights,
+                                       operator_decay, criterion, iterations,
+                                       collect_stats, migration_interval,
+                                       topology, share_weights, runtime_aware)
+                       for island, seed in enumerate(seeds)]
+
+            results = [future.result() for future in futures]
+
+        best = min(results, key=lambda result: result.best_state.objective())
+        return best, results
+
+    def _iterate(self, best, current, scheme, criterion, iterations,
+                 statistics, stop=None, runtimes=None, sink=None):
+        """
+        Internal helper that runs ALNS iterations from the passed-in best and
+        current solutions, until the number of iterations is reached or the
+        stopping criterion is met. The operator selection scheme learns from
+        every iteration, so that a run may be continued by calling this helper
+        again. When the weight updates account for runtimes, the
+        destroy and repair ``OperatorRuntimes`` are passed as a tuple. The
+        trace is written to the sink, when passed, which must be open. See
+        ``iterate`` for the other parameters.
+
+        Returns
+        -------
+        State
+            The (possibly new) best state.
+        State
+            The (possibly new) current state.
+        str
+            The reason the run stopped.
+        """
+        iteration = 0
+
+        # Operator times are only needed for the statistics and runtime-aware
+        # weight updates, so the clock is not read otherwise.
+        timed = statistics is not None or runtimes is not None
+        d_time = r_time = None
+
+        # The operators are selected and seeded from a stream of their own,
+        # which the speculative mode draws ahead in. See
+        # ``_iterate_speculative``.
+        select_rnd_state = get_rng(draw_seed(self._rnd_state))
+
+        while iterations is None or iteration < iterations:
+            if stop is not None and stop(self._rnd_state, best, current):
+                return best, current, stop.reason
+
+            iteration += 1
+
+            if statistics is not None:
+                iteration_start = time.perf_counter()
+
+            d_idx, r_idx = scheme.select(select_rnd_state, best, current)
+            rnd_state = get_rng(draw_seed(select_rnd_state))
+
+            d_operator = self.destroy_operators[d_idx][1]
             r_name, r_operator = self.repair_operators[r_idx]
-            candidate = r_operator(destroyed, self._rnd_state)
 
-            best, current, weight_idx = self._consider_candidate(best,
-                                                                 current,
+            if timed:
+                d_start = time.perf_counter()
+
+            destroyed = d_operator(current, rnd_state)
+
+            if timed:
+                d_end = time.perf_counter()
+                d_time = d_end - d_start
+
+            if r_name in self._context_operators:
+                # Candidates above this objective are neither accepted nor a
+                # new best, so their repair may be aborted.
+                context = RepairContext(max(criterion.threshold(best, current),
+                                            best.objective()))
+
+                try:
+                    candidate = r_operator(destroyed, rnd_state, context)
+                except RepairAborted:
+                    candidate = None
+            else:
+                candidate = r_operator(destroyed, rnd_state)
+
+            if timed:
+                r_time = time.perf_counter() - d_end
+
+            best, current, _ = self._process_candidate(best, current,
+                                                       candidate, d_idx,
+                                                       r_idx, scheme,
+                                                       criterion, statistics,
+                                                       d_time, r_time,
+                                                       runtimes, sink)
+
+            if statistics is not None:
+                statistics.collect_iteration_time(time.perf_counter()
+                                                  - iteration_start)
+
+        return best, current, "MaxIterations"
+
+    def _iterate_speculative(self, pool, n_speculative, best, current, scheme,
+                             criterion, iterations, statistics, stop=None,
+                             runtimes=None, sink=None):
+        """
+        Internal helper that runs ALNS iterations like ``_iterate``, but
+        generates the candidates speculatively in the passed-in process pool.
+        See ``iterate`` for the parameters.
+
+        Returns
+        -------
+        State
+            The (possibly new) best state.
+        State
+            The (possibly new) current state.
+        str
+            The reason the run stopped.
+        """
+        iteration = 0
+        timed = statistics is not None or runtimes is not None
+        select_rnd_state = get_rng(draw_seed(self._rnd_state))
+
+        if statistics is not None:
+            iteration_start = time.perf_counter()
+
+        while iterations is None or iteration < iterations:
+            num_candidates = n_speculative
+
+            if iterations is not None:
+                num_candidates = min(n_speculative, iterations - iteration)
+
+            # Each candidate is selected as in a sequential run where the
+            # earlier candidates of this step are rejected, so a copy of the
+            # scheme learns of their rejection before the next is selected.
+            # The selection stream's state after every candidate is kept, to
+            # continue from when a candidate is not rejected after all.
+            lookahead = copy.deepcopy(scheme)
+            jobs = []
+
+            for _ in range(num_candidates):
+                d_idx, r_idx = lookahead.select(select_rnd_state, best,
+                                                current)
+                seed = draw_seed(select_rnd_state)
+
+                job = pool.submit(_generate_candidate, current, d_idx, r_idx,
+                                  seed, timed)
+                jobs.append((d_idx, r_idx, job,
+                             select_rnd_state.bit_generator.state))
+
+                if runtimes is None:
+                    lookahead.update(d_idx, r_idx, WeightIndex.IS_REJECTED)
+                else:
+                    d_runtimes, r_runtimes = runtimes
+                    lookahead.update(d_idx, r_idx, WeightIndex.IS_REJECTED,
+                                     d_runtimes.relative_cost(d_idx),
+                                     r_runtimes.relative_cost(r_idx))
+
+            try:
+                for d_idx, r_idx, job, select_state in jobs:
+                    if stop is not None and stop(self._rnd_state, best,
+                                                 current):
+                        return best, current, stop.reason
+
+                    iteration += 1
+
+                    # Operator times are measured in the worker process, and
+                    # an iteration takes as long as it took this one to become
+                    # available and be considered.
+                    candidate, d_time, r_time = job.result()
+
+                    best, current, weight_idx = self._process_candidate(
+                        best, current, candidate, d_idx, r_idx, scheme,
+                        criterion, statistics, d_time, r_time, runtimes, sink)
+
+                    if statistics is not None:
+                        iteration_end = time.perf_counter()
+                        statistics.collect_iteration_time(iteration_end
+                                                          - iteration_start)
+                        iteration_start = iteration_end
+
+                    if weight_idx != WeightIndex.IS_REJECTED:
+                        # The remaining candidates were selected assuming this
+                        # one is rejected, and generated from the previous
+                        # current solution, so these are discarded.
+                        select_rnd_state.bit_generator.state = select_state
+                        break
+            finally:
+                for _, _, job, _ in jobs:
+                    job.cancel()
+
+        return best, current, "MaxIterations"
+
+    def _process_candidate(self, best, current, candidate, d_idx, r_idx,
+                           scheme, criterion, statistics, d_time, r_time,
+                           runtimes=None, sink=None):
+        """
+        Internal helper that considers the candidate solution produced by the
+        destroy and repair operators at the given indices, and updates the
+        operator selection scheme, statistics and trace accordingly. The
+        operators took the passed-in times (in seconds) to produce the
+        candidate, which are None when neither statistics nor runtimes are
+        kept. The candidate is None when its repair was aborted, in which
+        case it is rejected.
+
+        Returns
+        -------
+        State
+            The (possibly new) best state.
+        State
+            The (possibly new) current state.
+        int
+            The weight index of the candidate's outcome.
+        """
+        d_name = self.destroy_operators[d_idx][0]
+        r_name = self.repair_operators[r_idx][0]
+
+        if candidate is None:
+            criterion.reject(self._rnd_state, best, current)
+            weight_idx = WeightIndex.IS_REJECTED
+        else:
+            if self._check_objectives:
+                self._check_objective(candidate, d_name, r_name)
+
+            best, current, weight_idx = self._consider_candidate(best, current,
                                                                  candidate,
-                                                                 criterion)
+                                                                 criterion,
+                                                                 statistics)
+
+        if runtimes is None:
+            scheme.update(d_idx, r_idx, weight_idx)
+        else:
+            d_runtimes, r_runtimes = runtimes
+
+            d_runtimes.update(d_idx, d_time)
+            r_runtimes.update(r_idx, r_time)
+
+            # Reward per unit of time, relative to the other operators, so
+            # that it remains on the same scale as the rewards.
+            scheme.update(d_idx, r_idx, weight_idx,
+                          d_runtimes.relative_cost(d_idx),
+                          r_runtimes.relative_cost(r_idx))
+
+        if statistics is not None:
+            statistics.collect_objective(current.objective())
+
+            statistics.collect_destroy_operator(d_name, weight_idx)
+            statistics.collect_repair_operator(r_name, weight_idx)
+            statistics.collect_operator_pair(d_name, r_name, weight_idx)
+
+            statistics.collect_destroy_operator_time(d_name, d_time)
+            statistics.collect_repair_operator_time(r_name, r_time)
+
+        if sink is not None:
+            sink.write(current.objective(), best.objective(), d_name, r_name,
+                       weight_idx)
+
+        return best, current, weight_idx
 
-            # The weights are updated as convex combinations of the current
-            # weight and the update parameter. See eq. (2), p. 12.
-            d_weights[d_idx] *= operator_decay
-            d_weights[d_idx] += (1 - operator_decay) * weights[weight_idx]
+    def _get_scheme(self, weights, operator_decay, scheme=None):
+        """
+        Internal helper that returns the operator selection scheme to use: the
+        passed-in scheme, or else a new roulette wheel.
 
-            r_weights[r_idx] *= operator_decay
-            r_weights[r_idx] += (1 - operator_decay) * weights[weight_idx]
+        Raises
+        ------
+        ValueError
+            When the passed-in scheme does not match the number of operators.
+        """
+        num_destroy = len(self.destroy_operators)
+        num_repair = len(self.repair_operators)
+
+        if scheme is None:
+            return RouletteWheel(weights, operator_decay, num_destroy,
+                                 num_repair)
 
-            if collect_stats:
-                statistics.collect_objective(current.objective())
+        if scheme.num_destroy != num_destroy \
+                or scheme.num_repair != num_repair:
+            raise ValueError("Scheme expects {0} destroy and {1} repair"
+                             " operators, found {2} and {3}."
+                             .format(scheme.num_destroy, scheme.num_repair,
+                                     num_destroy, num_repair))
 
-                statistics.collect_destroy_operator(d_name, weight_idx)
-                statistics.collect_repair_operator(r_name, weight_idx)
+        return scheme
 
-        return Result(best, statistics if collect_stats else None)
+    def _get_runtimes(self, decay):
+        """
+        Internal helper that returns new destroy and repair operator runtime
+        trackers, as a tuple, smoothing with the given decay parameter.
+        """
+        return (OperatorRuntimes(len(self.destroy_operators), decay),
+                OperatorRuntimes(len(self.repair_operators), decay))
 
     @staticmethod
     def _add_operator(operators, operator, name=None):
@@ -213,11 +768,16 @@ class ALNS(CallbackMixin):
         ----------
         operators : dict
             Dictionary of (name, operator) key-value pairs.
-        operator : Callable[[State, RandomState], State]
+        operator : Callable[[State, Generator], State]
             Callable operator function.
         name : str
             Optional operator name.
 
+        Returns
+        -------
+        str
+            The operator name.
+
         Warns
         -----
         OverwriteWarning
@@ -237,7 +797,36 @@ class ALNS(CallbackMixin):
 
         operators[name] = operator
 
-    def _consider_candidate(self, best, current, candidate, criterion):
+        return name
+
+    @staticmethod
+    def _check_objective(candidate, d_name, r_name):
+        """
+        Checks that the cached objective of the candidate state matches its
+        objective computed in full. States that are not cached are skipped.
+
+        Raises
+        ------
+        ObjectiveMismatchError
+            When the objectives differ.
+        """
+        if not isinstance(candidate, CachedState):
+            return
+
+        cached = candidate.objective()
+        computed = candidate.compute_objective()
+
+        if not np.isclose(cached, computed):
+            raise ObjectiveMismatchError("Cached objective {0} of the candidate"
+                                         " differs from its computed objective"
+                                         " {1}, after applying the `{2}' and"
+                                         " `{3}' operators.".format(cached,
+                                                                    computed,
+                                                                    d_name,
+                                                                    r_name))
+
+    def _consider_candidate(self, best, current, candidate, criterion,
+                            statistics=None):
         """
         Considers the candidate solution by comparing it against the best and
         current solutions. Returns the new solution when it is better or
@@ -254,6 +843,9 @@ class ALNS(CallbackMixin):
             Candidate solution.
         criterion : AcceptanceCriterion
             The chosen acceptance criterion.
+        statistics : Statistics
+            Optional statistics object, to collect the time spent in the
+            acceptance criterion and callback.
 
         Returns
         -------
@@ -264,7 +856,17 @@ class ALNS(CallbackMixin):
         int
             The weight index to use when updating the operator weights.
         """
-        if criterion.accept(self._rnd_state, best, current, candidate):
+        if statistics is None:
+            accepted = criterion.accept(self._rnd_state, best, current,
+                                        candidate)
+        else:
+            accept_start = time.perf_counter()
+            accepted = criterion.accept(self._rnd_state, best, current,
+                                        candidate)
+            statistics.collect_acceptance_time(time.perf_counter()
+                                               - accept_start)
+
+        if accepted:
             if candidate.objective() < current.objective():
                 weight = WeightIndex.IS_BETTER
             else:
@@ -279,7 +881,14 @@ class ALNS(CallbackMixin):
             # improve the solution.
             if self.has_callback(CallbackFlag.ON_BEST):
                 callback = self.callback(CallbackFlag.ON_BEST)
-                candidate = callback(candidate, self._rnd_state)
+
+                if statistics is None:
+                    candidate = callback(candidate, self._rnd_state)
+                else:
+                    callback_start = time.perf_counter()
+                    candidate = callback(candidate, self._rnd_state)
+                    statistics.collect_callback_time(time.perf_counter()
+                                                     - callback_start)
 
             # Global best solution becomes the new starting point for further
             # iterations.
@@ -289,6 +898,42 @@ class ALNS(CallbackMixin):
         # have (if the candidate was accepted).
         return best, current, weight
 
+    def _prepare_workers(self, n_workers, seeds, *copied):
+        """
+        Helper method that validates the worker arguments of the parallel
+        modes, and returns the seeds for the worker processes. The passed-in
+        objects (e.g. the criterion) are copied to every worker process along
+        with this ALNS instance, so these must be picklable.
+        """
+        if n_workers is not None and n_workers < 1:
+            raise ValueError("Expected at least one worker process.")
+
+        if seeds is None:
+            n_replicas = n_workers if n_workers is not None else os.cpu_count()
+            seeds = spawn(self._rnd_state, n_replicas)
+
+        if len(seeds) == 0:
+            raise ValueError("Expected at least one replica.")
+
+        self._check_picklable(*copied)
+
+        return seeds
+
+    def _check_picklable(self, *copied):
+        """
+        Helper method that checks this ALNS instance and the passed-in objects
+        can be pickled, to be copied to worker processes.
+        """
+        try:
+            # Every worker receives its own copy of the operators, callbacks
+            # and criterion by pickling. Checking this here gives a clear error
+            # instead of one raised from within the process pool.
+            pickle.dumps((self,) + copied)
+        except (pickle.PicklingError, AttributeError, TypeError) as error:
+            raise ValueError("The operators, callbacks and criteria must be"
+                             " picklable to run in worker processes. Consider"
+                             " defining them at module level.") from error
+
     def _validate_parameters(self, weights, operator_decay, iterations):
         """
         Helper method to validate the passed-in ALNS parameters.
@@ -309,5 +954,186 @@ class ALNS(CallbackMixin):
             raise ValueError("Unsupported number of weights: expected 4,"
                              " found {0}.".format(len(weights)))
 
-        if iterations < 0:
+        if iterations is not None and iterations < 0:
             raise ValueError("Negative number of iterations.")
+
+
+def _get_statistics(collect_stats):
+    """
+    Returns the statistics object to collect into, or None when statistics
+    should not be collected. See ``ALNS.iterate`` for ``collect_stats``.
+    """
+    if isinstance(collect_stats, Statistics):
+        return collect_stats
+
+    return Statistics() if collect_stats else None
+
+
+def _seed_worker(alns, seed):
+    """
+    Sets the random number generator of a worker process' copy of the ALNS
+    instance.
+    """
+    alns._rnd_state = get_rng(seed)
+
+    # Operators that draw from numpy's or Python's global generators would
+    # otherwise share the state inherited from the parent process.
+    np.random.seed(draw_seed(alns._rnd_state) % 2 ** 32)
+    random.seed(draw_seed(alns._rnd_state))
+
+
+# ALNS instance of a speculative worker process, set once when the process
+# starts rather than pickled along with every candidate.
+_speculative_alns = None
+
+
+def _init_speculative_worker(alns, initializer=None, initargs=()):
+    """
+    Initialises a worker process of ``ALNS.iterate`` with speculation, and
+    runs the user's initializer, if any.
+    """
+    global _speculative_alns
+    _speculative_alns = alns
+
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _generate_candidate(current, d_idx, r_idx, seed, timed):
+    """
+    Generates a speculative candidate from the current solution, in a worker
+    process, by applying the destroy and repair operators at the given
+    indices. The operators are passed a generator seeded with the given seed,
+    as in a sequential iteration. The candidate's objective is evaluated here
+    as well, so that a cached objective is computed in parallel. Returns the
+    candidate, and the time spent in the destroy and repair operators, which
+    are None when not timed.
+    """
+    alns = _speculative_alns
+    rnd_state = get_rng(seed)
+
+    # Operators that draw from numpy's or Python's global generators would
+    # otherwise share the state inherited from the parent process.
+    np.random.seed(seed % 2 ** 32)
+    random.seed(seed)
+
+    d_time = r_time = None
+
+    if timed:
+        start = time.perf_counter()
+
+    destroyed = alns.destroy_operators[d_idx][1](current, rnd_state)
+
+    if timed:
+        d_end = time.perf_counter()
+        d_time = d_end - start
+
+    r_name, r_operator = alns.repair_operators[r_idx]
+
+    if r_name in alns._context_operators:
+        # The criterion's threshold may change before the candidate is
+        # considered, so there is no context to abort on.
+        candidate = r_operator(destroyed, rnd_state, None)
+    else:
+        candidate = r_operator(destroyed, rnd_state)
+
+    if timed:
+        r_time = time.perf_counter() - d_end
+
+    candidate.objective()
+
+    return candidate, d_time, r_time
+
+
+def _iterate_replica(alns, seed, initial_solution, weights, operator_decay,
+                     criterion, iterations, collect_stats, stop,
+                     runtime_aware):
+    """
+    Runs a single replica of ``ALNS.iterate_multistart``, in a worker process.
+    The ALNS instance and criterion are the worker's own (unpickled) copies.
+    """
+    _seed_worker(alns, seed)
+
+    return alns.iterate(initial_solution, weights, operator_decay, criterion,
+                        iterations, collect_stats, stop,
+                        runtime_aware=runtime_aware)
+
+
+def _iterate_island(alns, seed, island, inboxes, initial_solution, weights,
+                    operator_decay, criterion, iterations, collect_stats,
+                    migration_interval, topology, share_weights,
+                    runtime_aware):
+    """
+    Runs a single island of ``ALNS.iterate_islands``, in a worker process.
+    Migration is synchronous: after every interval, an island sends its best
+    solution (and weights) to its neighbours, and waits for those sent to it.
+    """
+    _seed_worker(alns, seed)
+
+    start = time.perf_counter()
+
+    try:
+        num_islands = len(inboxes)
+
+        if topology == "ring":
+            neighbours = [(island + 1) % num_islands]
+            num_migrants = 1
+        else:
+            neighbours = [idx for idx in range(num_islands) if idx != island]
+            num_migrants = num_islands - 1
+
+        current = best = initial_solution
+
+        scheme = alns._get_scheme(weights, operator_decay)
+        runtimes = None
+
+        if runtime_aware:
+            runtimes = alns._get_runtimes(operator_decay)
+
+        statistics = _get_statistics(collect_stats)
+
+        if statistics is not None:
+            statistics.collect_objective(initial_solution.objective())
+
+        for done in range(0, iterations, migration_interval):
+            num_iterations = min(migration_interval, iterations - done)
+
+            best, current, _ = alns._iterate(best, current, scheme,
+                                             criterion, num_iterations,
+                                             statistics, runtimes=runtimes)
+
+            if done + num_iterations == iterations or num_islands == 1:
+                break
+
+            for neighbour in neighbours:
+                inboxes[neighbour].put((island, best, scheme.destroy_weights,
+                                        scheme.repair_weights))
+
+            # Migrants are handled in island order, so that the outcome does
+            # not depend on the order in which they arrived.
+            migrants = sorted((inboxes[island].get()
+                               for _ in range(num_migrants)),
+                              key=lambda migrant: migrant[0])
+
+            for sender, migrant, *_ in migrants:
+                if migrant is None:
+                    raise RuntimeError("Island {0} failed.".format(sender))
+
+                if migrant.objective() < best.objective():
+                    best = current = migrant
+
+            if share_weights:
+                scheme.set_weights(np.mean([scheme.destroy_weights]
+                                           + [m[2] for m in migrants], axis=0),
+                                   np.mean([scheme.repair_weights]
+                                           + [m[3] for m in migrants], axis=0))
+    except Exception:
+        # Other islands may be waiting for this one, so we tell them it failed
+        # rather than leaving them blocked at the next migration.
+        for inbox in inboxes:
+            inbox.put((island, None, None, None))
+
+        raise
+
+    runtime = time.perf_counter() - start
+    return Result(best, statistics, "MaxIterations", runtime)
@@ -0,0 +1,69 @@
+from abc import abstractmethod
+
+from .State import State
+
+
+class CachedState(State):
+    """
+    State object that caches its objective value. The objective is computed
+    via the ``compute_objective()`` member the first time ``objective()`` is
+    called, and returned from the cache thereafter. This is useful when the
+    objective is expensive to evaluate, as ALNS and the acceptance criteria
+    ask for the objective of the same state several times per iteration.
+
+    Subclasses should call ``invalidate()`` whenever the state changes in a
+    way that affects its objective value. When the exact change in objective
+    value is known, ``update_objective()`` keeps the cached value up-to-date
+    instead, so that it need not be recomputed from scratch.
+    """
+
+    _cached_objective = None
+
+    def objective(self):
+        """
+        Returns the state's objective value, computing it only when the cached
+        value has been invalidated.
+
+        Returns
+        -------
+        float
+            Some numeric value, e.g. an ``int`` or ``float``.
+        """
+        if self._cached_objective is None:
+            self._cached_objective = self.compute_objective()
+
+        return self._cached_objective
+
+    def invalidate(self):
+        """
+        Clears the cached objective value, such that it is recomputed the next
+        time ``objective()`` is called.
+        """
+        self._cached_objective = None
+
+    def update_objective(self, delta):
+        """
+        Shifts the cached objective value by the passed-in delta. This should
+        be called with the exact change in objective value whenever the state
+        changes. When no value is cached, nothing happens: the objective is
+        then computed in full the next time it is asked for.
+
+        Parameters
+        ----------
+        delta : float
+            The change in objective value.
+        """
+        if self._cached_objective is not None:
+            self._cached_objective += delta
+
+    @abstractmethod
+    def compute_objective(self):
+        """
+        Computes the state's associated objective value.
+
+        Returns
+        -------
+        float
+            Some numeric value, e.g. an ``int`` or ``float``.
+        """
+        return NotImplemented
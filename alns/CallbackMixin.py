@@ -22,7 +22,7 @@ class CallbackMixin:
         ----------
         func : callable
             A function that should take a solution State as its first parameter,
-            and a numpy RandomState as its second (cf. the operator signature).
+            and a numpy Generator as its second (cf. the operator signature).
             It should return a (new) solution State.
 
         Warns
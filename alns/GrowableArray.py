@@ -0,0 +1,72 @@
+import numpy as np
+
+
+class GrowableArray:
+
+    def __init__(self, dtype=np.float64, capacity=1024):
+        """
+        One-dimensional, append-only array, backed by a preallocated NumPy
+        buffer that doubles in size when full. Appending takes amortised O(1)
+        time, and values are stored unboxed, unlike in a list of floats.
+
+        Parameters
+        ----------
+        dtype : data-type
+            The type of the stored values. Default float64.
+        capacity : int
+            The initial capacity of the buffer. Default 1024.
+        """
+        if capacity < 1:
+            raise ValueError("Expected a capacity of at least one.")
+
+        self._buffer = np.empty(capacity, dtype=dtype)
+        self._size = 0
+
+    @property
+    def values(self):
+        """
+        Returns the stored values, as a read-only view into the buffer. This
+        takes O(1) time, as nothing is copied. The view remains valid, but
+        does not show values appended after it was taken.
+
+        Returns
+        -------
+        np.ndarray
+            The stored values.
+        """
+        view = self._buffer[:self._size]
+        view.flags.writeable = False
+        return view
+
+    def __len__(self):
+        return self._size
+
+    def append(self, value):
+        """
+        Appends a value, growing the buffer when it is full.
+
+        Parameters
+        ----------
+        value : scalar
+            The value to append.
+        """
+        if self._size == len(self._buffer):
+            # Growing allocates a new buffer, so views taken earlier keep
+            # pointing into the old one.
+            grown = np.empty(2 * len(self._buffer), dtype=self._buffer.dtype)
+            grown[:self._size] = self._buffer
+            self._buffer = grown
+
+        self._buffer[self._size] = value
+        self._size += 1
+
+    def __getstate__(self):
+        # Only the stored values are pickled, not the unused capacity.
+        return dict(values=self._buffer[:self._size].copy())
+
+    def __setstate__(self, state):
+        values = state["values"]
+
+        self._buffer = np.empty(max(len(values), 1), dtype=values.dtype)
+        self._buffer[:len(values)] = values
+        self._size = len(values)
@@ -0,0 +1,95 @@
+import numpy as np
+
+# Runtimes are clamped at this many seconds, about the resolution at which a
+# Python call can be timed. Shorter runtimes are mostly timer noise, and would
+# otherwise give tiny, erratic relative costs.
+MIN_RUNTIME = 1e-6
+
+
+class OperatorRuntimes:
+
+    def __init__(self, num_operators, decay):
+        """
+        Keeps track of the smoothed runtime of each operator, as an
+        exponential moving average of the measured wall-clock times. This is
+        used to scale operator rewards by their cost, so that the adaptive
+        weights reflect the reward per unit of time.
+
+        Parameters
+        ----------
+        num_operators : int
+            The number of operators.
+        decay : float
+            The decay parameter of the moving average, in the unit interval
+            [0, 1]. Larger values smooth more strongly.
+        """
+        if not (0 <= decay <= 1):
+            raise ValueError("Runtime decay parameter outside unit interval"
+                             " is not understood.")
+
+        # Plain lists, as these are updated every iteration, and there are
+        # few operators: numpy's per-call overhead would dominate.
+        self._runtimes = [None] * num_operators
+        self._decay = decay
+
+    @property
+    def runtimes(self):
+        """
+        Returns the smoothed runtime of each operator, in seconds. This is NaN
+        for operators that have not yet been measured.
+
+        Returns
+        -------
+        np.ndarray
+            The smoothed operator runtimes.
+        """
+        return np.array([np.nan if runtime is None else runtime
+                         for runtime in self._runtimes])
+
+    def update(self, idx, seconds):
+        """
+        Updates the smoothed runtime of an operator with a new measurement.
+
+        Parameters
+        ----------
+        idx : int
+            Index of the operator.
+        seconds : float
+            The measured runtime, in seconds.
+        """
+        if self._runtimes[idx] is None:
+            self._runtimes[idx] = seconds
+        else:
+            self._runtimes[idx] = (self._decay * self._runtimes[idx]
+                                   + (1 - self._decay) * seconds)
+
+    def relative_cost(self, idx):
+        """
+        Returns the smoothed runtime of an operator, relative to the mean
+        smoothed runtime of all measured operators. Dividing a reward by this
+        relative cost gives a reward per unit of time, on the same scale as
+        the reward itself.
+
+        Parameters
+        ----------
+        idx : int
+            Index of the operator.
+
+        Both the runtime and the mean are clamped at ``MIN_RUNTIME``, so that
+        the relative cost of very fast operators is bounded, and changes
+        smoothly with their runtime.
+
+        Returns
+        -------
+        float
+            The relative cost, or 1 when the operator has not been measured.
+        """
+        runtime = self._runtimes[idx]
+
+        if runtime is None:
+            return 1.
+
+        measured = [other for other in self._runtimes if other is not None]
+        mean = sum(measured) / len(measured)
+
+        return max(runtime, MIN_RUNTIME) / max(mean, MIN_RUNTIME)
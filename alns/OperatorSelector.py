@@ -0,0 +1,161 @@
+import numpy as np
+
+# Number of incremental weight updates after which the running sums are
+# recomputed from scratch, to bound the accumulated rounding error.
+_REBUILD_INTERVAL = 1024
+
+
+class OperatorSelector:
+
+    def __init__(self, weights):
+        """
+        Selects operators with probability proportional to their weights. The
+        weights are kept in a Fenwick (binary indexed) tree of running sums, so
+        that both drawing an operator and updating a single weight take
+        O(log n) time, rather than the O(n) needed to normalise the weights
+        on every draw.
+
+        Parameters
+        ----------
+        weights : array_like
+            The initial, non-negative operator weights.
+        """
+        self._weights = [float(weight) for weight in weights]
+
+        if len(self._weights) == 0:
+            raise ValueError("Cannot select from an empty set of operators.")
+
+        self._build()
+
+    @property
+    def weights(self):
+        """
+        Returns the current operator weights, as a float64 array. Changing
+        this array does not change the selector's weights; see ``update`` and
+        ``set_weights`` for that.
+
+        Returns
+        -------
+        np.ndarray
+            The operator weights.
+        """
+        return np.array(self._weights, dtype=np.float64)
+
+    @property
+    def total(self):
+        """
+        Returns the sum of all operator weights.
+
+        Returns
+        -------
+        float
+            The total weight.
+        """
+        return self._total
+
+    def __len__(self):
+        return len(self._weights)
+
+    def __getitem__(self, idx):
+        return self._weights[idx]
+
+    def select(self, rnd_state):
+        """
+        Selects an operator, with probability proportional to its weight.
+
+        Parameters
+        ----------
+        rnd_state : Generator
+            Random number generator to draw the choice from.
+
+        Returns
+        -------
+        int
+            Index of the selected operator.
+        """
+        remainder = rnd_state.random() * self._total
+
+        # Descends the tree to find the largest prefix of operators whose
+        # weights sum to at most the drawn value: the next operator is the
+        # selected one. For a legacy RandomState, this matches the choices of
+        # ``rnd_state.choice`` with weights ``p``.
+        pos = 0
+        step = self._step
+
+        while step:
+            nxt = pos + step
+
+            if nxt < len(self._tree) and self._tree[nxt] <= remainder:
+                pos = nxt
+                remainder -= self._tree[nxt]
+
+            step >>= 1
+
+        # Rounding may leave a remainder just over the total weight.
+        return min(pos, len(self._weights) - 1)
+
+    def update(self, idx, weight):
+        """
+        Sets the weight of a single operator.
+
+        Parameters
+        ----------
+        idx : int
+            Index of the operator.
+        weight : float
+            The new, non-negative weight.
+        """
+        weight = float(weight)
+
+        delta = weight - self._weights[idx]
+        self._weights[idx] = weight
+        self._total += delta
+
+        self._num_updates += 1
+
+        # Incremental updates accumulate rounding errors in the running sums,
+        # so these are recomputed from the weights every so often.
+        if self._num_updates >= _REBUILD_INTERVAL:
+            self._build()
+            return
+
+        pos = idx + 1
+
+        while pos < len(self._tree):
+            self._tree[pos] += delta
+            pos += pos & -pos
+
+    def set_weights(self, weights):
+        """
+        Sets the weights of all operators at once.
+
+        Parameters
+        ----------
+        weights : array_like
+            The new, non-negative operator weights.
+        """
+        if len(weights) != len(self._weights):
+            raise ValueError("Expected {0} weights, found {1}."
+                             .format(len(self._weights), len(weights)))
+
+        self._weights = [float(weight) for weight in weights]
+        self._build()
+
+    def _build(self):
+        """
+        (Re)builds the tree of running sums from the operator weights, in
+        O(n) time.
+        """
+        num_weights = len(self._weights)
+
+        self._tree = [0.] + self._weights
+        self._total = sum(self._weights)
+        self._num_updates = 0
+
+        for pos in range(1, num_weights + 1):
+            parent = pos + (pos & -pos)
+
+            if parent <= num_weights:
+                self._tree[parent] += self._tree[pos]
+
+        self._step = 1 << (num_weights.bit_length() - 1)
@@ -0,0 +1,39 @@
+class RepairContext:
+
+    def __init__(self, threshold):
+        """
+        Context passed to repair operators that were added with
+        ``context=True``. It holds the objective value above which the
+        candidate is certainly not accepted, nor a new best: the larger of the
+        acceptance criterion's threshold and the best objective. A repair
+        operator that can bound the objective of its candidate from below may
+        thus abort as soon as that bound exceeds the threshold, by raising
+        ``RepairAborted``. Aborted candidates count as rejected.
+
+        Parameters
+        ----------
+        threshold : float
+            The objective value above which candidates are rejected.
+        """
+        self._threshold = threshold
+
+    @property
+    def threshold(self):
+        return self._threshold
+
+    def should_abort(self, bound):
+        """
+        Determines whether a candidate with the given lower bound on its
+        objective value is certainly rejected.
+
+        Parameters
+        ----------
+        bound : float
+            Lower bound on the objective value of the repaired candidate.
+
+        Returns
+        -------
+        bool
+            Whether the candidate is certainly rejected.
+        """
+        return bound > self._threshold
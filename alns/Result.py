@@ -5,11 +5,13 @@ from matplotlib.pyplot import Axes, Figure  # pylint: disable=unused-import
 from .State import State  # pylint: disable=unused-import
 from .Statistics import Statistics  # pylint: disable=unused-import
 from .exceptions_warnings import NotCollectedError
+from .sink import TraceSink  # pylint: disable=unused-import
 
 
 class Result:
 
-    def __init__(self, best, statistics=None):
+    def __init__(self, best, statistics=None, stop_reason=None,
+                 runtime=None, sink=None):
         """
         Stores ALNS results. An instance of this class is returned once the
         algorithm completes.
@@ -20,9 +22,20 @@ class Result:
             The best state observed during the entire iteration.
         statistics : Statistics
             Statistics optionally collected during iteration.
+        stop_reason : str
+            Optional description of why the run stopped.
+        runtime : float
+            Optional wall-clock runtime of the run, in seconds.
+        sink : TraceSink
+            Optional sink the trace of the run was streamed to. The trace is
+            only loaded from disk when first accessed.
         """
         self._best = best
         self._statistics = statistics
+        self._stop_reason = stop_reason
+        self._runtime = runtime
+        self._sink = sink
+        self._trace = None
 
     @property
     def best_state(self):
@@ -36,6 +49,32 @@ class Result:
         """
         return self._best
 
+    @property
+    def stop_reason(self):
+        """
+        Why the run stopped: ``'MaxIterations'`` when the maximum number of
+        iterations was reached, or else the reason given by the stopping
+        criterion (by default, its class name).
+
+        Returns
+        -------
+        str
+            The stopping reason, or None when not set.
+        """
+        return self._stop_reason
+
+    @property
+    def runtime(self):
+        """
+        The wall-clock runtime of the run, in seconds.
+
+        Returns
+        -------
+        float
+            The runtime, or None when not set.
+        """
+        return self._runtime
+
     @property
     def statistics(self):
         """
@@ -58,9 +97,38 @@ class Result:
 
         return self._statistics
 
+    @property
+    def trace(self):
+        """
+        The per-iteration trace streamed to the sink during iteration. It is
+        loaded from disk on first access, and kept thereafter.
+
+        Raises
+        ------
+        NotCollectedError
+            When the trace was not streamed to a sink during iteration.
+
+        Returns
+        -------
+        dict
+            Maps each field name to a NumPy array of its values. See
+            ``alns.sink.TraceSink.FIELDS`` for the field names.
+        """
+        if self._sink is None:
+            raise NotCollectedError("No trace was streamed to a sink during "
+                                    "iteration.")
+
+        if self._trace is None:
+            self._trace = self._sink.load()
+
+        return self._trace
+
     def plot_objectives(self, ax=None, title=None, **kwargs):
         """
-        Plots the collected objective values at each iteration.
+        Plots the collected objective values at each iteration. When the
+        objective values were decimated, only the stored values are plotted,
+        at the iterations they were collected at. When statistics were not
+        collected, the objective values are loaded from the trace instead.
 
         Parameters
         ----------
@@ -78,10 +146,21 @@ class Result:
         if title is None:
             title = "Objective value at each iteration"
 
-        # First call is current solution objectives (at each iteration), second
-        # call is the best solution found so far (as a running minimum).
-        ax.plot(self.statistics.objectives, **kwargs)
-        ax.plot(np.minimum.accumulate(self.statistics.objectives), **kwargs)
+        # The current solution objectives (at each iteration), and the best
+        # solution found so far. The statistics do not store the latter, but
+        # its running minimum is exact even when decimating, as improvements
+        # are always stored.
+        if self._statistics is None and self._sink is not None:
+            iterations = self.trace["iteration"]
+            objectives = self.trace["current"]
+            best = self.trace["best"]
+        else:
+            iterations = self.statistics.objective_iterations
+            objectives = self.statistics.objectives
+            best = np.minimum.accumulate(objectives)
+
+        ax.plot(iterations, objectives, **kwargs)
+        ax.plot(iterations, best, **kwargs)
 
         ax.set_title(title)
         ax.set_ylabel("Objective value")
@@ -156,6 +235,69 @@ class Result:
 
         plt.draw_if_interactive()
 
+    def plot_operator_timings(self, figure=None, title=None, **kwargs):
+        """
+        Plots an overview of the time spent in the destroy and repair
+        operators. For each operator, the bar shows the total time spent in
+        the operator, and is annotated with its mean time per call.
+
+        Parameters
+        ----------
+        figure : Figure
+            Optional figure. If not passed, a new figure is constructed, and
+            some default margins are set.
+        title : str
+            Optional figure title. When not passed, no title is set.
+        kwargs : dict
+            Optional arguments passed to each call of ``ax.barh``.
+        """
+        if figure is None:
+            figure, (d_ax, r_ax) = plt.subplots(nrows=2)
+
+            # Ensures there is generally sufficient white space between the
+            # operator subplots. When a figure is passed-in, these sorts of
+            # modifications are assumed to have been performed at the call
+            # site.
+            figure.subplots_adjust(hspace=0.7)
+        else:
+            d_ax, r_ax = figure.subplots(nrows=2)
+
+        if title is not None:
+            figure.suptitle(title)
+
+        self._plot_operator_timings(d_ax,
+                                    self.statistics.destroy_operator_times,
+                                    "Destroy operators",
+                                    **kwargs)
+
+        self._plot_operator_timings(r_ax,
+                                    self.statistics.repair_operator_times,
+                                    "Repair operators",
+                                    **kwargs)
+
+        plt.draw_if_interactive()
+
+    @staticmethod
+    def _plot_operator_timings(ax, operator_times, title, **kwargs):
+        """
+        Internal helper that plots the passed-in operator_times on the given
+        ax object.
+        """
+        operator_names = list(operator_times.keys())
+
+        totals = np.array([times.sum() for times in operator_times.values()])
+        means = np.array([times.mean() for times in operator_times.values()])
+
+        ax.barh(operator_names, totals, height=0.5, **kwargs)
+
+        for y, (x, mean) in enumerate(zip(totals / 2, means)):
+            ax.text(x, y, "{0:.3g} ms/call".format(1000 * mean),
+                    ha='center', va='center')
+
+        ax.set_title(title)
+        ax.set_xlabel("Total time spent in operator (s)")
+        ax.set_ylabel("Operator")
+
     @staticmethod
     def _plot_operator_counts(ax, operator_counts, title, num_types, **kwargs):
         """
@@ -2,25 +2,106 @@ from collections import defaultdict
 
 import numpy as np
 
+from .GrowableArray import GrowableArray
+
+
+def _outcome_counts():
+    """
+    Factory for the operator count lists. A named function is used rather
+    than a lambda so that statistics can be pickled, e.g. to return them from
+    worker processes.
+    """
+    return [0, 0, 0, 0]
+
 
 class Statistics:
 
-    def __init__(self):
+    def __init__(self, decimation=1):
         """
         Statistics object that stores some iteration results, which is
-        optionally populated by the ALNS algorithm.
+        optionally populated by the ALNS algorithm. Results are stored in
+        growable NumPy buffers, and returned as read-only views.
+
+        Parameters
+        ----------
+        decimation : int
+            Stores only every ``decimation``-th collected objective value, to
+            bound memory use in long runs. Objective values that improve upon
+            the best value collected so far are always stored, so the best
+            objective over time is exact. Default 1, which stores all of them.
         """
-        self._objectives = []
+        if decimation < 1:
+            raise ValueError("Expected a decimation of at least one.")
+
+        self._decimation = decimation
+        self._num_objectives = 0
+        self._best_objective = np.inf
+
+        self._objectives = GrowableArray()
+
+        # Only needed when decimating: else, these are just 0, 1, 2, ...
+        self._objective_iterations = GrowableArray(np.int64)
+
+        self._destroy_operator_counts = defaultdict(_outcome_counts)
+        self._repair_operator_counts = defaultdict(_outcome_counts)
+        self._operator_pair_counts = defaultdict(_outcome_counts)
 
-        self._destroy_operator_counts = defaultdict(lambda: [0, 0, 0, 0])
-        self._repair_operator_counts = defaultdict(lambda: [0, 0, 0, 0])
+        self._destroy_operator_times = defaultdict(GrowableArray)
+        self._repair_operator_times = defaultdict(GrowableArray)
+        self._acceptance_times = GrowableArray()
+        self._callback_times = GrowableArray()
+        self._iteration_times = GrowableArray()
+
+    @property
+    def decimation(self):
+        """
+        Returns the decimation: only every so many objective values are
+        stored, along with those that improve upon the best so far.
+
+        Returns
+        -------
+        int
+            The decimation.
+        """
+        return self._decimation
 
     @property
     def objectives(self):
         """
-        Returns an array of previous objective values, tracking progress.
+        Returns an array of previous objective values, tracking progress. This
+        is a read-only view, so it takes O(1) time. When decimating, see
+        ``objective_iterations`` for the iterations these were collected at.
+        """
+        return self._objectives.values
+
+    @property
+    def objective_iterations(self):
+        """
+        Returns the iterations at which the stored objective values were
+        collected, counting from zero for the first collected value.
+
+        Returns
+        -------
+        np.ndarray
+            The iteration of each stored objective value.
         """
-        return np.array(self._objectives)
+        if self._decimation == 1:
+            return np.arange(len(self._objectives))
+
+        return self._objective_iterations.values
+
+    @property
+    def num_objectives(self):
+        """
+        Returns the number of collected objective values, including those
+        that were not stored due to decimation.
+
+        Returns
+        -------
+        int
+            The number of collected objective values.
+        """
+        return self._num_objectives
 
     @property
     def destroy_operator_counts(self):
@@ -52,16 +133,189 @@ class Statistics:
         """
         return self._repair_operator_counts
 
+    @property
+    def operator_pair_counts(self):
+        """
+        Returns the counts of destroy and repair operator pairs, as a
+        dictionary of (destroy name, repair name) tuples to lists of counts.
+        Such a list counts the number of times that applying the pair resulted
+        in each outcome, like ``destroy_operator_counts``.
+
+        Returns
+        -------
+        defaultdict
+            Operator pair counts.
+        """
+        return self._operator_pair_counts
+
+    @property
+    def destroy_operator_times(self):
+        """
+        Returns the wall-clock time spent in each call of the destroy
+        operators, as a dictionary of operator names to arrays of times, in
+        seconds.
+
+        Returns
+        -------
+        dict
+            Destroy operator times.
+        """
+        return {name: times.values
+                for name, times in self._destroy_operator_times.items()}
+
+    @property
+    def repair_operator_times(self):
+        """
+        Returns the wall-clock time spent in each call of the repair
+        operators, as a dictionary of operator names to arrays of times, in
+        seconds.
+
+        Returns
+        -------
+        dict
+            Repair operator times.
+        """
+        return {name: times.values
+                for name, times in self._repair_operator_times.items()}
+
+    @property
+    def acceptance_times(self):
+        """
+        Returns the wall-clock time spent in each call of the acceptance
+        criterion, in seconds.
+
+        Returns
+        -------
+        np.ndarray
+            Acceptance criterion times.
+        """
+        return self._acceptance_times.values
+
+    @property
+    def callback_times(self):
+        """
+        Returns the wall-clock time spent in each call of the ON_BEST callback,
+        in seconds.
+
+        Returns
+        -------
+        np.ndarray
+            Callback times.
+        """
+        return self._callback_times.values
+
+    @property
+    def iteration_times(self):
+        """
+        Returns the wall-clock time of each iteration, in seconds.
+
+        Returns
+        -------
+        np.ndarray
+            Iteration times.
+        """
+        return self._iteration_times.values
+
+    def iterations_per_second(self, window=100):
+        """
+        Returns the number of iterations per second, as a moving average over
+        the given number of iterations. The first value is the average over
+        the first ``window`` iterations, the next over the window shifted by
+        one iteration, and so on.
+
+        Parameters
+        ----------
+        window : int
+            Number of iterations to average over. Default 100. When fewer
+            iterations were collected, the average is over all of them.
+
+        Raises
+        ------
+        ValueError
+            When the window is smaller than one iteration.
+
+        Returns
+        -------
+        np.ndarray
+            Iterations per second, one value for each window position.
+        """
+        if window < 1:
+            raise ValueError("Expected a window of at least one iteration.")
+
+        times = self.iteration_times
+
+        if len(times) == 0:
+            return times
+
+        window = min(window, len(times))
+
+        cumulative = np.concatenate(([0.], np.cumsum(times)))
+        return window / (cumulative[window:] - cumulative[:-window])
+
+    def timing_summary(self, percentiles=(50, 90, 99)):
+        """
+        Summarises the collected wall-clock times, for each destroy and repair
+        operator, the acceptance criterion, and the ON_BEST callback. Each
+        summary is a dictionary with the number of calls (``'calls'``), the
+        total and mean time per call in seconds (``'total'``, ``'mean'``), and
+        the requested percentiles of the time per call (``'percentiles'``).
+
+        Parameters
+        ----------
+        percentiles : array_like
+            Percentiles of the time per call to compute, in [0, 100]. Default
+            the median, 90th and 99th percentiles.
+
+        Returns
+        -------
+        dict
+            Dictionary with keys ``'destroy'`` and ``'repair'``, each mapping
+            operator names to their summaries, and keys ``'acceptance'`` and
+            ``'on_best'``, mapping to their summaries.
+        """
+        def summarise(times):
+            times = times.values
+
+            if len(times) == 0:
+                return dict(calls=0, total=0., mean=np.nan,
+                            percentiles=np.full(len(percentiles), np.nan))
+
+            return dict(calls=len(times),
+                        total=times.sum(),
+                        mean=times.mean(),
+                        percentiles=np.percentile(times, percentiles))
+
+        return dict(destroy={name: summarise(times) for name, times
+                             in self._destroy_operator_times.items()},
+                    repair={name: summarise(times) for name, times
+                            in self._repair_operator_times.items()},
+                    acceptance=summarise(self._acceptance_times),
+                    on_best=summarise(self._callback_times))
+
     def collect_objective(self, objective):
         """
-        Collects an objective value.
+        Collects an objective value. When decimating, it is only stored if it
+        is the ``decimation``-th value since the last stored one, or improves
+        upon the best value collected so far.
 
         Parameters
         ----------
         objective : float
             The objective value to be collected.
         """
-        self._objectives.append(objective)
+        iteration = self._num_objectives
+        self._num_objectives += 1
+
+        is_best = objective < self._best_objective
+
+        if is_best:
+            self._best_objective = objective
+
+        if self._decimation == 1:
+            self._objectives.append(objective)
+        elif is_best or iteration % self._decimation == 0:
+            self._objectives.append(objective)
+            self._objective_iterations.append(iteration)
 
     def collect_destroy_operator(self, operator_name, weight_idx):
         """
@@ -96,3 +350,83 @@ class Statistics:
             the `WeightIndex` enum.
         """
         self._repair_operator_counts[operator_name][weight_idx] += 1
+
+    def collect_operator_pair(self, d_name, r_name, weight_idx):
+        """
+        Collects a weight (index) for a used pair of destroy and repair
+        operators. This maintains count of the number of times this pair was
+        used, and what result came from its use.
+
+        Parameters
+        ----------
+        d_name : str
+            Destroy operator name.
+        r_name : str
+            Repair operator name.
+        weight_idx : int
+            Weight indices used for the various iteration outcomes. See also
+            the `WeightIndex` enum.
+        """
+        self._operator_pair_counts[d_name, r_name][weight_idx] += 1
+
+    def collect_destroy_operator_time(self, operator_name, seconds):
+        """
+        Collects the wall-clock time of a single call of a destroy operator.
+
+        Parameters
+        ----------
+        operator_name : str
+            Operator name. This was set when the operator was passed to the
+            ALNS instance.
+        seconds : float
+            Time spent in the operator, in seconds.
+        """
+        self._destroy_operator_times[operator_name].append(seconds)
+
+    def collect_repair_operator_time(self, operator_name, seconds):
+        """
+        Collects the wall-clock time of a single call of a repair operator.
+
+        Parameters
+        ----------
+        operator_name : str
+            Operator name. This was set when the operator was passed to the
+            ALNS instance.
+        seconds : float
+            Time spent in the operator, in seconds.
+        """
+        self._repair_operator_times[operator_name].append(seconds)
+
+    def collect_acceptance_time(self, seconds):
+        """
+        Collects the wall-clock time of a single call of the acceptance
+        criterion.
+
+        Parameters
+        ----------
+        seconds : float
+            Time spent in the acceptance criterion, in seconds.
+        """
+        self._acceptance_times.append(seconds)
+
+    def collect_callback_time(self, seconds):
+        """
+        Collects the wall-clock time of a single call of the ON_BEST callback.
+
+        Parameters
+        ----------
+        seconds : float
+            Time spent in the callback, in seconds.
+        """
+        self._callback_times.append(seconds)
+
+    def collect_iteration_time(self, seconds):
+        """
+        Collects the wall-clock time of a single iteration.
+
+        Parameters
+        ----------
+        seconds : float
+            Time the iteration took, in seconds.
+        """
+        self._iteration_times.append(seconds)
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 from ..State import State  # pylint: disable=unused-import
-from numpy.random import RandomState  # pylint: disable=unused-import
+from numpy.random import Generator  # pylint: disable=unused-import
 
 
 class AcceptanceCriterion(ABC):
@@ -17,7 +19,7 @@ class AcceptanceCriterion(ABC):
 
         Parameters
         ----------
-        rnd : RandomState
+        rnd : Generator
             May be used to draw random numbers from.
         best : State
             The best solution state observed so far.
@@ -32,3 +34,43 @@ class AcceptanceCriterion(ABC):
             Whether to accept the candidate state (True), or not (False).
         """
         return NotImplemented
+
+    def threshold(self, best, current):
+        """
+        Returns an objective value above which this criterion certainly
+        rejects a candidate, given the best and current solution states. This
+        lets repair operators abort candidates that are certainly rejected.
+        The default is infinite, for criteria that may accept any candidate.
+
+        Parameters
+        ----------
+        best : State
+            The best solution state observed so far.
+        current : State
+            The current solution state.
+
+        Returns
+        -------
+        float
+            The objective value above which candidates are rejected.
+        """
+        return np.inf
+
+    def reject(self, rnd, best, current):
+        """
+        Updates this criterion for a candidate that was aborted, because its
+        objective was certainly above the threshold. The candidate is then
+        rejected without a call to ``accept``. Criteria whose state changes
+        with every call to ``accept`` should update it here as well. The
+        default does nothing.
+
+        Parameters
+        ----------
+        rnd : Generator
+            May be used to draw random numbers from.
+        best : State
+            The best solution state observed so far.
+        current : State
+            The current solution state.
+        """
+        pass
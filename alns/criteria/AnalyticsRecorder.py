@@ -0,0 +1,199 @@
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.pyplot import Axes  # pylint: disable=unused-import
+
+from ..GrowableArray import GrowableArray
+
+# A record of a single acceptance decision.
+_RECORD = np.dtype([("iteration", np.int64),
+                    ("value", np.float64),
+                    ("probability", np.float64),
+                    ("accepted", np.bool_)])
+
+
+class AnalyticsRecorder:
+
+    def __init__(self, capacity=None, decimation=1):
+        """
+        Records the acceptance decisions of a criterion: for each call to
+        ``accept``, the parameter used (e.g. the temperature or threshold),
+        the acceptance probability, and whether the candidate was accepted.
+        Records are stored in a NumPy array, so that memory stays bounded when
+        a capacity is set.
+
+        Parameters
+        ----------
+        capacity : int
+            Optional maximum number of records. When set, the records are kept
+            in a ring buffer, holding only the most recent ``capacity``
+            records. When not passed, all records are kept.
+        decimation : int
+            Only every ``decimation``-th call is recorded. Default 1, which
+            records every call.
+        """
+        if capacity is not None and capacity < 1:
+            raise ValueError("Expected a capacity of at least one.")
+
+        if decimation < 1:
+            raise ValueError("Expected a decimation of at least one.")
+
+        self._capacity = capacity
+        self._decimation = decimation
+        self._num_calls = 0
+
+        if capacity is None:
+            self._records = GrowableArray(_RECORD)
+        else:
+            self._records = np.empty(capacity, dtype=_RECORD)
+            self._num_records = 0
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    @property
+    def decimation(self):
+        return self._decimation
+
+    @property
+    def num_calls(self):
+        """
+        Returns the number of calls recorded, including those that were not
+        stored due to decimation or the capacity.
+
+        Returns
+        -------
+        int
+            The number of calls.
+        """
+        return self._num_calls
+
+    @property
+    def iterations(self):
+        """
+        Returns the (one-based) call number of each stored record.
+
+        Returns
+        -------
+        np.ndarray
+            The call numbers, in increasing order.
+        """
+        return self._stored()["iteration"]
+
+    @property
+    def values(self):
+        """
+        Returns the parameter value of each stored record, e.g. the
+        temperature or threshold the candidate was compared against.
+
+        Returns
+        -------
+        np.ndarray
+            The parameter values.
+        """
+        return self._stored()["value"]
+
+    @property
+    def probabilities(self):
+        """
+        Returns the acceptance probability of each stored record. This is NaN
+        for criteria that do not accept with a probability.
+
+        Returns
+        -------
+        np.ndarray
+            The acceptance probabilities.
+        """
+        return self._stored()["probability"]
+
+    @property
+    def accepted(self):
+        """
+        Returns whether the candidate was accepted, for each stored record.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array of acceptance decisions.
+        """
+        return self._stored()["accepted"]
+
+    def record(self, value, accepted, probability=np.nan):
+        """
+        Records a call to ``accept``.
+
+        Parameters
+        ----------
+        value : float
+            The parameter value used to decide on acceptance.
+        accepted : bool
+            Whether the candidate was accepted.
+        probability : float
+            The acceptance probability, if any. Default NaN.
+        """
+        self._num_calls += 1
+
+        if self._num_calls % self._decimation != 0:
+            return
+
+        record = (self._num_calls, value, probability, accepted)
+
+        if self._capacity is None:
+            self._records.append(record)
+        else:
+            # Ring buffer: once full, the oldest record is overwritten.
+            self._records[self._num_records % self._capacity] = record
+            self._num_records += 1
+
+    def plot(self, ax=None, title=None, ylabel=None):
+        """
+        Plots the stored parameter values against the call numbers.
+
+        Parameters
+        ----------
+        ax : Axes
+            Optional axes argument. If not passed, a new figure and axes are
+            constructed.
+        title : str
+            Optional title argument.
+        ylabel : str
+            Optional label of the parameter values.
+        """
+        if ax is None:
+            _, ax = plt.subplots(figsize=(10, 10))
+
+        ax.scatter(self.iterations, self.values)
+
+        if title is not None:
+            ax.set_title(title)
+
+        if ylabel is not None:
+            ax.set_ylabel(ylabel)
+
+        ax.set_xlabel("Iteration (#)")
+
+        plt.draw_if_interactive()
+
+    def _stored(self):
+        """
+        Returns the stored records, oldest first.
+        """
+        if self._capacity is None:
+            return self._records.values
+
+        if self._num_records <= self._capacity:
+            return self._records[:self._num_records]
+
+        start = self._num_records % self._capacity
+        return np.concatenate((self._records[start:], self._records[:start]))
+
+
+def get_recorder(record):
+    """
+    Returns the recorder to record into, or None when the criterion should not
+    record. ``record`` may be a bool, or an ``AnalyticsRecorder``.
+    """
+    if isinstance(record, AnalyticsRecorder):
+        return record
+
+    return AnalyticsRecorder() if record else None
@@ -0,0 +1,62 @@
+from .AcceptanceCriterion import AcceptanceCriterion
+
+
+class GreatDeluge(AcceptanceCriterion):
+
+    def __init__(self, alpha, beta):
+        """
+        The great deluge accepts a candidate solution when its objective is
+        below the water level. The level starts at ``alpha`` times the
+        objective of the first current solution, and after every call moves
+        towards the candidate's objective as,
+
+        ``level = level - beta * (level - candidate)``
+
+        Parameters
+        ----------
+        alpha : float
+            Factor of the initial water level, at least one.
+        beta : float
+            The rate at which the level falls, in the unit interval [0, 1].
+
+        References
+        ----------
+        - Dueck, G. New optimization heuristics: the great deluge algorithm
+          and the record-to-record travel. *Journal of Computational Physics*
+          (1993) 104 (1): 86-92.
+        - Santini, A., Ropke, S. & Hvattum, L.M. A comparison of acceptance
+          criteria for the adaptive large neighbourhood search metaheuristic.
+          *Journal of Heuristics* (2018) 24 (5): 783–815.
+        """
+        if alpha < 1:
+            raise ValueError("Alpha must be at least one.")
+
+        if not (0 <= beta <= 1):
+            raise ValueError("Beta outside unit interval is not understood.")
+
+        self._alpha = alpha
+        self._beta = beta
+
+        self._level = None
+
+    @property
+    def alpha(self):
+        return self._alpha
+
+    @property
+    def beta(self):
+        return self._beta
+
+    @property
+    def level(self):
+        return self._level
+
+    def accept(self, rnd, best, current, candidate):
+        if self._level is None:
+            self._level = self._alpha * current.objective()
+
+        result = candidate.objective() < self._level
+
+        self._level -= self._beta * (self._level - candidate.objective())
+
+        return result
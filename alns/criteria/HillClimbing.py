@@ -8,4 +8,7 @@ class HillClimbing(AcceptanceCriterion):
     """
 
     def accept(self, rnd, best, current, candidate):
-        return candidate.objective() <= current.objective()
\ No newline at end of file
+        return candidate.objective() <= current.objective()
+
+    def threshold(self, best, current):
+        return current.objective()
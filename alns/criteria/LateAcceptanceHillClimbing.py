@@ -0,0 +1,77 @@
+import numpy as np
+
+from .AcceptanceCriterion import AcceptanceCriterion
+
+
+class LateAcceptanceHillClimbing(AcceptanceCriterion):
+
+    def __init__(self, history_length):
+        """
+        Late acceptance hill climbing accepts a candidate solution when it is
+        no worse than the current solution, or than the current solution of
+        ``history_length`` iterations ago. The objectives of past current
+        solutions are kept in a fixed-length circular history, so every call
+        takes constant time.
+
+        Parameters
+        ----------
+        history_length : int
+            The length of the history, that is, how many iterations ago the
+            compared current solution is.
+
+        References
+        ----------
+        - Burke, E. K., and Bykov, Y. The late acceptance hill-climbing
+          heuristic. *European Journal of Operational Research* (2017) 258 (1):
+          70-78.
+        - Santini, A., Ropke, S. & Hvattum, L.M. A comparison of acceptance
+          criteria for the adaptive large neighbourhood search metaheuristic.
+          *Journal of Heuristics* (2018) 24 (5): 783–815.
+        """
+        if history_length < 1:
+            raise ValueError("History length must be at least one.")
+
+        self._history_length = history_length
+
+        self._history = np.empty(history_length)
+        self._iteration = 0
+
+    @property
+    def history_length(self):
+        return self._history_length
+
+    def accept(self, rnd, best, current, candidate):
+        if self._iteration == 0:
+            # The history starts out as if the search stayed at the first
+            # current solution.
+            self._history.fill(current.objective())
+
+        idx = self._iteration % self._history_length
+        self._iteration += 1
+
+        late = self._history[idx]
+        result = candidate.objective() <= late \
+            or candidate.objective() <= current.objective()
+
+        if result:
+            self._history[idx] = candidate.objective()
+        else:
+            self._history[idx] = current.objective()
+
+        return result
+
+    def threshold(self, best, current):
+        if self._iteration == 0:
+            return current.objective()
+
+        late = self._history[self._iteration % self._history_length]
+        return max(late, current.objective())
+
+    def reject(self, rnd, best, current):
+        if self._iteration == 0:
+            self._history.fill(current.objective())
+
+        idx = self._iteration % self._history_length
+        self._iteration += 1
+
+        self._history[idx] = current.objective()
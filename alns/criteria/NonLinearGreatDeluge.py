@@ -0,0 +1,90 @@
+from .AcceptanceCriterion import AcceptanceCriterion
+
+
+class NonLinearGreatDeluge(AcceptanceCriterion):
+
+    def __init__(self, alpha, beta, gamma, delta):
+        """
+        The non-linear great deluge accepts a candidate solution when its
+        objective is below the water level, like the great deluge. The level
+        starts at ``alpha`` times the objective of the first current solution.
+        It falls non-linearly towards the candidate's objective, but rises
+        again once it comes close to the best objective, so the search does
+        not stagnate. After every call, the level is updated as,
+
+        ``level = level + gamma * |best|`` if ``level - best < delta * |best|``
+
+        ``level = level - beta * (level - candidate)`` otherwise.
+
+        Parameters
+        ----------
+        alpha : float
+            Factor of the initial water level, at least one.
+        beta : float
+            The rate at which the level falls, in the unit interval [0, 1].
+        gamma : float
+            The relative amount the level rises by, when it is close to the
+            best objective. Non-negative.
+        delta : float
+            The relative gap between the level and the best objective below
+            which the level rises. Non-negative.
+
+        References
+        ----------
+        - Landa-Silva, D., and Obit, J. H. Great deluge with non-linear decay
+          rate for solving course timetabling problems. *4th International
+          IEEE Conference Intelligent Systems* (2008): 8-11.
+        - Santini, A., Ropke, S. & Hvattum, L.M. A comparison of acceptance
+          criteria for the adaptive large neighbourhood search metaheuristic.
+          *Journal of Heuristics* (2018) 24 (5): 783–815.
+        """
+        if alpha < 1:
+            raise ValueError("Alpha must be at least one.")
+
+        if not (0 <= beta <= 1):
+            raise ValueError("Beta outside unit interval is not understood.")
+
+        if gamma < 0 or delta < 0:
+            raise ValueError("Gamma and delta must be non-negative.")
+
+        self._alpha = alpha
+        self._beta = beta
+        self._gamma = gamma
+        self._delta = delta
+
+        self._level = None
+
+    @property
+    def alpha(self):
+        return self._alpha
+
+    @property
+    def beta(self):
+        return self._beta
+
+    @property
+    def gamma(self):
+        return self._gamma
+
+    @property
+    def delta(self):
+        return self._delta
+
+    @property
+    def level(self):
+        return self._level
+
+    def accept(self, rnd, best, current, candidate):
+        if self._level is None:
+            self._level = self._alpha * current.objective()
+
+        result = candidate.objective() < self._level
+
+        scale = abs(best.objective())
+
+        if self._level - best.objective() < self._delta * scale:
+            self._level += self._gamma * scale
+        else:
+            self._level -= self._beta * (self._level - candidate.objective())
+
+        return result
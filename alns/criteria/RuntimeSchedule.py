@@ -0,0 +1,97 @@
+import time
+
+
+class RuntimeSchedule:
+
+    def __init__(self, start, end, max_runtime, method="linear"):
+        """
+        Schedules a criterion parameter (e.g. a temperature or threshold) over
+        a wall-clock time budget, rather than over a number of iterations. The
+        parameter goes from ``start`` to ``end`` as the elapsed fraction
+        ``t / T`` of the budget ``T`` goes from zero to one, as
+
+        ``start - (start - end) * t / T`` (linear)
+
+        ``start * (end / start) ** (t / T)`` (exponential)
+
+        ``start + (end - start) * method(t / T)`` (callable)
+
+        and stays at ``end`` once the budget is spent. The clock starts at the
+        first call, so the parameter reaches ``end`` after exactly the given
+        runtime, whatever the time per iteration.
+
+        Parameters
+        ----------
+        start : float
+            The parameter value at the start.
+        end : float
+            The parameter value once the budget is spent.
+        max_runtime : float
+            The time budget, in seconds.
+        method : str or callable
+            The schedule, one of {'linear', 'exponential'}, or a callable
+            mapping the elapsed fraction in [0, 1] to the fraction of the way
+            from start to end. Default 'linear'.
+        """
+        if max_runtime <= 0:
+            raise ValueError("Runtime budget must be strictly positive.")
+
+        if not callable(method):
+            method = method.lower()
+
+            if method not in ("linear", "exponential"):
+                raise ValueError("Method `{0}' not understood.".format(method))
+
+            if method == "exponential" and (start <= 0 or end <= 0):
+                raise ValueError("For exponential schedules, the start and"
+                                 " end values must be strictly positive.")
+
+        self._start = start
+        self._end = end
+        self._max_runtime = max_runtime
+        self._method = method
+
+        self._start_time = None
+
+    @property
+    def max_runtime(self):
+        return self._max_runtime
+
+    def __call__(self):
+        """
+        Returns the parameter value for the time elapsed since the first call.
+
+        Returns
+        -------
+        float
+            The parameter value.
+        """
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+
+        elapsed = time.perf_counter() - self._start_time
+        return self.value(min(elapsed / self._max_runtime, 1))
+
+    def value(self, fraction):
+        """
+        Returns the parameter value at the given elapsed fraction of the time
+        budget.
+
+        Parameters
+        ----------
+        fraction : float
+            The elapsed fraction, in the unit interval [0, 1].
+
+        Returns
+        -------
+        float
+            The parameter value.
+        """
+        if callable(self._method):
+            return self._start + (self._end - self._start) \
+                * self._method(fraction)
+
+        if self._method == "linear":
+            return self._start - (self._start - self._end) * fraction
+
+        return self._start * (self._end / self._start) ** fraction
@@ -1,13 +1,18 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.pyplot import Axes  # pylint: disable=unused-import
+
 from .AcceptanceCriterion import AcceptanceCriterion
+from .AnalyticsRecorder import get_recorder
+from .RuntimeSchedule import RuntimeSchedule
 from .update import update
+from ..exceptions_warnings import NotCollectedError
+from ..rng import get_rng
 
 
 class SimulatedAnnealing(AcceptanceCriterion):
 
     def __init__(self, start_temperature, end_temperature, step,
-                 method="linear"):
+                 method="linear", record=False, max_runtime=None):
         """
         Simulated annealing, using an updating temperature. The temperature is
         updated as,
@@ -22,9 +27,21 @@ class SimulatedAnnealing(AcceptanceCriterion):
             The final temperature.
         step : float
             The updating step.
-        method : str
-            The updating method, one of {'linear', 'exponential'}. Default
-            'linear'.
+        method : str or callable
+            The updating method, one of {'linear', 'exponential'}. With a
+            runtime budget, this may also be a callable of the elapsed
+            fraction of the budget. Default 'linear'.
+        record : bool or AnalyticsRecorder
+            Should the temperatures, acceptance probabilities and decisions be
+            recorded, for ``plotAnalytics``? Default False. A recorder may also
+            be passed, e.g. with a capacity or decimation, to bound the memory
+            used.
+        max_runtime : float
+            Optional time budget, in seconds. When set, the temperature is
+            scheduled over the elapsed time rather than updated every call,
+            going from its start to its end value as the time since the first
+            call goes to ``max_runtime``. The step is then not used. See
+            ``RuntimeSchedule`` for the schedules.
         References
         ----------
         - Santini, A., Ropke, S. & Hvattum, L.M. A comparison of acceptance
@@ -40,6 +57,9 @@ class SimulatedAnnealing(AcceptanceCriterion):
             raise ValueError("Start temperature must be bigger than end "
                              "temperature.")
 
+        if callable(method) and max_runtime is None:
+            raise ValueError("Custom methods need a runtime budget.")
+
         if method == "exponential" and step > 1:
             raise ValueError("For exponential updating, the step parameter "
                              "must not be explosive.")
@@ -50,10 +70,13 @@ class SimulatedAnnealing(AcceptanceCriterion):
         self._method = method
 
         self._temperature = start_temperature
-        self._temperatures = []
-        self._temperatures.append(start_temperature)
-        self._probs = []
-        self._acceptState = []
+        self._recorder = get_recorder(record)
+        self._schedule = None
+
+        if max_runtime is not None:
+            self._schedule = RuntimeSchedule(start_temperature,
+                                             end_temperature, max_runtime,
+                                             method)
 
     @property
     def start_temperature(self):
@@ -70,36 +93,194 @@ class SimulatedAnnealing(AcceptanceCriterion):
     @property
     def method(self):
         return self._method
-    
-    def plotAnalytics(self):
-        fig, ax = plt.subplots(figsize=(10, 10))
-        x = range(len(self._temperatures))
-        y = self._temperatures
-        ax.set_title("Temperature over time (# iterations)")
-        plt.scatter(x, y)
-        plt.draw_if_interactive()
+
+    @property
+    def max_runtime(self):
+        if self._schedule is None:
+            return None
+
+        return self._schedule.max_runtime
+
+    @property
+    def recorder(self):
+        return self._recorder
+
+    @classmethod
+    def calibrate(cls, alns, initial_solution, start_prob=0.5, end_prob=0.01,
+                  worse=None, num_samples=100, num_iterations=None,
+                  method="exponential", rnd_state=None, **kwargs):
+        """
+        Returns simulated annealing with start and end temperatures calibrated
+        to the instance, as in Ropke and Pisinger (2006). A solution that is
+        worse than the current solution by some amount is accepted with
+        probability ``start_prob`` at the start temperature, and with
+        probability ``end_prob`` at the end temperature.
+
+        This amount is measured from a warm-up of ``num_samples`` moves, each
+        applying a random destroy and repair operator of the ALNS instance to
+        the initial solution: it is the mean worsening of the moves that
+        worsened the objective. Alternatively, when ``worse`` is passed, it is
+        that fraction of the initial solution's objective.
+
+        Parameters
+        ----------
+        alns : ALNS
+            The ALNS instance, whose operators are used for the warm-up.
+        initial_solution : State
+            The initial solution.
+        start_prob : float
+            The acceptance probability at the start temperature. Default 0.5.
+        end_prob : float
+            The acceptance probability at the end temperature. Default 0.01.
+        worse : float
+            Optional fraction of the initial objective, e.g. 0.05 for a
+            solution that is 5% worse. When passed, no warm-up is done.
+        num_samples : int
+            The number of warm-up moves. Default 100.
+        num_iterations : int
+            Optional number of iterations over which to go from the start to
+            the end temperature, to determine the step. Either this, or a
+            ``max_runtime`` should be passed.
+        method : str
+            The updating method, one of {'linear', 'exponential'}. Default
+            'exponential'.
+        rnd_state : Generator or int
+            Optional random number generator, or seed, for the warm-up.
+        kwargs : dict
+            Other arguments passed to the constructor, e.g. ``max_runtime``.
+
+        Raises
+        ------
+        ValueError
+            When the parameters do not meet requirements, or when no move of
+            the warm-up worsened the objective.
+
+        Returns
+        -------
+        SimulatedAnnealing
+            The calibrated simulated annealing criterion.
+
+        References
+        ----------
+        - Ropke, S., and Pisinger, D. (2006). An Adaptive Large Neighborhood
+          Search Heuristic for the Pickup and Delivery Problem with Time
+          Windows. *Transportation Science*, 40 (4): 455-472.
+        """
+        if not (0 < end_prob < start_prob < 1):
+            raise ValueError("Expected acceptance probabilities with"
+                             " 0 < end_prob < start_prob < 1.")
+
+        if num_iterations is None and kwargs.get("max_runtime") is None:
+            raise ValueError("Expected a number of iterations or a runtime"
+                             " budget to calibrate the step.")
+
+        if num_iterations is not None and num_iterations < 1:
+            raise ValueError("Expected at least one iteration.")
+
+        objective = initial_solution.objective()
+
+        if worse is not None:
+            if worse <= 0:
+                raise ValueError("Expected a strictly positive fraction.")
+
+            delta = worse * abs(objective)
+        else:
+            if num_samples < 1:
+                raise ValueError("Expected at least one warm-up move.")
+
+            delta = _mean_worsening(alns, initial_solution, num_samples,
+                                    get_rng(rnd_state))
+
+        if delta <= 0:
+            raise ValueError("Warm-up moves did not worsen the objective, so"
+                             " the temperature cannot be calibrated. Consider"
+                             " passing `worse' instead.")
+
+        # Accepting a solution that is worse by delta with probability p
+        # requires a temperature of -delta / ln(p).
+        start_temperature = -delta / np.log(start_prob)
+        end_temperature = -delta / np.log(end_prob)
+
+        step = 1
+
+        if num_iterations is not None:
+            if method == "exponential":
+                step = (end_temperature / start_temperature) \
+                    ** (1 / num_iterations)
+            else:
+                step = (start_temperature - end_temperature) / num_iterations
+
+        return cls(start_temperature, end_temperature, step, method, **kwargs)
+
+    def plotAnalytics(self, ax=None):
+        """
+        Plots the recorded temperature at each call.
+
+        Parameters
+        ----------
+        ax : Axes
+            Optional axes argument. If not passed, a new figure and axes are
+            constructed.
+
+        Raises
+        ------
+        NotCollectedError
+            When the temperature was not recorded.
+        """
+        if self._recorder is None:
+            raise NotCollectedError("The temperature was not recorded.")
+
+        self._recorder.plot(ax, "Temperature over time (# iterations)",
+                            "Temperature")
 
     def accept(self, rnd, best, current, candidate):
+        if self._schedule is not None:
+            self._temperature = self._schedule()
+
         probability = np.exp((current.objective() - candidate.objective())
                              / self._temperature)
 
-        self._probs.append(probability)
-
-        # We should not set a temperature that is lower than the end
-        # temperature.
-        self._temperature = max(self.end_temperature, update(self._temperature,
-                                                             self.step,
-                                                             self.method))
-
-        self._temperatures.append(self._temperature)
-
-        # TODO deprecate RandomState in favour of Generator - which uses
-        #  random(), rather than random_sample().
-        try:
-            res = probability >= rnd.random()
-            self._acceptState.append(res)
-            return res
-        except AttributeError:
-            res = probability >= rnd.random_sample()
-            self._acceptState.append(res)
-            return res
\ No newline at end of file
+        # Both Generator and the legacy RandomState offer random().
+        res = probability >= rnd.random()
+
+        if self._recorder is not None:
+            self._recorder.record(self._temperature, res, probability)
+
+        if self._schedule is None:
+            # We should not set a temperature that is lower than the end
+            # temperature.
+            self._temperature = max(self.end_temperature,
+                                    update(self._temperature, self.step,
+                                           self.method))
+
+        return res
+
+
+def _mean_worsening(alns, initial_solution, num_samples, rnd_state):
+    """
+    Applies random destroy and repair operators of the ALNS instance to the
+    initial solution, and returns the mean worsening of the objective over the
+    moves that worsened it, or zero when none did.
+    """
+    objective = initial_solution.objective()
+    worsening = []
+
+    for _ in range(num_samples):
+        d_idx = rnd_state.integers(len(alns.destroy_operators))
+        r_idx = rnd_state.integers(len(alns.repair_operators))
+
+        destroyed = alns.destroy_operators[d_idx][1](initial_solution,
+                                                      rnd_state)
+        r_name, r_operator = alns.repair_operators[r_idx]
+
+        if r_name in alns._context_operators:
+            # Warm-up moves are never rejected, so there is no context to
+            # abort on.
+            candidate = r_operator(destroyed, rnd_state, None)
+        else:
+            candidate = r_operator(destroyed, rnd_state)
+
+        if candidate.objective() > objective:
+            worsening.append(candidate.objective() - objective)
+
+    return np.mean(worsening) if worsening else 0
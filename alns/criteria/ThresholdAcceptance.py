@@ -1,10 +1,17 @@
+import numpy as np
+from matplotlib.pyplot import Axes  # pylint: disable=unused-import
+
 from .AcceptanceCriterion import AcceptanceCriterion
+from .AnalyticsRecorder import get_recorder
+from .RuntimeSchedule import RuntimeSchedule
 from .update import update
+from ..exceptions_warnings import NotCollectedError
 
 
 class ThresholdAcceptance(AcceptanceCriterion):
 
-    def __init__(self, start_threshold, end_threshold, step, method="linear"):
+    def __init__(self, start_threshold, end_threshold, step, method="linear",
+                 record=False, max_runtime=None):
         """
         ``threshold = max(end_threshold, threshold - step)`` (linear)
 
@@ -20,9 +27,20 @@ class ThresholdAcceptance(AcceptanceCriterion):
             The final threshold.
         step : float
             The updating step.
-        method : str
-            The updating method, one of {'linear', 'exponential'}. Default
-            'linear'.
+        method : str or callable
+            The updating method, one of {'linear', 'exponential'}. With a
+            runtime budget, this may also be a callable of the elapsed
+            fraction of the budget. Default 'linear'.
+        record : bool or AnalyticsRecorder
+            Should the thresholds and acceptance decisions be recorded, for
+            ``plotAnalytics``? Default False. A recorder may also be passed,
+            e.g. with a capacity or decimation, to bound the memory used.
+        max_runtime : float
+            Optional time budget, in seconds. When set, the threshold is
+            scheduled over the elapsed time rather than updated every call,
+            going from its start to its end value as the time since the first
+            call goes to ``max_runtime``. The step is then not used. See
+            ``RuntimeSchedule`` for the schedules.
         """
         if start_threshold < 0 or end_threshold < 0 or step < 0:
             raise ValueError("Thresholds must be positive.")
@@ -31,6 +49,9 @@ class ThresholdAcceptance(AcceptanceCriterion):
             raise ValueError("Start threshold must be bigger than end "
                              "threshold.")
 
+        if callable(method) and max_runtime is None:
+            raise ValueError("Custom methods need a runtime budget.")
+
         if method == "exponential" and step > 1:
             raise ValueError("For exponential updating, the step parameter "
                              "must not be explosive.")
@@ -41,6 +62,12 @@ class ThresholdAcceptance(AcceptanceCriterion):
         self._method = method
 
         self._threshold = start_threshold
+        self._recorder = get_recorder(record)
+        self._schedule = None
+
+        if max_runtime is not None:
+            self._schedule = RuntimeSchedule(start_threshold, end_threshold,
+                                             max_runtime, method)
 
     @property
     def start_threshold(self):
@@ -58,10 +85,70 @@ class ThresholdAcceptance(AcceptanceCriterion):
     def method(self):
         return self._method
 
+    @property
+    def max_runtime(self):
+        if self._schedule is None:
+            return None
+
+        return self._schedule.max_runtime
+
+    @property
+    def recorder(self):
+        return self._recorder
+
+    def plotAnalytics(self, ax=None):
+        """
+        Plots the recorded threshold at each call.
+
+        Parameters
+        ----------
+        ax : Axes
+            Optional axes argument. If not passed, a new figure and axes are
+            constructed.
+
+        Raises
+        ------
+        NotCollectedError
+            When the threshold was not recorded.
+        """
+        if self._recorder is None:
+            raise NotCollectedError("The threshold was not recorded.")
+
+        self._recorder.plot(ax, "Threshold over time (# iterations)",
+                            "Threshold")
+
     def accept(self, rnd, best, current, candidate):
+        if self._schedule is not None:
+            self._threshold = self._schedule()
+
         result = ((candidate.objective() - current.objective()) / candidate.objective()) <= self._threshold
 
-        self._threshold = max(self.end_threshold,
-                              update(self._threshold, self.step, self.method))
+        self._update(result)
 
         return result
+
+    def threshold(self, best, current):
+        # Candidates are compared relative to their own objective value, so
+        # this bound only follows for positive objectives.
+        if current.objective() <= 0 or self._threshold >= 1:
+            return np.inf
+
+        return current.objective() / (1 - self._threshold)
+
+    def reject(self, rnd, best, current):
+        if self._schedule is not None:
+            self._threshold = self._schedule()
+
+        self._update(False)
+
+    def _update(self, result):
+        """
+        Records the acceptance decision, and updates the threshold.
+        """
+        if self._recorder is not None:
+            self._recorder.record(self._threshold, result)
+
+        if self._schedule is None:
+            self._threshold = max(self.end_threshold,
+                                  update(self._threshold, self.step,
+                                         self.method))
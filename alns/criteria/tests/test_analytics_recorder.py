@@ -0,0 +1,135 @@
+import numpy as np
+import numpy.random as rnd
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from alns.criteria.AnalyticsRecorder import AnalyticsRecorder, get_recorder
+from alns.criteria.RecordToRecordTravel import RecordToRecordTravel
+from alns.criteria.SimulatedAnnealing import SimulatedAnnealing
+from alns.criteria.ThresholdAcceptance import ThresholdAcceptance
+from alns.exceptions_warnings import NotCollectedError
+from alns.tests.states import One, Zero
+
+
+def test_raises_invalid_parameters():
+    """
+    The capacity and decimation should be at least one.
+    """
+    with assert_raises(ValueError):
+        AnalyticsRecorder(capacity=0)
+
+    with assert_raises(ValueError):
+        AnalyticsRecorder(decimation=0)
+
+    AnalyticsRecorder(capacity=1, decimation=1)
+
+
+def test_records_every_call():
+    """
+    Without capacity or decimation, every call should be stored.
+    """
+    recorder = AnalyticsRecorder()
+
+    for value in range(10):
+        recorder.record(value, value % 2 == 0, value / 10)
+
+    assert_equal(recorder.num_calls, 10)
+    assert_equal(recorder.iterations, np.arange(1, 11))
+    assert_equal(recorder.values, np.arange(10))
+    assert_equal(recorder.probabilities, np.arange(10) / 10)
+    assert_equal(recorder.accepted, np.arange(10) % 2 == 0)
+
+
+def test_ring_buffer_keeps_most_recent():
+    """
+    With a capacity, only the most recent records should be kept, oldest
+    first.
+    """
+    recorder = AnalyticsRecorder(capacity=4)
+
+    for value in range(3):
+        recorder.record(value, True)
+
+    assert_equal(recorder.values, [0, 1, 2])
+
+    for value in range(3, 11):
+        recorder.record(value, True)
+
+    assert_equal(recorder.num_calls, 11)
+    assert_equal(recorder.iterations, [8, 9, 10, 11])
+    assert_equal(recorder.values, [7, 8, 9, 10])
+    assert_(np.all(np.isnan(recorder.probabilities)))
+
+
+def test_decimation():
+    """
+    With decimation, only every so many calls should be stored, at the call
+    numbers they were made at.
+    """
+    recorder = AnalyticsRecorder(capacity=3, decimation=5)
+
+    for value in range(100):
+        recorder.record(value, False)
+
+    assert_equal(recorder.num_calls, 100)
+    assert_equal(recorder.iterations, [90, 95, 100])
+    assert_equal(recorder.values, [89, 94, 99])
+
+
+def test_get_recorder():
+    """
+    Recording is opt-in, and a passed recorder should be used as-is.
+    """
+    assert_(get_recorder(False) is None)
+    assert_(isinstance(get_recorder(True), AnalyticsRecorder))
+
+    recorder = AnalyticsRecorder(capacity=10)
+    assert_(get_recorder(recorder) is recorder)
+
+
+def test_criteria_do_not_record_by_default():
+    """
+    The criteria should not record unless asked to, and then cannot plot.
+    """
+    for criterion in [SimulatedAnnealing(2, 1, 1),
+                      RecordToRecordTravel(2, 1, 1),
+                      ThresholdAcceptance(2, 1, 1)]:
+        assert_(criterion.recorder is None)
+
+        criterion.accept(rnd.RandomState(), One(), One(), One())
+
+        with assert_raises(NotCollectedError):
+            criterion.plotAnalytics()
+
+
+def test_simulated_annealing_records_temperatures():
+    """
+    Simulated annealing should record the temperature it used, the acceptance
+    probability, and the decision, for every call.
+    """
+    simulated_annealing = SimulatedAnnealing(4, 1, 1, record=True)
+
+    for _ in range(5):
+        simulated_annealing.accept(rnd.RandomState(1), Zero(), Zero(), One())
+
+    recorder = simulated_annealing.recorder
+
+    assert_equal(recorder.values, [4, 3, 2, 1, 1])
+    assert_equal(recorder.probabilities, np.exp(-1 / recorder.values))
+    assert_equal(len(recorder.accepted), 5)
+
+
+def test_threshold_criteria_record_thresholds():
+    """
+    The threshold-based criteria should record the threshold they used, into
+    a passed-in recorder.
+    """
+    for criterion_type in [RecordToRecordTravel, ThresholdAcceptance]:
+        recorder = AnalyticsRecorder(capacity=2)
+        criterion = criterion_type(3, 0, 1, record=recorder)
+
+        for _ in range(4):
+            criterion.accept(rnd.RandomState(), One(), One(), One())
+
+        assert_(criterion.recorder is recorder)
+        assert_equal(recorder.values, [1, 0])
+        assert_(np.all(recorder.accepted))
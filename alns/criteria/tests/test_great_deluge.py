@@ -0,0 +1,100 @@
+import numpy.random as rnd
+from numpy.testing import assert_, assert_almost_equal, assert_equal, \
+    assert_raises
+
+from alns.criteria.GreatDeluge import GreatDeluge
+from alns.criteria.NonLinearGreatDeluge import NonLinearGreatDeluge
+from alns.tests.states import One, Two, Zero
+
+
+def test_raises_invalid_parameters():
+    """
+    The initial level should not be below the initial objective, and the
+    level should not fall past the candidate's objective.
+    """
+    with assert_raises(ValueError):
+        GreatDeluge(0.5, 0.1)
+
+    with assert_raises(ValueError):
+        GreatDeluge(2, -0.1)
+
+    with assert_raises(ValueError):
+        GreatDeluge(2, 1.1)
+
+    GreatDeluge(1, 0)                           # boundaries should be fine
+    GreatDeluge(1, 1)
+
+
+def test_level_starts_at_alpha_times_current():
+    """
+    The level should be set from the first current solution.
+    """
+    great_deluge = GreatDeluge(1.5, 0)
+    assert_(great_deluge.level is None)
+
+    great_deluge.accept(rnd.RandomState(), One(), Two(), One())
+    assert_equal(great_deluge.level, 3)
+
+
+def test_accepts_below_level():
+    """
+    Candidates below the level should be accepted, and others rejected.
+    """
+    great_deluge = GreatDeluge(1.5, 0)
+
+    assert_(great_deluge.accept(rnd.RandomState(), One(), One(), One()))
+    assert_(not great_deluge.accept(rnd.RandomState(), One(), One(), Two()))
+
+
+def test_level_falls_towards_candidate():
+    """
+    The level should fall towards the candidate's objective, at rate beta.
+    """
+    great_deluge = GreatDeluge(2, 0.5)
+
+    great_deluge.accept(rnd.RandomState(), Two(), Two(), Zero())
+    assert_almost_equal(great_deluge.level, 2)
+
+    great_deluge.accept(rnd.RandomState(), Two(), Two(), Zero())
+    assert_almost_equal(great_deluge.level, 1)
+
+
+def test_non_linear_raises_invalid_parameters():
+    """
+    In addition to those of the great deluge, gamma and delta should be
+    non-negative.
+    """
+    with assert_raises(ValueError):
+        NonLinearGreatDeluge(0.5, 0.1, 0.1, 0.1)
+
+    with assert_raises(ValueError):
+        NonLinearGreatDeluge(2, 0.1, -0.1, 0.1)
+
+    with assert_raises(ValueError):
+        NonLinearGreatDeluge(2, 0.1, 0.1, -0.1)
+
+    NonLinearGreatDeluge(1, 1, 0, 0)
+
+
+def test_non_linear_level_falls_then_rises():
+    """
+    The level should fall towards the candidate's objective while it is well
+    above the best objective, and rise once it gets close.
+    """
+    great_deluge = NonLinearGreatDeluge(2, 0.5, 0.5, 0.1)
+
+    # Level starts at four, well above the best of one, so it falls towards
+    # the candidate at two.
+    assert_(great_deluge.accept(rnd.RandomState(), One(), Two(), Two()))
+    assert_almost_equal(great_deluge.level, 3)
+
+    # Level halves its distance to the candidate at one, each call.
+    for _ in range(5):
+        great_deluge.accept(rnd.RandomState(), One(), One(), One())
+
+    assert_almost_equal(great_deluge.level, 1.0625)
+
+    # Now it is close to the best, so it rises by half the best objective.
+    level = great_deluge.level
+    great_deluge.accept(rnd.RandomState(), One(), One(), One())
+    assert_almost_equal(great_deluge.level, level + 0.5)
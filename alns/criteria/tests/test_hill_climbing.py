@@ -1,5 +1,5 @@
 import numpy.random as rnd
-from numpy.testing import assert_
+from numpy.testing import assert_, assert_equal
 
 from alns.criteria import HillClimbing
 from alns.tests.states import Zero, One
@@ -28,3 +28,12 @@ def test_accepts_equal():
     """
     hill_climbing = HillClimbing()
     assert_(hill_climbing.accept(rnd.RandomState(), Zero(), Zero(), Zero()))
+
+
+def test_threshold_is_current_objective():
+    """
+    Hill climbing rejects any candidate worse than the current solution, so
+    the current objective is the threshold.
+    """
+    hill_climbing = HillClimbing()
+    assert_equal(hill_climbing.threshold(Zero(), One()), 1)
@@ -0,0 +1,96 @@
+import numpy.random as rnd
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from alns.criteria.LateAcceptanceHillClimbing import \
+    LateAcceptanceHillClimbing
+from alns.tests.states import One, Two, Zero
+
+
+def test_raises_non_positive_history_length():
+    """
+    The history should hold at least one objective.
+    """
+    with assert_raises(ValueError):
+        LateAcceptanceHillClimbing(0)
+
+    LateAcceptanceHillClimbing(1)
+
+
+def test_history_length():
+    """
+    Tests if the history_length parameter is correctly set.
+    """
+    for length in range(1, 100):
+        assert_equal(LateAcceptanceHillClimbing(length).history_length,
+                     length)
+
+
+def test_accepts_better_and_equal():
+    """
+    Like hill climbing, candidates no worse than the current solution should
+    be accepted.
+    """
+    lahc = LateAcceptanceHillClimbing(3)
+
+    assert_(lahc.accept(rnd.RandomState(), One(), One(), Zero()))
+    assert_(lahc.accept(rnd.RandomState(), Zero(), Zero(), Zero()))
+
+
+def test_accepts_worse_than_current_but_not_late():
+    """
+    A candidate worse than the current solution should be accepted when it is
+    no worse than the current solution of history_length iterations ago.
+    """
+    lahc = LateAcceptanceHillClimbing(2)
+
+    # The history starts out as [2, 2]. Improvements to zero overwrite it.
+    assert_(lahc.accept(rnd.RandomState(), Zero(), Two(), Zero()))
+    assert_(lahc.accept(rnd.RandomState(), Zero(), Zero(), Zero()))
+
+    # Both entries are now zero, so a worse candidate is rejected.
+    assert_(not lahc.accept(rnd.RandomState(), Zero(), Zero(), One()))
+
+
+def test_late_comparison():
+    """
+    The late comparison should be against the objective of history_length
+    iterations ago, after which that entry is overwritten.
+    """
+    lahc = LateAcceptanceHillClimbing(2)
+
+    assert_(lahc.accept(rnd.RandomState(), Zero(), Two(), One()))
+    assert_(lahc.accept(rnd.RandomState(), Zero(), One(), Two()))
+
+    # Entry one holds the first accepted candidate (one), and entry two holds
+    # the second (two). The former is compared against first.
+    assert_(not lahc.accept(rnd.RandomState(), Zero(), Zero(), Two()))
+    assert_(lahc.accept(rnd.RandomState(), Zero(), Zero(), Two()))
+
+
+def test_threshold():
+    """
+    The threshold is the larger of the late and current objectives.
+    """
+    lahc = LateAcceptanceHillClimbing(2)
+
+    # Before the first call, the history is that of the current solution.
+    assert_equal(lahc.threshold(Zero(), One()), 1)
+
+    lahc.accept(rnd.RandomState(), Zero(), Two(), Two())
+    assert_equal(lahc.threshold(Zero(), One()), 2)
+    assert_equal(lahc.threshold(Zero(), Zero()), 2)
+
+
+def test_reject_updates_history():
+    """
+    Aborted candidates are rejected without a call to accept, but should
+    still update the history with the current objective.
+    """
+    lahc = LateAcceptanceHillClimbing(2)
+
+    lahc.reject(rnd.RandomState(), Zero(), Two())
+    lahc.reject(rnd.RandomState(), Zero(), Zero())
+
+    # Entry one holds two, and entry two holds zero.
+    assert_(lahc.accept(rnd.RandomState(), Zero(), Zero(), Two()))
+    assert_(not lahc.accept(rnd.RandomState(), Zero(), Zero(), One()))
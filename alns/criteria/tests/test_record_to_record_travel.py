@@ -1,8 +1,10 @@
 import numpy.random as rnd
-from numpy.testing import assert_, assert_equal, assert_raises
+import numpy as np
+from numpy.testing import (assert_, assert_almost_equal, assert_equal,
+                           assert_raises)
 
 from alns.criteria import RecordToRecordTravel
-from alns.tests.states import One, Zero
+from alns.tests.states import One, Two, Zero
 
 
 def test_raises_negative_parameters():
@@ -124,3 +126,42 @@ def test_exponential_threshold_update():
     assert_(record_travel.accept(rnd.RandomState(), Zero(), Zero(), One()))
     assert_(not record_travel.accept(rnd.RandomState(), Zero(), Zero(), One()))
 
+
+def test_threshold():
+    """
+    Candidates are rejected when their worsening relative to the best, as a
+    fraction of their own objective, exceeds the threshold. For a threshold
+    of one half, that is above twice the best objective.
+    """
+    record_travel = RecordToRecordTravel(.5, 0, .1)
+
+    assert_almost_equal(record_travel.threshold(One(), Two()), 2)
+
+    # At the threshold, so this should still be accepted.
+    assert_(record_travel.accept(rnd.RandomState(), One(), Two(), Two()))
+
+
+def test_threshold_unbounded():
+    """
+    No threshold follows when the best objective is not positive, or the
+    threshold permits any relative worsening.
+    """
+    record_travel = RecordToRecordTravel(1, 0, .1)
+
+    assert_equal(record_travel.threshold(One(), One()), np.inf)
+    assert_equal(record_travel.threshold(Zero(), One()), np.inf)
+
+
+def test_reject_updates_threshold():
+    """
+    Aborted candidates are rejected without a call to accept, but should
+    still update the threshold.
+    """
+    record_travel = RecordToRecordTravel(5, 0, 1, record=True)
+
+    for _ in range(5):
+        record_travel.reject(rnd.RandomState(), Zero(), Zero())
+
+    # Threshold is now zero, so this should no longer be accepted.
+    assert_(not record_travel.accept(rnd.RandomState(), Zero(), Zero(), One()))
+    assert_equal(record_travel.recorder.accepted, [False] * 6)
@@ -0,0 +1,128 @@
+import time
+
+import numpy.random as rnd
+from numpy.testing import (assert_, assert_almost_equal, assert_equal,
+                           assert_raises)
+
+from alns.criteria.RecordToRecordTravel import RecordToRecordTravel
+from alns.criteria.RuntimeSchedule import RuntimeSchedule
+from alns.criteria.SimulatedAnnealing import SimulatedAnnealing
+from alns.criteria.ThresholdAcceptance import ThresholdAcceptance
+from alns.tests.states import One, Zero
+
+
+def test_raises_invalid_parameters():
+    """
+    The budget should be strictly positive, the method understood, and
+    exponential schedules need strictly positive values.
+    """
+    with assert_raises(ValueError):
+        RuntimeSchedule(2, 1, 0)
+
+    with assert_raises(ValueError):
+        RuntimeSchedule(2, 1, 1, "unknown_method")
+
+    with assert_raises(ValueError):
+        RuntimeSchedule(2, 0, 1, "exponential")
+
+    RuntimeSchedule(2, 0, 1, "linear")              # zero is fine here
+
+
+def test_linear():
+    """
+    Linear schedules should interpolate between the start and end values.
+    """
+    schedule = RuntimeSchedule(10, 2, 1, "linear")
+
+    assert_equal(schedule.value(0), 10)
+    assert_equal(schedule.value(0.5), 6)
+    assert_equal(schedule.value(1), 2)
+
+
+def test_exponential():
+    """
+    Exponential schedules should decay geometrically from the start to the end
+    value.
+    """
+    schedule = RuntimeSchedule(100, 1, 1, "EXPONENTIAL")
+
+    assert_almost_equal(schedule.value(0), 100)
+    assert_almost_equal(schedule.value(0.5), 10)
+    assert_almost_equal(schedule.value(1), 1)
+
+
+def test_callable():
+    """
+    A callable gives the fraction of the way from the start to the end value.
+    """
+    schedule = RuntimeSchedule(10, 2, 1, lambda fraction: fraction ** 2)
+
+    assert_equal(schedule.value(0), 10)
+    assert_equal(schedule.value(0.5), 8)
+    assert_equal(schedule.value(1), 2)
+
+
+def test_follows_elapsed_time():
+    """
+    The schedule should start at the start value, and reach the end value once
+    the budget is spent, and stay there.
+    """
+    schedule = RuntimeSchedule(10, 2, 0.05)
+
+    assert_(schedule() > 9)
+
+    time.sleep(0.06)
+    assert_equal(schedule(), 2)
+
+
+def test_criteria_raise_callable_without_budget():
+    """
+    Custom methods are only understood with a runtime budget.
+    """
+    for criterion_type in [SimulatedAnnealing, RecordToRecordTravel,
+                           ThresholdAcceptance]:
+        with assert_raises(ValueError):
+            criterion_type(2, 1, 1, lambda fraction: fraction)
+
+        criterion = criterion_type(2, 1, 1, lambda fraction: fraction,
+                                   max_runtime=1)
+        assert_equal(criterion.max_runtime, 1)
+
+        assert_(criterion_type(2, 1, 1).max_runtime is None)
+
+
+def test_criteria_follow_runtime_schedule():
+    """
+    With a runtime budget, the criteria should use the parameter for the
+    elapsed time, regardless of the number of calls.
+    """
+    for criterion_type in [SimulatedAnnealing, RecordToRecordTravel,
+                           ThresholdAcceptance]:
+        criterion = criterion_type(2, 1, 100, record=True, max_runtime=0.05)
+
+        for _ in range(10):
+            criterion.accept(rnd.RandomState(), One(), One(), One())
+
+        time.sleep(0.06)
+        criterion.accept(rnd.RandomState(), One(), One(), One())
+
+        values = criterion.recorder.values
+
+        # The step would have hit the end value after a single call.
+        assert_(values[9] > 1.5)
+        assert_equal(values[-1], 1)
+
+
+def test_simulated_annealing_runtime_schedule_acceptance():
+    """
+    At the end of its budget, simulated annealing should use the end
+    temperature to decide on acceptance.
+    """
+    simulated_annealing = SimulatedAnnealing(1e6, 1e-6, 1, max_runtime=0.01)
+
+    assert_(simulated_annealing.accept(rnd.RandomState(), Zero(), Zero(),
+                                       One()))
+
+    time.sleep(0.02)
+    assert_(not simulated_annealing.accept(rnd.RandomState(), Zero(), Zero(),
+                                           One()))
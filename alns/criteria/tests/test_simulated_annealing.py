@@ -1,6 +1,9 @@
+import numpy as np
 import numpy.random as rnd
-from numpy.testing import assert_, assert_equal, assert_raises
+from numpy.testing import (assert_, assert_almost_equal, assert_equal,
+                           assert_raises)
 
+from alns import ALNS, State
 from alns.criteria import SimulatedAnnealing
 from alns.tests.states import One, Zero
 
@@ -134,3 +137,124 @@ def test_exponential_random_solutions():
     assert_(simulated_annealing.accept(state, Zero(), Zero(), One()))
     assert_(not simulated_annealing.accept(state, Zero(), Zero(), One()))
 
+
+class ValueState(State):
+    """
+    Helper state with the given objective value.
+    """
+
+    def __init__(self, value):
+        self._value = value
+
+    def objective(self):
+        return self._value
+
+
+def get_warm_up_alns(worsening):
+    """
+    Helper method, returning an ALNS instance whose moves alternate between
+    improving by one, and worsening by the given amount.
+    """
+    alns = ALNS(rnd.default_rng(1))
+    moves = iter(np.tile([-1, worsening], 100))
+
+    alns.add_destroy_operator(lambda state, rnd_state: state)
+    alns.add_repair_operator(
+        lambda state, rnd_state: ValueState(state.objective() + next(moves)))
+
+    return alns
+
+
+def test_calibrate_from_warm_up():
+    """
+    The temperatures should be set such that the mean worsening of the
+    warm-up moves is accepted with the given start and end probabilities.
+    """
+    alns = get_warm_up_alns(4)
+    simulated_annealing = SimulatedAnnealing.calibrate(alns, ValueState(100),
+                                                       0.5, 0.01,
+                                                       num_samples=10,
+                                                       num_iterations=1000)
+
+    start = simulated_annealing.start_temperature
+    end = simulated_annealing.end_temperature
+
+    assert_almost_equal(np.exp(-4 / start), 0.5)
+    assert_almost_equal(np.exp(-4 / end), 0.01)
+
+    # Exponential updating should reach the end after the given iterations.
+    assert_almost_equal(start * simulated_annealing.step ** 1000, end)
+
+
+def test_calibrate_passes_no_context():
+    """
+    Repair operators added with a context should be passed None for it during
+    the warm-up, as no candidate is rejected there.
+    """
+    moves = iter([4] * 10)
+    contexts = []
+
+    def repair(state, rnd_state, context):
+        contexts.append(context)
+        return ValueState(state.objective() + next(moves))
+
+    alns = ALNS(rnd.default_rng(1))
+    alns.add_destroy_operator(lambda state, rnd_state: state)
+    alns.add_repair_operator(repair, context=True)
+
+    simulated_annealing = SimulatedAnnealing.calibrate(alns, ValueState(100),
+                                                       0.5, 0.01,
+                                                       num_samples=10,
+                                                       num_iterations=1000)
+
+    assert_equal(contexts, [None] * 10)
+    assert_almost_equal(np.exp(-4 / simulated_annealing.start_temperature),
+                        0.5)
+
+
+def test_calibrate_from_relative_worsening():
+    """
+    When passed, the worsening is that fraction of the initial objective, and
+    no warm-up moves are needed.
+    """
+    alns = ALNS()
+    simulated_annealing = SimulatedAnnealing.calibrate(alns, ValueState(200),
+                                                       worse=0.05,
+                                                       num_iterations=100,
+                                                       method="linear")
+
+    start = simulated_annealing.start_temperature
+    end = simulated_annealing.end_temperature
+
+    assert_almost_equal(np.exp(-10 / start), 0.5)
+    assert_almost_equal(start - 100 * simulated_annealing.step, end)
+
+
+def test_calibrate_with_runtime_budget():
+    """
+    The calibrated temperatures may also be scheduled over a runtime budget.
+    """
+    simulated_annealing = SimulatedAnnealing.calibrate(ALNS(), ValueState(10),
+                                                       worse=0.1,
+                                                       max_runtime=5)
+
+    assert_equal(simulated_annealing.max_runtime, 5)
+
+
+def test_calibrate_raises_invalid_parameters():
+    """
+    Calibration needs sensible probabilities, a way to set the step, and
+    warm-up moves that worsen the objective.
+    """
+    alns = get_warm_up_alns(4)
+
+    with assert_raises(ValueError):         # start is less likely than end
+        SimulatedAnnealing.calibrate(alns, ValueState(1), 0.01, 0.5,
+                                     num_iterations=10)
+
+    with assert_raises(ValueError):         # no iterations nor budget
+        SimulatedAnnealing.calibrate(alns, ValueState(1))
+
+    with assert_raises(ValueError):         # moves only improve
+        SimulatedAnnealing.calibrate(get_warm_up_alns(-1), ValueState(1),
+                                     num_iterations=10)
@@ -4,7 +4,27 @@
 class NotCollectedError(Exception):
     """
     Raised when statistics are accessed from an ALNS result instance, but
-    statistics were not collected during iteration.
+    statistics were not collected during iteration. Also raised when analytics
+    are plotted for an acceptance criterion that did not record these.
+    """
+    pass
+
+
+class ObjectiveMismatchError(Exception):
+    """
+    Raised when ALNS checks objective values, and the cached objective of a
+    candidate state differs from its objective computed in full. This points
+    to an operator that did not correctly update the cached objective.
+    """
+    pass
+
+
+class RepairAborted(Exception):
+    """
+    Raised by a repair operator to abort repairing a candidate that is
+    certainly rejected, e.g. because a lower bound on its objective exceeds
+    the threshold of its ``RepairContext``. ALNS counts the candidate as
+    rejected.
     """
     pass
 
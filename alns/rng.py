@@ -0,0 +1,73 @@
+import numpy as np
+import numpy.random as rnd
+
+# Seeds drawn from a generator fall in [0, 2^63), the range of a non-negative
+# int64. SeedSequence accepts any non-negative integer as entropy.
+_MAX_SEED = np.iinfo(np.int64).max
+
+
+def get_rng(seed=None):
+    """
+    Returns a random number generator for the passed-in seed. Generators use
+    the PCG64 bit generator. An existing ``Generator`` (or legacy
+    ``RandomState``) is returned as-is, so that callers can accept either a
+    seed or a generator.
+
+    Parameters
+    ----------
+    seed : None, int, SeedSequence, Generator or RandomState
+        The seed. When None, the generator is seeded with fresh entropy from
+        the operating system.
+
+    Returns
+    -------
+    Generator or RandomState
+        The random number generator.
+    """
+    if isinstance(seed, (rnd.Generator, rnd.RandomState)):
+        return seed
+
+    return rnd.Generator(rnd.PCG64(seed))
+
+
+def draw_seed(rng):
+    """
+    Draws a seed from the passed-in random number generator, e.g. to seed a
+    generator for a worker from the main generator's stream.
+
+    Parameters
+    ----------
+    rng : Generator or RandomState
+        The random number generator to draw from.
+
+    Returns
+    -------
+    int
+        A non-negative seed.
+    """
+    if isinstance(rng, rnd.RandomState):
+        return int(rng.randint(np.iinfo(np.int32).max))
+
+    return int(rng.integers(_MAX_SEED))
+
+
+def spawn(rng, num_streams):
+    """
+    Spawns seed sequences for independent random streams, e.g. one for each
+    worker thread, process or replica. The seed sequences are derived from the
+    passed-in generator, so these are reproducible when it is seeded.
+
+    Parameters
+    ----------
+    rng : Generator or RandomState
+        The random number generator to derive the streams from.
+    num_streams : int
+        The number of streams to spawn.
+
+    Returns
+    -------
+    list
+        A list of ``SeedSequence`` objects, one for each stream. Pass these
+        to ``get_rng`` to construct the streams' generators.
+    """
+    return rnd.SeedSequence(draw_seed(rng)).spawn(num_streams)
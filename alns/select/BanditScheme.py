@@ -0,0 +1,72 @@
+from abc import abstractmethod
+
+from .OperatorSelectionScheme import OperatorSelectionScheme
+from .validate_scores import validate_scores
+
+
+class BanditScheme(OperatorSelectionScheme):
+
+    def __init__(self, scores, num_destroy, num_repair):
+        """
+        Base class from which to implement a multi-armed bandit scheme. The
+        destroy and repair operators are treated as two independent sets of
+        arms. The reward of an outcome is its score, normalised by the largest
+        score so that rewards fall in the unit interval [0, 1]. The number of
+        times each arm was played, and the sum of its rewards, are kept.
+
+        Parameters
+        ----------
+        scores : array_like
+            A list of four non-negative elements, representing the scores when
+            the candidate solution results in a new global best (idx 0), is
+            better than the current solution (idx 1), the solution is accepted
+            (idx 2), or rejected (idx 3). At least one must be positive.
+        num_destroy : int
+            The number of destroy operators.
+        num_repair : int
+            The number of repair operators.
+        """
+        super().__init__(num_destroy, num_repair)
+
+        self._scores = validate_scores(scores)
+
+        if max(self._scores) == 0:
+            raise ValueError("Expected at least one positive score.")
+
+        self._rewards = [score / max(self._scores) for score in self._scores]
+
+        # Indexed by arm set (zero for destroy, one for repair), then by
+        # operator. Plain lists, as there are few operators.
+        self._counts = [[0] * num_destroy, [0] * num_repair]
+        self._sums = [[0.] * num_destroy, [0.] * num_repair]
+        self._num_updates = 0
+
+    @property
+    def scores(self):
+        return self._scores
+
+    def select(self, rnd, best, current):
+        return self._select_arm(rnd, 0), self._select_arm(rnd, 1)
+
+    def update(self, d_idx, r_idx, outcome, d_cost=1., r_cost=1.):
+        reward = self._rewards[outcome]
+
+        self._num_updates += 1
+
+        self._update_arm(0, d_idx, reward / d_cost)
+        self._update_arm(1, r_idx, reward / r_cost)
+
+    def _update_arm(self, arms, idx, reward):
+        """
+        Adds the reward of playing an arm of the given arm set.
+        """
+        self._counts[arms][idx] += 1
+        self._sums[arms][idx] += reward
+
+    @abstractmethod
+    def _select_arm(self, rnd, arms):
+        """
+        Selects an arm of the given arm set: zero for the destroy operators,
+        and one for the repair operators. Returns the arm's index.
+        """
+        return NotImplemented
@@ -0,0 +1,67 @@
+import numpy as np
+
+from .OperatorSelectionScheme import OperatorSelectionScheme
+from .validate_scores import validate_scores
+from ..OperatorSelector import OperatorSelector
+
+
+class CoupledRouletteWheel(OperatorSelectionScheme):
+
+    def __init__(self, scores, decay, num_destroy, num_repair):
+        """
+        Roulette wheel selection over pairs of destroy and repair operators.
+        Rather than selecting the destroy and repair operators independently,
+        a weight is learned for every pair, so that operators that work well
+        together are selected together. The pair weights are updated like
+        those of ``RouletteWheel``, as
+
+        ``weight = decay * weight + (1 - decay) * score``
+
+        See ``RouletteWheel`` for the parameters.
+        """
+        super().__init__(num_destroy, num_repair)
+
+        if not (0 <= decay <= 1):
+            raise ValueError("Operator decay parameter outside unit interval"
+                             " is not understood.")
+
+        self._scores = validate_scores(scores)
+        self._decay = decay
+
+        # Pair (d_idx, r_idx) is at index d_idx * num_repair + r_idx.
+        self._selector = OperatorSelector(np.ones(num_destroy * num_repair))
+
+    @property
+    def scores(self):
+        return self._scores
+
+    @property
+    def decay(self):
+        return self._decay
+
+    @property
+    def pair_weights(self):
+        """
+        Returns the current operator pair weights.
+
+        Returns
+        -------
+        np.ndarray
+            Matrix of pair weights, with a row for every destroy operator, and
+            a column for every repair operator.
+        """
+        return self._selector.weights.reshape(self.num_destroy,
+                                              self.num_repair)
+
+    def select(self, rnd, best, current):
+        return divmod(self._selector.select(rnd), self.num_repair)
+
+    def update(self, d_idx, r_idx, outcome, d_cost=1., r_cost=1.):
+        idx = d_idx * self.num_repair + r_idx
+
+        # The relative cost of a pair is taken as the mean relative cost of
+        # its operators.
+        score = self._scores[outcome] / ((d_cost + r_cost) / 2)
+
+        self._selector.update(idx, self._decay * self._selector[idx]
+                              + (1 - self._decay) * score)
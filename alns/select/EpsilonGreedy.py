@@ -0,0 +1,43 @@
+from .BanditScheme import BanditScheme
+
+
+class EpsilonGreedy(BanditScheme):
+
+    def __init__(self, scores, num_destroy, num_repair, epsilon=0.1):
+        """
+        The epsilon-greedy bandit selects an operator uniformly at random with
+        probability ``epsilon``, and otherwise the operator with the highest
+        mean reward so far. Operators that were not yet applied are selected
+        first. See ``BanditScheme`` for the parameters.
+
+        Parameters
+        ----------
+        epsilon : float
+            The probability of selecting at random, in the unit interval
+            [0, 1]. Default 0.1.
+        """
+        super().__init__(scores, num_destroy, num_repair)
+
+        if not (0 <= epsilon <= 1):
+            raise ValueError("Epsilon outside unit interval is not"
+                             " understood.")
+
+        self._epsilon = epsilon
+
+    @property
+    def epsilon(self):
+        return self._epsilon
+
+    def _select_arm(self, rnd, arms):
+        counts = self._counts[arms]
+
+        if rnd.random() < self._epsilon:
+            return min(int(rnd.random() * len(counts)), len(counts) - 1)
+
+        if 0 in counts:
+            return counts.index(0)
+
+        means = [total / count
+                 for total, count in zip(self._sums[arms], counts)]
+
+        return means.index(max(means))
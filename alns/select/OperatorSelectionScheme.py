@@ -0,0 +1,84 @@
+from abc import ABC, abstractmethod
+
+from ..State import State  # pylint: disable=unused-import
+from numpy.random import Generator  # pylint: disable=unused-import
+
+
+class OperatorSelectionScheme(ABC):
+
+    def __init__(self, num_destroy, num_repair):
+        """
+        Base class from which to implement an operator selection scheme. The
+        scheme selects the destroy and repair operators to apply in every
+        iteration, and is told the outcome of applying them, to learn which
+        operators perform well.
+
+        Parameters
+        ----------
+        num_destroy : int
+            The number of destroy operators.
+        num_repair : int
+            The number of repair operators.
+        """
+        if num_destroy < 1 or num_repair < 1:
+            raise ValueError("Missing at least one destroy or repair operator.")
+
+        self._num_destroy = num_destroy
+        self._num_repair = num_repair
+
+    @property
+    def num_destroy(self):
+        return self._num_destroy
+
+    @property
+    def num_repair(self):
+        return self._num_repair
+
+    @abstractmethod
+    def select(self, rnd, best, current):
+        """
+        Selects a destroy and repair operator pair to apply to the current
+        solution.
+
+        Parameters
+        ----------
+        rnd : Generator
+            May be used to draw random numbers from.
+        best : State
+            The best solution state observed so far.
+        current : State
+            The current solution state.
+
+        Returns
+        -------
+        int
+            Index of the selected destroy operator.
+        int
+            Index of the selected repair operator.
+        """
+        return NotImplemented
+
+    @abstractmethod
+    def update(self, d_idx, r_idx, outcome, d_cost=1., r_cost=1.):
+        """
+        Updates the scheme with the outcome of applying the selected destroy
+        and repair operators.
+
+        Parameters
+        ----------
+        d_idx : int
+            Index of the applied destroy operator.
+        r_idx : int
+            Index of the applied repair operator.
+        outcome : int
+            The outcome of the iteration, as a ``WeightIndex``.
+        d_cost : float
+            Cost of the destroy operator, relative to the other destroy
+            operators. Schemes may divide their rewards by this, to reward
+            per unit of time. Default 1, which is passed unless the run is
+            runtime-aware.
+        r_cost : float
+            Cost of the repair operator, relative to the other repair
+            operators. See ``d_cost``.
+        """
+        return NotImplemented
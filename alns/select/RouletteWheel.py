@@ -0,0 +1,107 @@
+import numpy as np
+
+from .OperatorSelectionScheme import OperatorSelectionScheme
+from .validate_scores import validate_scores
+from ..OperatorSelector import OperatorSelector
+
+
+class RouletteWheel(OperatorSelectionScheme):
+
+    def __init__(self, scores, decay, num_destroy, num_repair):
+        """
+        Roulette wheel selection, which selects operators with probability
+        proportional to their weights. After every iteration, the weights of
+        the applied operators are updated as convex combinations of their
+        current weight and the score of the outcome, as
+
+        ``weight = decay * weight + (1 - decay) * score``
+
+        See eq. (2), p. 12, in Pisinger and Røpke (2010). This is the default
+        scheme of ALNS.
+
+        Parameters
+        ----------
+        scores : array_like
+            A list of four non-negative elements, representing the scores when
+            the candidate solution results in a new global best (idx 0), is
+            better than the current solution (idx 1), the solution is accepted
+            (idx 2), or rejected (idx 3).
+        decay : float
+            The operator decay parameter, as a float in the unit interval,
+            [0, 1] (inclusive).
+        num_destroy : int
+            The number of destroy operators.
+        num_repair : int
+            The number of repair operators.
+        """
+        super().__init__(num_destroy, num_repair)
+
+        if not (0 <= decay <= 1):
+            raise ValueError("Operator decay parameter outside unit interval"
+                             " is not understood.")
+
+        self._scores = validate_scores(scores)
+        self._decay = decay
+
+        self._d_selector = OperatorSelector(np.ones(num_destroy))
+        self._r_selector = OperatorSelector(np.ones(num_repair))
+
+    @property
+    def scores(self):
+        return self._scores
+
+    @property
+    def decay(self):
+        return self._decay
+
+    @property
+    def destroy_weights(self):
+        """
+        Returns the current destroy operator weights.
+
+        Returns
+        -------
+        np.ndarray
+            The destroy operator weights.
+        """
+        return self._d_selector.weights
+
+    @property
+    def repair_weights(self):
+        """
+        Returns the current repair operator weights.
+
+        Returns
+        -------
+        np.ndarray
+            The repair operator weights.
+        """
+        return self._r_selector.weights
+
+    def set_weights(self, d_weights, r_weights):
+        """
+        Sets the destroy and repair operator weights, e.g. to share these
+        between runs.
+
+        Parameters
+        ----------
+        d_weights : array_like
+            The new destroy operator weights.
+        r_weights : array_like
+            The new repair operator weights.
+        """
+        self._d_selector.set_weights(d_weights)
+        self._r_selector.set_weights(r_weights)
+
+    def select(self, rnd, best, current):
+        return self._d_selector.select(rnd), self._r_selector.select(rnd)
+
+    def update(self, d_idx, r_idx, outcome, d_cost=1., r_cost=1.):
+        score = self._scores[outcome]
+
+        self._d_selector.update(d_idx, self._decay * self._d_selector[d_idx]
+                                + (1 - self._decay) * (score / d_cost))
+
+        self._r_selector.update(r_idx, self._decay * self._r_selector[r_idx]
+                                + (1 - self._decay) * (score / r_cost))
+
@@ -0,0 +1,126 @@
+import numpy as np
+
+from .OperatorSelectionScheme import OperatorSelectionScheme
+from .validate_scores import validate_scores
+from ..OperatorSelector import OperatorSelector
+
+
+class SegmentedRouletteWheel(OperatorSelectionScheme):
+
+    def __init__(self, scores, reaction, segment_length, num_destroy,
+                 num_repair):
+        """
+        Segment-based roulette wheel selection, as in Ropke and Pisinger
+        (2006). Operators are selected with probability proportional to their
+        weights, but the weights are only updated at the end of every segment
+        of ``segment_length`` iterations. Over a segment, the scores of the
+        outcomes are summed per operator. At its end, the weight of every
+        operator applied in the segment is updated as
+
+        ``weight = (1 - reaction) * weight + reaction * score_sum / count``
+
+        where ``count`` is the number of times the operator was applied.
+
+        Parameters
+        ----------
+        scores : array_like
+            A list of four non-negative elements, representing the scores when
+            the candidate solution results in a new global best (idx 0), is
+            better than the current solution (idx 1), the solution is accepted
+            (idx 2), or rejected (idx 3).
+        reaction : float
+            The reaction factor, in the unit interval [0, 1]. This controls
+            how quickly the weights react to the scores of a segment.
+        segment_length : int
+            The number of iterations in a segment.
+        num_destroy : int
+            The number of destroy operators.
+        num_repair : int
+            The number of repair operators.
+
+        References
+        ----------
+        - Ropke, S., and Pisinger, D. (2006). An Adaptive Large Neighborhood
+          Search Heuristic for the Pickup and Delivery Problem with Time
+          Windows. *Transportation Science*, 40 (4): 455-472.
+        """
+        super().__init__(num_destroy, num_repair)
+
+        if not (0 <= reaction <= 1):
+            raise ValueError("Reaction factor outside unit interval is not"
+                             " understood.")
+
+        if segment_length < 1:
+            raise ValueError("Segment length must be at least one.")
+
+        self._scores = validate_scores(scores)
+        self._reaction = reaction
+        self._segment_length = segment_length
+
+        self._selectors = [OperatorSelector(np.ones(num_destroy)),
+                           OperatorSelector(np.ones(num_repair))]
+
+        self._iteration = 0
+        self._reset_segment()
+
+    @property
+    def scores(self):
+        return self._scores
+
+    @property
+    def reaction(self):
+        return self._reaction
+
+    @property
+    def segment_length(self):
+        return self._segment_length
+
+    @property
+    def destroy_weights(self):
+        return self._selectors[0].weights
+
+    @property
+    def repair_weights(self):
+        return self._selectors[1].weights
+
+    def select(self, rnd, best, current):
+        return self._selectors[0].select(rnd), self._selectors[1].select(rnd)
+
+    def update(self, d_idx, r_idx, outcome, d_cost=1., r_cost=1.):
+        score = self._scores[outcome]
+
+        self._segment_scores[0][d_idx] += score / d_cost
+        self._segment_counts[0][d_idx] += 1
+
+        self._segment_scores[1][r_idx] += score / r_cost
+        self._segment_counts[1][r_idx] += 1
+
+        self._iteration += 1
+
+        if self._iteration % self._segment_length == 0:
+            self._end_segment()
+
+    def _end_segment(self):
+        """
+        Updates the weights from the scores of the segment that just ended,
+        and starts a new segment.
+        """
+        for selector, scores, counts in zip(self._selectors,
+                                            self._segment_scores,
+                                            self._segment_counts):
+            weights = selector.weights
+
+            for idx, count in enumerate(counts):
+                if count > 0:
+                    weights[idx] = (1 - self._reaction) * weights[idx] \
+                        + self._reaction * scores[idx] / count
+
+            selector.set_weights(weights)
+
+        self._reset_segment()
+
+    def _reset_segment(self):
+        self._segment_scores = [[0.] * self.num_destroy,
+                                [0.] * self.num_repair]
+        self._segment_counts = [[0] * self.num_destroy,
+                                [0] * self.num_repair]
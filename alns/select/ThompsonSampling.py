@@ -0,0 +1,35 @@
+import numpy as np
+
+from .BanditScheme import BanditScheme
+
+
+class ThompsonSampling(BanditScheme):
+
+    def __init__(self, scores, num_destroy, num_repair):
+        """
+        Thompson sampling keeps a Beta(1 + rewards, 1 + failures) posterior on
+        the success probability of each operator, starting from a uniform
+        prior. Each iteration, a probability is drawn from every posterior,
+        and the operator with the largest draw is selected. Rewards are
+        fractional successes, as in Agrawal and Goyal (2012). See
+        ``BanditScheme`` for the parameters.
+
+        References
+        ----------
+        - Agrawal, S., and Goyal, N. Analysis of Thompson sampling for the
+          multi-armed bandit problem. *Proceedings of the 25th Annual
+          Conference on Learning Theory* (2012): 39.1-39.26.
+        """
+        super().__init__(scores, num_destroy, num_repair)
+
+    def _update_arm(self, arms, idx, reward):
+        # Rewards divided by a relative cost may exceed one, but a success
+        # cannot count more than once.
+        super()._update_arm(arms, idx, min(reward, 1.))
+
+    def _select_arm(self, rnd, arms):
+        counts = np.array(self._counts[arms])
+        sums = np.array(self._sums[arms])
+
+        draws = rnd.beta(1 + sums, 1 + counts - sums)
+        return int(np.argmax(draws))
@@ -0,0 +1,55 @@
+import math
+
+from .BanditScheme import BanditScheme
+
+
+class UCB1(BanditScheme):
+
+    def __init__(self, scores, num_destroy, num_repair, exploration=1.):
+        """
+        The UCB1 bandit selects the operator with the highest upper confidence
+        bound on its mean reward, as
+
+        ``mean + exploration * sqrt(2 * ln(t) / n)``
+
+        where ``n`` is the number of times the operator was applied, and ``t``
+        the number of iterations. Every operator is first applied once. The
+        selection is deterministic. See ``BanditScheme`` for the parameters.
+
+        Parameters
+        ----------
+        exploration : float
+            Factor of the confidence term. Larger values explore more. Default
+            one, as in Auer et al. (2002).
+
+        References
+        ----------
+        - Auer, P., Cesa-Bianchi, N., and Fischer, P. Finite-time analysis of
+          the multiarmed bandit problem. *Machine Learning* (2002) 47 (2):
+          235-256.
+        """
+        super().__init__(scores, num_destroy, num_repair)
+
+        if exploration < 0:
+            raise ValueError("Exploration factor must be non-negative.")
+
+        self._exploration = exploration
+
+    @property
+    def exploration(self):
+        return self._exploration
+
+    def _select_arm(self, rnd, arms):
+        counts = self._counts[arms]
+        sums = self._sums[arms]
+
+        if 0 in counts:
+            return counts.index(0)
+
+        log_t = math.log(self._num_updates)
+
+        bounds = [total / count
+                  + self._exploration * math.sqrt(2 * log_t / count)
+                  for total, count in zip(sums, counts)]
+
+        return bounds.index(max(bounds))
@@ -0,0 +1,91 @@
+import numpy.random as rnd
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from alns.select.EpsilonGreedy import EpsilonGreedy
+from alns.select.ThompsonSampling import ThompsonSampling
+from alns.select.UCB1 import UCB1
+from alns.tests.states import Zero
+
+BANDITS = [UCB1, ThompsonSampling, EpsilonGreedy]
+
+
+def learn(bandit, good_destroy, good_repair, iterations=500, seed=1):
+    """
+    Helper method that runs the bandit against operators of which only the
+    given pair results in a new best solution, and returns the number of
+    times that pair was selected.
+    """
+    rnd_state = rnd.default_rng(seed)
+    num_good = 0
+
+    for _ in range(iterations):
+        d_idx, r_idx = bandit.select(rnd_state, Zero(), Zero())
+
+        is_good = d_idx == good_destroy and r_idx == good_repair
+        bandit.update(d_idx, r_idx, 0 if is_good else 3)
+
+        num_good += is_good
+
+    return num_good
+
+
+def test_raises_invalid_scores():
+    """
+    Bandits need four non-negative scores, of which at least one positive.
+    """
+    for bandit_type in BANDITS:
+        with assert_raises(ValueError):
+            bandit_type([0, 0, 0, 0], 2, 2)
+
+        with assert_raises(ValueError):
+            bandit_type([1, 1, 1], 2, 2)
+
+        bandit_type([1, 0, 0, 0], 2, 2)
+
+
+def test_raises_invalid_parameters():
+    """
+    The exploration factor should be non-negative, and epsilon should be a
+    probability.
+    """
+    with assert_raises(ValueError):
+        UCB1([1, 1, 1, 0], 2, 2, exploration=-1)
+
+    with assert_raises(ValueError):
+        EpsilonGreedy([1, 1, 1, 0], 2, 2, epsilon=1.5)
+
+
+def test_ucb1_plays_every_operator_first():
+    """
+    UCB1 should apply every operator once, before comparing their bounds.
+    """
+    ucb1 = UCB1([1, 1, 1, 0], 3, 2)
+
+    for expected in [(0, 0), (1, 1), (2, 0)]:
+        d_idx, r_idx = ucb1.select(rnd.default_rng(), Zero(), Zero())
+        assert_equal(d_idx, expected[0])
+
+        ucb1.update(d_idx, r_idx, 3)
+
+
+def test_bandits_find_productive_operator():
+    """
+    All bandits should mostly select the one destroy operator that results in
+    new best solutions, out of several.
+    """
+    for bandit in [UCB1([1, 0, 0, 0], 5, 1, exploration=0.5),
+                   ThompsonSampling([1, 0, 0, 0], 5, 1),
+                   EpsilonGreedy([1, 0, 0, 0], 5, 1)]:
+        num_good = learn(bandit, 3, 0)
+        assert_(num_good > 400, type(bandit).__name__)
+
+
+def test_thompson_sampling_is_reproducible():
+    """
+    Thompson sampling draws from the passed-in generator, so a fixed seed
+    should give the same selections.
+    """
+    first = learn(ThompsonSampling([1, 0, 0, 0], 5, 1), 3, 0, seed=2)
+    second = learn(ThompsonSampling([1, 0, 0, 0], 5, 1), 3, 0, seed=2)
+
+    assert_equal(first, second)
@@ -0,0 +1,153 @@
+import numpy as np
+import numpy.random as rnd
+from numpy.testing import assert_, assert_almost_equal, assert_equal, \
+    assert_raises
+
+from alns.select.CoupledRouletteWheel import CoupledRouletteWheel
+from alns.select.RouletteWheel import RouletteWheel
+from alns.select.SegmentedRouletteWheel import SegmentedRouletteWheel
+from alns.tests.states import Zero
+
+
+def test_raises_invalid_parameters():
+    """
+    The roulette wheel needs four non-negative scores, a decay in the unit
+    interval, and at least one operator of each type.
+    """
+    with assert_raises(ValueError):
+        RouletteWheel([1, 1, 1], 0.5, 2, 2)
+
+    with assert_raises(ValueError):
+        RouletteWheel([1, 1, 1, -1], 0.5, 2, 2)
+
+    with assert_raises(ValueError):
+        RouletteWheel([1, 1, 1, 1], 1.5, 2, 2)
+
+    with assert_raises(ValueError):
+        RouletteWheel([1, 1, 1, 1], 0.5, 0, 2)
+
+    RouletteWheel([1, 1, 1, 0], 0, 1, 1)        # boundaries should be fine
+
+
+def test_update_is_convex_combination():
+    """
+    The weights of the applied operators should be updated as convex
+    combinations of their weight and the outcome's score.
+    """
+    wheel = RouletteWheel([5, 3, 2, 1], 0.8, 2, 3)
+
+    wheel.update(1, 2, 0)
+
+    assert_almost_equal(wheel.destroy_weights, [1, 0.8 + 0.2 * 5])
+    assert_almost_equal(wheel.repair_weights, [1, 1, 0.8 + 0.2 * 5])
+
+
+def test_update_divides_score_by_cost():
+    """
+    Relative operator costs should divide the scores.
+    """
+    wheel = RouletteWheel([5, 3, 2, 1], 0.5, 1, 1)
+
+    wheel.update(0, 0, 1, 2, 0.5)
+
+    assert_almost_equal(wheel.destroy_weights, [0.5 + 0.5 * 3 / 2])
+    assert_almost_equal(wheel.repair_weights, [0.5 + 0.5 * 3 / 0.5])
+
+
+def test_selects_in_proportion_to_weights():
+    """
+    Operators with zero weight should never be selected.
+    """
+    wheel = RouletteWheel([1, 1, 1, 0], 0, 3, 2)
+
+    wheel.set_weights([0, 1, 0], [1, 0])
+
+    for _ in range(100):
+        assert_equal(wheel.select(rnd.default_rng(), Zero(), Zero()), (1, 0))
+
+
+def test_segmented_raises_invalid_parameters():
+    """
+    The reaction factor should be in the unit interval, and a segment should
+    have at least one iteration.
+    """
+    with assert_raises(ValueError):
+        SegmentedRouletteWheel([1, 1, 1, 1], 1.5, 10, 2, 2)
+
+    with assert_raises(ValueError):
+        SegmentedRouletteWheel([1, 1, 1, 1], 0.5, 0, 2, 2)
+
+    SegmentedRouletteWheel([1, 1, 1, 1], 1, 1, 2, 2)
+
+
+def test_segmented_updates_at_segment_end():
+    """
+    The weights should only change at the end of a segment, to the average
+    score of each applied operator, weighed by the reaction factor.
+    """
+    wheel = SegmentedRouletteWheel([33, 9, 13, 0], 0.5, 3, 2, 2)
+
+    wheel.update(0, 0, 0)
+    wheel.update(0, 1, 3)
+
+    assert_equal(wheel.destroy_weights, np.ones(2))
+    assert_equal(wheel.repair_weights, np.ones(2))
+
+    wheel.update(0, 1, 2)
+
+    assert_almost_equal(wheel.destroy_weights, [0.5 + 0.5 * 46 / 3, 1])
+    assert_almost_equal(wheel.repair_weights, [0.5 + 0.5 * 33,
+                                               0.5 + 0.5 * 13 / 2])
+
+    # The next segment starts afresh.
+    wheel.update(1, 0, 3)
+    wheel.update(1, 0, 3)
+    wheel.update(1, 0, 3)
+
+    assert_almost_equal(wheel.destroy_weights, [0.5 + 0.5 * 46 / 3, 0.5])
+    assert_(wheel.repair_weights[0] < 17)
+
+
+def test_coupled_raises_invalid_parameters():
+    """
+    The coupled roulette wheel has the same requirements as the roulette
+    wheel.
+    """
+    with assert_raises(ValueError):
+        CoupledRouletteWheel([1, 1, 1], 0.5, 2, 2)
+
+    with assert_raises(ValueError):
+        CoupledRouletteWheel([1, 1, 1, 1], 1.5, 2, 2)
+
+    CoupledRouletteWheel([1, 1, 1, 0], 1, 1, 1)
+
+
+def test_coupled_updates_pair_weight():
+    """
+    Only the weight of the applied pair should be updated, not those of other
+    pairs with the same destroy or repair operator.
+    """
+    wheel = CoupledRouletteWheel([5, 3, 2, 1], 0.8, 2, 3)
+
+    wheel.update(1, 2, 0)
+
+    expected = np.ones((2, 3))
+    expected[1, 2] = 0.8 + 0.2 * 5
+
+    assert_almost_equal(wheel.pair_weights, expected)
+
+
+def test_coupled_selects_pairs():
+    """
+    The coupled roulette wheel should select pairs in proportion to their
+    weights.
+    """
+    wheel = CoupledRouletteWheel([1, 1, 1, 0], 0, 3, 2)
+
+    for d_idx in range(3):
+        for r_idx in range(2):
+            outcome = 0 if (d_idx, r_idx) == (2, 0) else 3
+            wheel.update(d_idx, r_idx, outcome)
+
+    for _ in range(100):
+        assert_equal(wheel.select(rnd.default_rng(), Zero(), Zero()), (2, 0))
@@ -0,0 +1,26 @@
+def validate_scores(scores):
+    """
+    Validates the passed-in outcome scores, and returns these as a list of
+    floats. Only the first four scores are used.
+
+    Parameters
+    ----------
+    scores : array_like
+        A list of four non-negative elements, representing the scores when the
+        candidate solution results in a new global best (idx 0), is better
+        than the current solution (idx 1), the solution is accepted (idx 2),
+        or rejected (idx 3).
+
+    Returns
+    -------
+    list
+        The first four scores, as floats.
+    """
+    if len(scores) < 4:
+        raise ValueError("Unsupported number of scores: expected 4,"
+                         " found {0}.".format(len(scores)))
+
+    if any(score < 0 for score in scores):
+        raise ValueError("Negative scores are not understood.")
+
+    return [float(score) for score in scores[:4]]
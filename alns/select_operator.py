@@ -1,10 +1,11 @@
-import numpy as np
+from .OperatorSelector import OperatorSelector
 
 
 def select_operator(operators, weights, rnd_state):
     """
     Selects an operator from the list of operators, using a distribution
-    inferred from the given weights.
+    inferred from the given weights. This builds a new ``OperatorSelector``
+    on every call: use that class directly when selecting repeatedly.
 
     Parameters
     ----------
@@ -12,13 +13,12 @@ def select_operator(operators, weights, rnd_state):
         The list of operators.
     weights : array_like
         The operator weights.
-    rnd_state : rnd.RandomState
-        Random state to draw the choice from.
+    rnd_state : Generator
+        Random number generator to draw the choice from.
 
     Returns
     -------
     int
         Index into the operator array of the selected method.
     """
-    return rnd_state.choice(np.arange(0, len(operators)),
-                            p=weights / np.sum(weights))
+    return OperatorSelector(weights).select(rnd_state)
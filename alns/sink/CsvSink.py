@@ -0,0 +1,34 @@
+import csv
+
+from .TraceSink import FIELDS, TraceSink, to_trace
+
+
+class CsvSink(TraceSink):
+
+    def __init__(self, path, chunk_size=10000, max_chunks=4):
+        """
+        Streams the trace to a CSV file, with a header row of the field names,
+        and a row for every record. See ``TraceSink`` for the parameters.
+        """
+        super().__init__(path, chunk_size, max_chunks)
+
+    def _prepare(self):
+        with open(self._path, "w", newline="") as file:
+            csv.writer(file).writerow(FIELDS)
+
+    def _write_chunk(self, records):
+        with open(self._path, "a", newline="") as file:
+            csv.writer(file).writerows(records)
+
+    @staticmethod
+    def read(path):
+        with open(path, newline="") as file:
+            reader = csv.reader(file)
+            next(reader)                        # skips the header row
+
+            rows = list(reader)
+
+        if not rows:
+            return to_trace([] for _ in FIELDS)
+
+        return to_trace(zip(*rows))
@@ -0,0 +1,32 @@
+import json
+
+from .TraceSink import FIELDS, TraceSink, to_trace
+
+
+class JsonlSink(TraceSink):
+
+    def __init__(self, path, chunk_size=10000, max_chunks=4):
+        """
+        Streams the trace to a JSON lines file, with a JSON object for every
+        record, mapping the field names to their values. See ``TraceSink``
+        for the parameters.
+        """
+        super().__init__(path, chunk_size, max_chunks)
+
+    def _prepare(self):
+        open(self._path, "w").close()
+
+    def _write_chunk(self, records):
+        lines = [json.dumps(dict(zip(FIELDS, record))) + "\n"
+                 for record in records]
+
+        with open(self._path, "a") as file:
+            file.writelines(lines)
+
+    @staticmethod
+    def read(path):
+        with open(path) as file:
+            records = [json.loads(line) for line in file if line.strip()]
+
+        return to_trace([record[field] for record in records]
+                        for field in FIELDS)
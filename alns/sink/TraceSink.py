@@ -0,0 +1,273 @@
+import queue
+import threading
+import time
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+# Fields of a trace record, in order, and the types they are read back as.
+FIELDS = ("iteration", "current", "best", "destroy", "repair", "outcome",
+          "elapsed")
+DTYPES = (np.int64, np.float64, np.float64, np.str_, np.str_, np.int64,
+          np.float64)
+
+# Outcome of the record of the initial solution, which is not the outcome of
+# any operators.
+NO_OUTCOME = -1
+
+
+def to_trace(columns):
+    """
+    Converts the passed-in columns of trace values to a trace.
+
+    Parameters
+    ----------
+    columns : iterable
+        One sequence of values for each field, in the order of ``FIELDS``.
+
+    Returns
+    -------
+    dict
+        Maps each field name to a NumPy array of its values.
+    """
+    return {field: np.asarray(column, dtype=dtype)
+            for field, dtype, column in zip(FIELDS, DTYPES, columns)}
+
+
+class TraceSink(ABC):
+
+    def __init__(self, path, chunk_size=10000, max_chunks=4):
+        """
+        Base class from which to implement a trace sink. A sink streams the
+        per-iteration trace of an ALNS run to disk, rather than holding it in
+        memory: for every iteration, a record of the iteration number, the
+        current and best objective values, the names of the destroy and repair
+        operators, the outcome (a ``WeightIndex``), and the elapsed time since
+        the sink was opened. Like the statistics, the trace counts the initial
+        solution as iteration zero, when its record is written.
+
+        Records are buffered, and handed to a background thread in chunks of
+        ``chunk_size`` records, which writes them to disk. Writing a record
+        thus does not block on I/O, unless the writer falls ``max_chunks``
+        chunks behind. It then blocks until a chunk is written, so that memory
+        use stays bounded.
+
+        Parameters
+        ----------
+        path : str
+            Path to write the trace to.
+        chunk_size : int
+            Number of records written to disk at once. Default 10000.
+        max_chunks : int
+            Number of chunks that may wait to be written to disk. Default 4.
+        """
+        if chunk_size < 1:
+            raise ValueError("Expected a chunk size of at least one.")
+
+        if max_chunks < 1:
+            raise ValueError("Expected at least one chunk to be queued.")
+
+        self._path = path
+        self._chunk_size = chunk_size
+        self._max_chunks = max_chunks
+
+        self._records = []
+        self._num_records = 0
+        self._num_iterations = 0
+        self._start = None
+
+        self._chunks = None
+        self._thread = None
+        self._error = None
+
+    @property
+    def path(self):
+        """
+        Returns the path the trace is written to.
+
+        Returns
+        -------
+        str
+            The trace path.
+        """
+        return self._path
+
+    @property
+    def num_records(self):
+        """
+        Returns the number of records written to this sink. Records may not
+        all be on disk until the sink is closed.
+
+        Returns
+        -------
+        int
+            The number of records.
+        """
+        return self._num_records
+
+    def open(self):
+        """
+        Opens the sink, and starts the thread writing to disk. Any trace
+        previously written to the path is overwritten. The elapsed time of
+        records is measured from here.
+        """
+        if self._thread is not None:
+            raise RuntimeError("Sink is already open.")
+
+        self._prepare()
+
+        self._records = []
+        self._num_records = 0
+        self._num_iterations = 0
+
+        self._start = time.perf_counter()
+        self._chunks = queue.Queue(self._max_chunks)
+        self._thread = threading.Thread(target=self._flush_chunks, daemon=True)
+        self._thread.start()
+
+    def write_initial(self, objective):
+        """
+        Writes the record of the initial solution, at iteration zero, before
+        any other records. It has no operators, so the operator names are
+        empty, and its outcome is ``NO_OUTCOME``.
+
+        Parameters
+        ----------
+        objective : float
+            Objective value of the initial solution.
+        """
+        self._append((0, float(objective), float(objective), "", "",
+                      NO_OUTCOME, time.perf_counter() - self._start))
+
+    def write(self, current, best, destroy, repair, outcome):
+        """
+        Writes the record of an iteration to the sink. The iteration number,
+        counting from one, and the elapsed time are set by the sink.
+
+        Parameters
+        ----------
+        current : float
+            Objective value of the current solution.
+        best : float
+            Objective value of the best solution.
+        destroy : str
+            Name of the destroy operator.
+        repair : str
+            Name of the repair operator.
+        outcome : int
+            Outcome of the iteration, as a ``WeightIndex``.
+        """
+        self._num_iterations += 1
+        self._append((self._num_iterations, float(current), float(best),
+                      destroy, repair, int(outcome),
+                      time.perf_counter() - self._start))
+
+    def close(self):
+        """
+        Closes the sink, after writing all remaining records to disk.
+
+        Raises
+        ------
+        Exception
+            When writing to disk failed, the error raised by the writer.
+        """
+        if self._thread is None:
+            return
+
+        if self._records:
+            self._chunks.put(self._records)
+            self._records = []
+
+        self._chunks.put(None)
+        self._thread.join()
+        self._thread = None
+
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def load(self):
+        """
+        Loads the trace written to this sink from disk.
+
+        Returns
+        -------
+        dict
+            Maps each field name to a NumPy array of its values. See
+            ``FIELDS`` for the field names.
+        """
+        return self.read(self._path)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _append(self, record):
+        """
+        Appends a record to the buffer, and hands the buffer to the writer
+        once it holds a full chunk.
+        """
+        self._num_records += 1
+        self._records.append(record)
+
+        if len(self._records) == self._chunk_size:
+            self._chunks.put(self._records)
+            self._records = []
+
+    def _flush_chunks(self):
+        """
+        Writes the queued chunks to disk, until the sink is closed. Runs on the
+        background thread.
+        """
+        while True:
+            chunk = self._chunks.get()
+
+            if chunk is None:
+                return
+
+            if self._error is None:
+                try:
+                    self._write_chunk(chunk)
+                except Exception as error:  # pylint: disable=broad-except
+                    # Raised from close, on the thread that owns the sink.
+                    self._error = error
+
+    def _prepare(self):
+        """
+        Prepares the path for writing, e.g. by writing a file header. Called
+        when the sink is opened.
+        """
+        pass
+
+    @abstractmethod
+    def _write_chunk(self, records):
+        """
+        Writes a chunk of records to disk. Called on the background thread.
+
+        Parameters
+        ----------
+        records : list
+            List of record tuples, with values in the order of ``FIELDS``.
+        """
+        return NotImplemented
+
+    @staticmethod
+    @abstractmethod
+    def read(path):
+        """
+        Reads a trace from disk, as written by a sink of this type.
+
+        Parameters
+        ----------
+        path : str
+            Path the trace was written to.
+
+        Returns
+        -------
+        dict
+            Maps each field name to a NumPy array of its values.
+        """
+        return NotImplemented
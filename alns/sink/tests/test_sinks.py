@@ -0,0 +1,204 @@
+import os
+import threading
+
+import numpy as np
+import pytest
+from numpy.testing import assert_, assert_almost_equal, assert_equal, \
+    assert_raises
+
+from alns.WeigthIndex import WeightIndex
+from alns.sink.CsvSink import CsvSink
+from alns.sink.JsonlSink import JsonlSink
+from alns.sink.NpzSink import NpzSink
+from alns.sink.TraceSink import FIELDS, NO_OUTCOME
+
+SINKS = [CsvSink, JsonlSink, NpzSink]
+
+
+def get_path(sink_type, tmp_path):
+    """
+    Helper method, returning a path to write a trace of the given type to.
+    """
+    if sink_type is NpzSink:
+        return str(tmp_path / "trace")
+
+    return str(tmp_path / "trace.txt")
+
+
+def write_records(sink, num_records):
+    """
+    Helper method, writing records with decreasing objective values.
+    """
+    for record in range(num_records):
+        sink.write(1.5 * (num_records - record), 1.5, "destroy",
+                   "repair_{0}".format(record % 3), record % 4)
+
+
+@pytest.mark.parametrize("sink_type", SINKS)
+def test_raises_invalid_chunk_size(sink_type, tmp_path):
+    """
+    Chunks must hold at least one record.
+    """
+    with assert_raises(ValueError):
+        sink_type(get_path(sink_type, tmp_path), chunk_size=0)
+
+    sink_type(get_path(sink_type, tmp_path), chunk_size=1)
+
+
+@pytest.mark.parametrize("sink_type", SINKS)
+def test_raises_invalid_max_chunks(sink_type, tmp_path):
+    """
+    At least one chunk must be allowed to wait for the writer.
+    """
+    with assert_raises(ValueError):
+        sink_type(get_path(sink_type, tmp_path), max_chunks=0)
+
+    sink_type(get_path(sink_type, tmp_path), max_chunks=1)
+
+
+@pytest.mark.parametrize("sink_type", SINKS)
+def test_round_trip(sink_type, tmp_path):
+    """
+    Records written to a sink should be read back as they were written, over
+    several chunks and a partial last chunk.
+    """
+    with sink_type(get_path(sink_type, tmp_path), chunk_size=10) as sink:
+        write_records(sink, 25)
+
+    assert_equal(sink.num_records, 25)
+
+    trace = sink.load()
+
+    assert_equal(set(trace.keys()), set(FIELDS))
+    assert_equal(trace["iteration"], np.arange(1, 26))
+    assert_almost_equal(trace["current"], 1.5 * np.arange(25, 0, -1))
+    assert_almost_equal(trace["best"], np.full(25, 1.5))
+
+    assert_(np.all(trace["destroy"] == "destroy"))
+    assert_equal(trace["repair"][:4],
+                 ["repair_0", "repair_1", "repair_2", "repair_0"])
+
+    assert_equal(trace["outcome"], np.arange(25) % 4)
+    assert_(np.all(np.diff(trace["elapsed"]) >= 0))
+
+
+@pytest.mark.parametrize("sink_type", SINKS)
+def test_initial_record(sink_type, tmp_path):
+    """
+    The initial solution should be recorded as iteration zero, without
+    operators, and the iterations after it should count from one.
+    """
+    with sink_type(get_path(sink_type, tmp_path), chunk_size=2) as sink:
+        sink.write_initial(3)
+        write_records(sink, 4)
+
+    assert_equal(sink.num_records, 5)
+
+    trace = sink.load()
+
+    assert_equal(trace["iteration"], np.arange(5))
+    assert_almost_equal(trace["current"][0], 3)
+    assert_almost_equal(trace["best"][0], 3)
+    assert_equal(trace["destroy"][0], "")
+    assert_equal(trace["repair"][0], "")
+    assert_equal(trace["outcome"][0], NO_OUTCOME)
+
+
+@pytest.mark.parametrize("sink_type", SINKS)
+def test_empty_trace(sink_type, tmp_path):
+    """
+    A sink without records should read back as an empty trace.
+    """
+    with sink_type(get_path(sink_type, tmp_path)) as sink:
+        pass
+
+    trace = sink.load()
+
+    for field in FIELDS:
+        assert_equal(len(trace[field]), 0)
+
+
+@pytest.mark.parametrize("sink_type", SINKS)
+def test_reopening_overwrites_trace(sink_type, tmp_path):
+    """
+    Opening a sink again should start a new trace, rather than append to the
+    trace written earlier.
+    """
+    sink = sink_type(get_path(sink_type, tmp_path), chunk_size=3)
+
+    with sink:
+        write_records(sink, 10)
+
+    with sink:
+        write_records(sink, 4)
+
+    assert_equal(sink.load()["iteration"], np.arange(1, 5))
+
+
+@pytest.mark.parametrize("sink_type", SINKS)
+def test_accepts_weight_index(sink_type, tmp_path):
+    """
+    Outcomes are passed as weight indices by ALNS, and should be stored as
+    plain integers.
+    """
+    with sink_type(get_path(sink_type, tmp_path)) as sink:
+        sink.write(np.float64(1), np.int64(1), "d", "r", WeightIndex.IS_BEST)
+
+    assert_equal(sink.load()["outcome"], [0])
+
+
+def test_write_errors_raised_on_close(tmp_path):
+    """
+    Errors raised on the background thread should be raised when the sink is
+    closed.
+    """
+    sink = CsvSink(str(tmp_path / "trace.csv"), chunk_size=1)
+    sink.open()
+
+    os.remove(sink.path)
+    os.mkdir(sink.path)                     # cannot append to a directory
+
+    sink.write(1, 1, "d", "r", 0)
+
+    with assert_raises(IsADirectoryError):
+        sink.close()
+
+
+class BlockingSink(CsvSink):
+    """
+    Helper sink, whose writer waits until it is released.
+    """
+
+    def __init__(self, path, chunk_size, max_chunks):
+        super().__init__(path, chunk_size, max_chunks)
+        self.released = threading.Event()
+
+    def _write_chunk(self, records):
+        self.released.wait()
+        super()._write_chunk(records)
+
+
+def test_slow_writer_blocks_writes(tmp_path):
+    """
+    When the writer falls behind, no more than the maximum number of chunks
+    should wait for it, and writing should block until it catches up.
+    """
+    sink = BlockingSink(str(tmp_path / "trace.csv"), chunk_size=2,
+                        max_chunks=2)
+    sink.open()
+
+    # One chunk is taken by the writer, and two more wait for it.
+    write_records(sink, 6)
+
+    writer = threading.Thread(target=write_records, args=(sink, 2))
+    writer.start()
+    writer.join(timeout=0.1)
+
+    assert_(writer.is_alive())
+    assert_(sink._chunks.qsize() <= 2)  # pylint: disable=protected-access
+
+    sink.released.set()
+    writer.join()
+    sink.close()
+
+    assert_equal(len(sink.load()["iteration"]), 8)
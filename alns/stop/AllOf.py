@@ -0,0 +1,36 @@
+from .StoppingCriterion import StoppingCriterion
+
+
+class AllOf(StoppingCriterion):
+
+    def __init__(self, *criteria):
+        """
+        Stops when all of the passed-in stopping criteria say so. Every
+        criterion is evaluated at each call.
+
+        Parameters
+        ----------
+        criteria : StoppingCriterion
+            The stopping criteria to combine.
+        """
+        if len(criteria) == 0:
+            raise ValueError("Expected at least one stopping criterion.")
+
+        self._criteria = criteria
+
+    @property
+    def criteria(self):
+        return self._criteria
+
+    @property
+    def reason(self):
+        return " and ".join(criterion.reason for criterion in self.criteria)
+
+    def reset(self):
+        for criterion in self.criteria:
+            criterion.reset()
+
+    def __call__(self, rnd, best, current):
+        stops = [criterion(rnd, best, current) for criterion in self.criteria]
+
+        return all(stops)
@@ -0,0 +1,41 @@
+from .StoppingCriterion import StoppingCriterion
+
+
+class AnyOf(StoppingCriterion):
+
+    def __init__(self, *criteria):
+        """
+        Stops when any of the passed-in stopping criteria says so. Every
+        criterion is evaluated at each call, also after one of them stopped,
+        such that stateful criteria (e.g. ``NoImprovement``) stay up-to-date.
+
+        Parameters
+        ----------
+        criteria : StoppingCriterion
+            The stopping criteria to combine.
+        """
+        if len(criteria) == 0:
+            raise ValueError("Expected at least one stopping criterion.")
+
+        self._criteria = criteria
+        self._stopped = []
+
+    @property
+    def criteria(self):
+        return self._criteria
+
+    @property
+    def reason(self):
+        return ", ".join(criterion.reason for criterion in self._stopped)
+
+    def reset(self):
+        for criterion in self.criteria:
+            criterion.reset()
+
+        self._stopped = []
+
+    def __call__(self, rnd, best, current):
+        self._stopped = [criterion for criterion in self.criteria
+                         if criterion(rnd, best, current)]
+
+        return len(self._stopped) > 0
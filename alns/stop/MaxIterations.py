@@ -0,0 +1,31 @@
+from .StoppingCriterion import StoppingCriterion
+
+
+class MaxIterations(StoppingCriterion):
+
+    def __init__(self, max_iterations):
+        """
+        Stops after a fixed number of iterations.
+
+        Parameters
+        ----------
+        max_iterations : int
+            The maximum number of iterations.
+        """
+        if max_iterations < 0:
+            raise ValueError("Negative number of iterations.")
+
+        self._max_iterations = max_iterations
+        self._current_iteration = 0
+
+    @property
+    def max_iterations(self):
+        return self._max_iterations
+
+    def reset(self):
+        self._current_iteration = 0
+
+    def __call__(self, rnd, best, current):
+        self._current_iteration += 1
+
+        return self._current_iteration > self.max_iterations
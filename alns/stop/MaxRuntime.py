@@ -0,0 +1,37 @@
+import time
+
+from .StoppingCriterion import StoppingCriterion
+
+
+class MaxRuntime(StoppingCriterion):
+
+    def __init__(self, max_runtime):
+        """
+        Stops once the wall-clock time since the first evaluation of this
+        criterion in a run exceeds the given budget. The iteration that is running when
+        the budget runs out is completed, so the run can overshoot the budget
+        by about one iteration.
+
+        Parameters
+        ----------
+        max_runtime : float
+            The maximum runtime, in seconds.
+        """
+        if max_runtime < 0:
+            raise ValueError("Negative runtime is not understood.")
+
+        self._max_runtime = max_runtime
+        self._start_runtime = None
+
+    @property
+    def max_runtime(self):
+        return self._max_runtime
+
+    def reset(self):
+        self._start_runtime = None
+
+    def __call__(self, rnd, best, current):
+        if self._start_runtime is None:
+            self._start_runtime = time.perf_counter()
+
+        return time.perf_counter() - self._start_runtime > self.max_runtime
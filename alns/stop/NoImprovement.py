@@ -0,0 +1,39 @@
+from .StoppingCriterion import StoppingCriterion
+
+
+class NoImprovement(StoppingCriterion):
+
+    def __init__(self, max_iterations):
+        """
+        Stops when the best solution has not improved for the given number of
+        consecutive iterations.
+
+        Parameters
+        ----------
+        max_iterations : int
+            The maximum number of iterations without improving the best
+            solution.
+        """
+        if max_iterations < 0:
+            raise ValueError("Negative number of iterations.")
+
+        self._max_iterations = max_iterations
+        self._target = None
+        self._counter = 0
+
+    @property
+    def max_iterations(self):
+        return self._max_iterations
+
+    def reset(self):
+        self._target = None
+        self._counter = 0
+
+    def __call__(self, rnd, best, current):
+        if self._target is None or best.objective() < self._target:
+            self._target = best.objective()
+            self._counter = 0
+        else:
+            self._counter += 1
+
+        return self._counter >= self.max_iterations
@@ -0,0 +1,54 @@
+from abc import ABC, abstractmethod
+
+from ..State import State  # pylint: disable=unused-import
+from numpy.random import Generator  # pylint: disable=unused-import
+
+
+class StoppingCriterion(ABC):
+    """
+    Base class from which to implement a stopping criterion.
+    """
+
+    @abstractmethod
+    def __call__(self, rnd, best, current):
+        """
+        Determines whether to stop the ALNS run. This is evaluated once before
+        every iteration.
+
+        Parameters
+        ----------
+        rnd : Generator
+            May be used to draw random numbers from.
+        best : State
+            The best solution state observed so far.
+        current : State
+            The current solution state.
+
+        Returns
+        -------
+        bool
+            Whether to stop iterating (True), or not (False).
+        """
+        return NotImplemented
+
+    def reset(self):
+        """
+        Resets the state this criterion keeps, e.g. the number of iterations
+        it has counted. ``ALNS.iterate`` calls this when a run starts, so that
+        the same criterion can be passed to several runs. Stateless criteria
+        need not override this.
+        """
+        pass
+
+    @property
+    def reason(self):
+        """
+        Short description of why this criterion stopped the run. This is
+        reported as the stopping reason on the ALNS result.
+
+        Returns
+        -------
+        str
+            The stopping reason, by default the name of the criterion.
+        """
+        return type(self).__name__
@@ -0,0 +1,23 @@
+from .StoppingCriterion import StoppingCriterion
+
+
+class TargetObjective(StoppingCriterion):
+
+    def __init__(self, target):
+        """
+        Stops once the best solution reaches the target objective value, that
+        is, when its objective is smaller than or equal to the target.
+
+        Parameters
+        ----------
+        target : float
+            The target objective value.
+        """
+        self._target = target
+
+    @property
+    def target(self):
+        return self._target
+
+    def __call__(self, rnd, best, current):
+        return best.objective() <= self.target
@@ -0,0 +1,80 @@
+import numpy.random as rnd
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from alns.stop.AllOf import AllOf
+from alns.stop.AnyOf import AnyOf
+from alns.stop.MaxIterations import MaxIterations
+from alns.stop.NoImprovement import NoImprovement
+from alns.stop.TargetObjective import TargetObjective
+from alns.tests.states import One, Zero
+
+
+def test_raises_no_criteria():
+    """
+    Combining zero criteria is not understood.
+    """
+    with assert_raises(ValueError):
+        AnyOf()
+
+    with assert_raises(ValueError):
+        AllOf()
+
+
+def test_any_of_stops_on_first():
+    """
+    AnyOf should stop as soon as one of its criteria stops, and report that
+    criterion as the reason.
+    """
+    stop = AnyOf(MaxIterations(1), TargetObjective(0))
+
+    assert_(not stop(rnd.RandomState(), One(), One()))
+    assert_(stop(rnd.RandomState(), One(), One()))
+    assert_equal(stop.reason, "MaxIterations")
+
+    stop = AnyOf(MaxIterations(10), TargetObjective(0))
+
+    assert_(stop(rnd.RandomState(), Zero(), Zero()))
+    assert_equal(stop.reason, "TargetObjective")
+
+
+def test_any_of_evaluates_all_criteria():
+    """
+    AnyOf should evaluate all its criteria every call, so stateful criteria
+    are kept up-to-date.
+    """
+    no_improvement = NoImprovement(2)
+    stop = AnyOf(TargetObjective(1), no_improvement)
+
+    for _ in range(2):
+        assert_(stop(rnd.RandomState(), One(), One()))
+
+    assert_(no_improvement(rnd.RandomState(), One(), One()))
+
+
+def test_all_of_stops_on_all():
+    """
+    AllOf should only stop once all of its criteria stop.
+    """
+    stop = AllOf(MaxIterations(1), TargetObjective(0))
+
+    assert_(not stop(rnd.RandomState(), One(), One()))
+    assert_(not stop(rnd.RandomState(), One(), One()))
+    assert_(stop(rnd.RandomState(), Zero(), Zero()))
+    assert_equal(stop.reason, "MaxIterations and TargetObjective")
+
+
+def test_reset_resets_all_criteria():
+    """
+    Resetting a combination should reset each of its criteria.
+    """
+    for combination in [AnyOf, AllOf]:
+        first, second = MaxIterations(1), NoImprovement(1)
+        stop = combination(first, second)
+
+        for _ in range(2):
+            stop(rnd.RandomState(), One(), One())
+
+        stop.reset()
+
+        assert_(not first(rnd.RandomState(), One(), One()))
+        assert_(not second(rnd.RandomState(), One(), One()))
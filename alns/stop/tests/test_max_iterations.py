@@ -0,0 +1,54 @@
+import numpy.random as rnd
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from alns.stop.MaxIterations import MaxIterations
+from alns.tests.states import Zero
+
+
+def test_raises_negative_iterations():
+    """
+    A negative number of iterations is not understood.
+    """
+    with assert_raises(ValueError):
+        MaxIterations(-1)
+
+    MaxIterations(0)                        # zero should be fine
+
+
+def test_max_iterations():
+    """
+    Tests if the max_iterations parameter is correctly set.
+    """
+    for max_iterations in range(100):
+        assert_equal(MaxIterations(max_iterations).max_iterations,
+                     max_iterations)
+
+
+def test_stops_after_max_iterations():
+    """
+    The criterion is evaluated before every iteration, so it should not stop
+    the first max_iterations times it is called.
+    """
+    stop = MaxIterations(5)
+
+    for _ in range(5):
+        assert_(not stop(rnd.RandomState(), Zero(), Zero()))
+
+    assert_(stop(rnd.RandomState(), Zero(), Zero()))
+
+
+def test_reset_restarts_count():
+    """
+    After a reset, the criterion should again not stop the first
+    max_iterations times it is called.
+    """
+    stop = MaxIterations(2)
+
+    for _ in range(3):
+        stop(rnd.RandomState(), Zero(), Zero())
+
+    stop.reset()
+
+    assert_(not stop(rnd.RandomState(), Zero(), Zero()))
+    assert_(not stop(rnd.RandomState(), Zero(), Zero()))
+    assert_(stop(rnd.RandomState(), Zero(), Zero()))
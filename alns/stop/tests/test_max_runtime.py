@@ -0,0 +1,52 @@
+import time
+
+import numpy.random as rnd
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from alns.stop.MaxRuntime import MaxRuntime
+from alns.tests.states import Zero
+
+
+def test_raises_negative_runtime():
+    """
+    A negative runtime budget is not understood.
+    """
+    with assert_raises(ValueError):
+        MaxRuntime(-1)
+
+    MaxRuntime(0)                           # zero should be fine
+
+
+def test_max_runtime():
+    """
+    Tests if the max_runtime parameter is correctly set.
+    """
+    for max_runtime in [0.01, 1, 100]:
+        assert_equal(MaxRuntime(max_runtime).max_runtime, max_runtime)
+
+
+def test_stops_after_max_runtime():
+    """
+    The criterion should not stop before the budget has passed since its
+    first evaluation, and stop thereafter.
+    """
+    stop = MaxRuntime(0.05)
+
+    assert_(not stop(rnd.RandomState(), Zero(), Zero()))
+
+    time.sleep(0.06)
+    assert_(stop(rnd.RandomState(), Zero(), Zero()))
+
+
+def test_reset_restarts_budget():
+    """
+    After a reset, the budget should count from the next evaluation.
+    """
+    stop = MaxRuntime(0.05)
+
+    stop(rnd.RandomState(), Zero(), Zero())
+    time.sleep(0.06)
+    assert_(stop(rnd.RandomState(), Zero(), Zero()))
+
+    stop.reset()
+    assert_(not stop(rnd.RandomState(), Zero(), Zero()))
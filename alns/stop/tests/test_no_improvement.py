@@ -0,0 +1,56 @@
+import numpy.random as rnd
+from numpy.testing import assert_, assert_raises
+
+from alns.stop.NoImprovement import NoImprovement
+from alns.tests.states import One, Zero
+
+
+def test_raises_negative_iterations():
+    """
+    A negative number of iterations is not understood.
+    """
+    with assert_raises(ValueError):
+        NoImprovement(-1)
+
+
+def test_stops_without_improvement():
+    """
+    The criterion should stop after max_iterations evaluations in which the
+    best solution did not improve.
+    """
+    stop = NoImprovement(2)
+
+    assert_(not stop(rnd.RandomState(), One(), One()))
+    assert_(not stop(rnd.RandomState(), One(), One()))
+    assert_(stop(rnd.RandomState(), One(), One()))
+
+
+def test_improvement_resets_counter():
+    """
+    An improving best solution should reset the number of iterations without
+    improvement.
+    """
+    stop = NoImprovement(2)
+
+    assert_(not stop(rnd.RandomState(), One(), One()))
+    assert_(not stop(rnd.RandomState(), One(), One()))
+    assert_(not stop(rnd.RandomState(), Zero(), Zero()))
+    assert_(not stop(rnd.RandomState(), Zero(), Zero()))
+    assert_(stop(rnd.RandomState(), Zero(), Zero()))
+
+
+def test_reset_forgets_best():
+    """
+    After a reset, the criterion should count the iterations without
+    improvement anew, from the next best solution it is passed.
+    """
+    stop = NoImprovement(2)
+
+    for _ in range(3):
+        stop(rnd.RandomState(), Zero(), Zero())
+
+    stop.reset()
+
+    assert_(not stop(rnd.RandomState(), One(), One()))
+    assert_(not stop(rnd.RandomState(), One(), One()))
+    assert_(stop(rnd.RandomState(), One(), One()))
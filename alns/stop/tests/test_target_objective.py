@@ -0,0 +1,25 @@
+import numpy.random as rnd
+from numpy.testing import assert_, assert_equal
+
+from alns.stop.TargetObjective import TargetObjective
+from alns.tests.states import One, Two, Zero
+
+
+def test_target():
+    """
+    Tests if the target parameter is correctly set.
+    """
+    for target in range(100):
+        assert_equal(TargetObjective(target).target, target)
+
+
+def test_stops_at_target():
+    """
+    The criterion should stop once the best solution is at or below the
+    target objective, regardless of the current solution.
+    """
+    stop = TargetObjective(1)
+
+    assert_(not stop(rnd.RandomState(), Two(), Two()))
+    assert_(stop(rnd.RandomState(), One(), Two()))
+    assert_(stop(rnd.RandomState(), Zero(), Two()))
@@ -1,10 +1,24 @@
+import os
+import time
+
+import numpy as np
 import numpy.random as rnd
 from numpy.testing import (assert_, assert_almost_equal, assert_equal,
                            assert_raises, assert_no_warnings, assert_warns)
 
 from alns import ALNS, State
+from alns.Statistics import Statistics
 from alns.criteria import HillClimbing, SimulatedAnnealing
-from alns.exceptions_warnings import OverwriteWarning
+from alns.exceptions_warnings import OverwriteWarning, RepairAborted
+from alns.select.CoupledRouletteWheel import CoupledRouletteWheel
+from alns.select.RouletteWheel import RouletteWheel
+from alns.select.UCB1 import UCB1
+from alns.sink.CsvSink import CsvSink
+from alns.sink.TraceSink import NO_OUTCOME
+from alns.stop.MaxIterations import MaxIterations
+from alns.stop.MaxRuntime import MaxRuntime
+from alns.stop.NoImprovement import NoImprovement
+from alns.stop.TargetObjective import TargetObjective
 from .states import One, Zero
 
 
@@ -40,6 +54,31 @@ class ValueState(State):
         return self._value
 
 
+def random_value_operator(state, rnd_state):
+    """
+    Picklable test operator, returning a state with a random value.
+    """
+    return ValueState(rnd_state.random())
+
+
+def identity_operator(state, rnd_state):
+    """
+    Picklable test operator, returning the passed-in state.
+    """
+    return state
+
+
+def aborting_operator(state, rnd_state, context):
+    """
+    Picklable test repair operator, which aborts whenever it is passed a
+    context, and otherwise returns a state with a random value.
+    """
+    if context is not None:
+        raise RepairAborted()
+
+    return ValueState(rnd_state.random())
+
+
 # CALLBACKS --------------------------------------------------------------------
 
 def test_on_best_is_called():
@@ -60,6 +99,33 @@ def test_on_best_is_called():
 # OPERATORS --------------------------------------------------------------------
 
 
+def test_default_generator_per_instance():
+    """
+    Without a seed, each instance should get its own generator, rather than
+    sharing a random state between instances.
+    """
+    first, second = ALNS(), ALNS()
+
+    assert_(isinstance(first._rnd_state, rnd.Generator))
+    assert_(first._rnd_state is not second._rnd_state)
+
+
+def test_seed_reproducible_outcomes():
+    """
+    Passing the same seed should result in the same outcomes.
+    """
+    def run():
+        alns = ALNS(42)
+        alns.add_destroy_operator(identity_operator)
+        alns.add_repair_operator(random_value_operator)
+
+        result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10)
+        return result.statistics.objectives
+
+    assert_equal(run(), run())
+
+
+
 def test_add_destroy_operator():
     """
     Tests if adding a destroy operator correctly updates the number of
@@ -120,6 +186,64 @@ def test_add_repair_operator_name():
     assert_(operator is repair_operator)
 
 
+def test_repair_operator_context_threshold():
+    """
+    Repair operators added with a context should be passed the larger of the
+    criterion's threshold and the best objective. Other operators should not
+    be passed a context.
+    """
+    thresholds = []
+
+    def repair_operator(state, rnd_state, context):
+        thresholds.append(context.threshold)
+        return Zero()
+
+    alns = get_alns_instance(destroy_operators=[identity_operator])
+    alns.add_repair_operator(repair_operator, context=True)
+    alns.add_repair_operator(identity_operator)
+
+    # The current and best are both one, as is the hill climbing threshold.
+    # Once a zero candidate is found, the threshold is zero.
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 25)
+
+    counts = result.statistics.repair_operator_counts
+    assert_equal(len(thresholds), np.sum(counts["repair_operator"]))
+    assert_(len(thresholds) > 0)
+    assert_(set(thresholds) <= {0, 1})
+
+
+def test_aborted_repair_counts_as_rejection():
+    """
+    Candidates whose repair was aborted should count as rejections, and leave
+    the current and best solutions unchanged.
+    """
+    alns = get_alns_instance(destroy_operators=[identity_operator])
+    alns.add_repair_operator(aborting_operator, context=True)
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10)
+
+    assert_equal(result.best_state.objective(), 1)
+    assert_equal(result.statistics.objectives, np.ones(11))
+
+    counts = result.statistics.repair_operator_counts
+    assert_equal(counts["aborting_operator"], [0, 0, 0, 10])
+
+
+def test_readded_repair_operator_without_context():
+    """
+    When an operator is replaced by one without a context, it should no
+    longer be passed a context.
+    """
+    alns = get_alns_instance(destroy_operators=[identity_operator])
+    alns.add_repair_operator(aborting_operator, "repair", context=True)
+
+    with assert_warns(OverwriteWarning):
+        alns.add_repair_operator(random_value_operator, "repair")
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10)
+    assert_(result.best_state.objective() < 1)
+
+
 def test_add_operator_same_name_warns_per_type():
     """
     Adding an operator with the same name as an already added operator (of the
@@ -141,6 +265,77 @@ def test_add_operator_same_name_warns_per_type():
         alns.add_repair_operator(lambda state, rnd: None, "test")
 
 
+def test_uses_passed_scheme():
+    """
+    When a selection scheme is passed, it should select the operators, and
+    learn from the outcomes.
+    """
+    alns = get_alns_instance([identity_operator, identity_operator],
+                             [random_value_operator, random_value_operator,
+                              random_value_operator])
+
+    ucb1 = UCB1([1, 1, 1, 0], 3, 2)
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10,
+                          scheme=ucb1)
+
+    # UCB1 first applies every operator once, in order.
+    counts = result.statistics.destroy_operator_counts
+
+    for name in ["0", "1", "2"]:
+        assert_(np.sum(counts[name]) >= 1)
+
+
+def test_default_scheme_matches_roulette_wheel():
+    """
+    Without a scheme, operators should be selected by a roulette wheel with
+    the passed-in weights and decay.
+    """
+    def run(scheme=None):
+        alns = ALNS(3)
+        alns.add_destroy_operator(identity_operator, "d1")
+        alns.add_destroy_operator(identity_operator, "d2")
+        alns.add_repair_operator(random_value_operator)
+
+        result = alns.iterate(One(), [4, 3, 2, 1], .6, HillClimbing(), 50,
+                              scheme=scheme)
+        return result.statistics.destroy_operator_counts
+
+    assert_equal(run(), run(RouletteWheel([4, 3, 2, 1], .6, 2, 1)))
+
+
+def test_coupled_scheme_collects_pair_counts():
+    """
+    Pair counts should be collected for every iteration, and add up to the
+    operator counts.
+    """
+    alns = get_alns_instance([random_value_operator, random_value_operator],
+                             [identity_operator, identity_operator], seed=1)
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 50,
+                          scheme=CoupledRouletteWheel([3, 2, 1, .5], .8, 2, 2))
+
+    statistics = result.statistics
+    pair_counts = statistics.operator_pair_counts
+
+    assert_equal(sum(np.sum(counts) for counts in pair_counts.values()), 50)
+
+    for d_name, counts in statistics.destroy_operator_counts.items():
+        assert_equal(np.sum([pair_counts[d_name, r_name]
+                             for r_name in ["0", "1"]], axis=0),
+                     counts)
+
+
+def test_raises_scheme_operator_mismatch():
+    """
+    The scheme should select from as many operators as there are.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator])
+
+    with assert_raises(ValueError):
+        alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10,
+                     scheme=UCB1([1, 1, 1, 0], 2, 1))
+
+
 # PARAMETERS -------------------------------------------------------------------
 
 
@@ -268,11 +463,11 @@ def test_fixed_seed_outcomes():
     Tests if fixing a seed results in deterministic outcomes even when using a
     'random' acceptance criterion (here SA).
     """
-    outcomes = [0.01171, 0.00011, 0.01025]
+    outcomes = [0.00367, 0.00794, 0.01217]
 
     for seed, desired in enumerate(outcomes):                   # idx is seed
         alns = get_alns_instance(
-            [lambda state, rnd: ValueState(rnd.random_sample())],
+            [lambda state, rnd: ValueState(rnd.random())],
             [lambda state, rnd: None],
             seed)
 
@@ -282,4 +477,555 @@ def test_fixed_seed_outcomes():
 
         assert_almost_equal(result.best_state.objective(), desired, decimal=5)
 
+
+# TIMINGS ----------------------------------------------------------------------
+
+
+def test_collects_timings():
+    """
+    Tests if the time spent in the operators, acceptance criterion, and
+    callback is collected for every call, along with the iteration times.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator],
+                             seed=1)
+
+    num_best = []
+
+    def on_best(state, rnd_state):
+        num_best.append(state)
+        return state
+
+    alns.on_best(on_best)
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 25)
+    statistics = result.statistics
+
+    assert_equal(len(statistics.destroy_operator_times["0"]), 25)
+    assert_equal(len(statistics.repair_operator_times["0"]), 25)
+    assert_equal(len(statistics.acceptance_times), 25)
+    assert_equal(len(statistics.iteration_times), 25)
+    assert_equal(len(statistics.callback_times), len(num_best))
+
+    assert_(np.all(statistics.iteration_times >= 0))
+    assert_(np.sum(statistics.iteration_times) <= result.runtime)
+
+
+def test_no_timings_without_statistics(monkeypatch):
+    """
+    When neither statistics nor operator runtimes are kept, the clock should
+    only be read for the runtime of the run as a whole.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator],
+                             seed=1)
+    alns.on_best(lambda state, rnd_state: state)
+
+    calls = []
+
+    def perf_counter():
+        calls.append(None)
+        return 0.
+
+    monkeypatch.setattr(time, "perf_counter", perf_counter)
+
+    alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 25,
+                 collect_stats=False)
+
+    assert_equal(len(calls), 2)
+
+
+def test_no_speculative_timings_without_statistics(monkeypatch):
+    """
+    Without statistics or operator runtimes, the worker processes should not
+    read the clock either, when generating candidates speculatively.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator],
+                             seed=1)
+
+    pid = os.getpid()
+    calls = []
+
+    def perf_counter():
+        if os.getpid() != pid:
+            raise AssertionError("Clock read in a worker process.")
+
+        calls.append(None)
+        return 0.
+
+    monkeypatch.setattr(time, "perf_counter", perf_counter)
+
+    alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 25,
+                 collect_stats=False, n_speculative=2)
+
+    assert_equal(len(calls), 2)
+
+
+def test_collects_speculative_timings():
+    """
+    Tests if timings are also collected when candidates are generated
+    speculatively, in worker processes.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator])
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10,
+                          n_speculative=2)
+    statistics = result.statistics
+
+    assert_equal(len(statistics.destroy_operator_times["0"]), 10)
+    assert_equal(len(statistics.repair_operator_times["0"]), 10)
+    assert_equal(len(statistics.acceptance_times), 10)
+    assert_equal(len(statistics.iteration_times), 10)
+
+
+def slow_random_value_operator(state, rnd_state):
+    """
+    Test operator, returning a state with a random value after a short while.
+    """
+    time.sleep(0.002)
+    return ValueState(rnd_state.random())
+
+
+def test_runtime_aware_weights_favour_cheap_operators():
+    """
+    When two operators are equally successful, runtime-aware weights should
+    favour the cheaper one. Without, both should be selected about as often.
+    """
+    def run(runtime_aware):
+        alns = get_alns_instance([random_value_operator,
+                                  slow_random_value_operator],
+                                 [identity_operator],
+                                 seed=1)
+
+        result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 100,
+                              runtime_aware=runtime_aware)
+
+        counts = result.statistics.repair_operator_counts
+        return sum(counts["0"]), sum(counts["1"])
+
+    fast, slow = run(runtime_aware=True)
+    assert_(fast > 2 * slow)
+
+    fast, slow = run(runtime_aware=False)
+    assert_(abs(fast - slow) < 30)
+
+
+# STATISTICS -------------------------------------------------------------------
+
+
+def test_collect_into_passed_statistics():
+    """
+    When a statistics object is passed, statistics should be collected into
+    that object, so that it can be configured, e.g. to decimate.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator],
+                             seed=1)
+
+    statistics = Statistics(decimation=10)
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 100,
+                          collect_stats=statistics)
+
+    assert_(result.statistics is statistics)
+    assert_equal(statistics.num_objectives, 101)
+    assert_(len(statistics.objectives) < 101)
+
+    # The improvements are all stored, so the best objective is exact.
+    best = result.best_state.objective()
+    assert_equal(np.min(statistics.objectives), best)
+
+
+def test_streams_trace_to_sink(tmp_path):
+    """
+    When a sink is passed, a record should be streamed to it for every
+    iteration, matching the statistics, and the result should reload it.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator],
+                             seed=1)
+
+    sink = CsvSink(str(tmp_path / "trace.csv"), chunk_size=16)
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 100,
+                          sink=sink)
+
+    trace = result.trace
+
+    # As in the statistics, the initial solution is iteration zero.
+    assert_equal(trace["iteration"], np.arange(101))
+    assert_almost_equal(trace["current"], result.statistics.objectives)
+    assert_almost_equal(trace["best"],
+                        np.minimum.accumulate(result.statistics.objectives))
+    assert_almost_equal(trace["best"][-1], result.best_state.objective())
+
+    assert_equal(trace["destroy"][0], "")
+    assert_equal(trace["outcome"][0], NO_OUTCOME)
+
+    assert_(np.all(trace["destroy"][1:] == "0"))
+    assert_(np.all(np.diff(trace["elapsed"]) >= 0))
+
+    counts = result.statistics.destroy_operator_counts["0"]
+    assert_equal(np.bincount(trace["outcome"][1:], minlength=4), counts)
+
+
+# STOPPING CRITERIA ------------------------------------------------------------
+
+
+def test_stops_at_max_iterations():
+    """
+    Without a stopping criterion, the run stops after the given number of
+    iterations, and the result should say so.
+    """
+    alns = get_alns_instance([lambda state, rnd: One()],
+                             [lambda state, rnd: One()])
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10)
+
+    assert_equal(result.stop_reason, "MaxIterations")
+    assert_equal(len(result.statistics.objectives), 11)
+    assert_(result.runtime >= 0)
+
+
+def test_stopping_criterion_stops_run():
+    """
+    The stopping criterion should stop the run before the maximum number of
+    iterations, and be reported as the reason.
+    """
+    alns = get_alns_instance([lambda state, rnd: One()],
+                             [lambda state, rnd: One()])
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 100,
+                          stop=NoImprovement(5))
+
+    assert_equal(result.stop_reason, "NoImprovement")
+    assert_equal(len(result.statistics.objectives), 6)
+
+
+def test_stopping_criterion_reused_across_runs():
+    """
+    The stopping criterion should be reset when a run starts, so that passing
+    it to a second run does not stop that run straight away.
+    """
+    alns = get_alns_instance([lambda state, rnd: One()],
+                             [lambda state, rnd: One()])
+
+    for stop in [MaxIterations(5), NoImprovement(5)]:
+        for _ in range(2):
+            result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10,
+                                  stop=stop)
+
+            assert_equal(len(result.statistics.objectives), 6)
+
+
+def test_stops_before_first_iteration():
+    """
+    The stopping criterion is evaluated before every iteration, so an initial
+    solution that already meets the target is returned immediately.
+    """
+    alns = get_alns_instance([lambda state, rnd: Zero()],
+                             [lambda state, rnd: Zero()])
+
+    initial_solution = One()
+    result = alns.iterate(initial_solution, [1, 1, 1, 1], .5, HillClimbing(),
+                          stop=TargetObjective(1))
+
+    assert_(result.best_state is initial_solution)
+    assert_equal(result.stop_reason, "TargetObjective")
+
+
+def test_iterate_without_max_iterations():
+    """
+    The maximum number of iterations may be omitted when a stopping criterion
+    is passed, but not otherwise.
+    """
+    alns = get_alns_instance([lambda state, rnd: One()],
+                             [lambda state, rnd: One()])
+
+    with assert_raises(ValueError):
+        alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), None)
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), None,
+                          stop=MaxIterations(25))
+
+    assert_equal(len(result.statistics.objectives), 26)
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), None,
+                          stop=MaxRuntime(0.01))
+
+    assert_equal(result.stop_reason, "MaxRuntime")
+    assert_(result.runtime >= 0.01)
+
+
+# MULTI-START ------------------------------------------------------------------
+
+
+def test_multistart_returns_best_replica():
+    """
+    The multi-start result should be the best of the replica results, and
+    there should be one replica result for each seed.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator])
+
+    best, results = alns.iterate_multistart(One(), [1, 1, 1, 1], .5,
+                                            HillClimbing(), 10, n_workers=2,
+                                            seeds=[0, 1, 2])
+
+    assert_equal(len(results), 3)
+
+    objectives = [result.best_state.objective() for result in results]
+    assert_equal(best.best_state.objective(), min(objectives))
+
+    for result in results:
+        assert_equal(len(result.statistics.objectives), 11)
+
+
+def test_multistart_fixed_seed_outcomes():
+    """
+    Replicas with the same seeds should result in the same outcomes, and
+    replicas with different seeds should not.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator])
+
+    def run():
+        _, results = alns.iterate_multistart(One(), [1, 1, 1, 1], .5,
+                                             HillClimbing(), 10, n_workers=2,
+                                             seeds=[5, 5, 6])
+
+        return [result.best_state.objective() for result in results]
+
+    first, second = run(), run()
+
+    assert_equal(first, second)
+    assert_equal(first[0], first[1])
+    assert_(first[0] != first[2])
+
+
+def test_multistart_raises_unpicklable_operators():
+    """
+    Operators are pickled to the worker processes, so lambdas cannot be used.
+    """
+    alns = get_alns_instance([lambda state, rnd: Zero()],
+                             [lambda state, rnd: Zero()])
+
+    with assert_raises(ValueError):
+        alns.iterate_multistart(One(), [1, 1, 1, 1], .5, HillClimbing(), 10,
+                                n_workers=1, seeds=[0])
+
+
+# SPECULATION ------------------------------------------------------------------
+
+
+def test_speculative_counts_considered_candidates():
+    """
+    Only the candidates that are considered should count as iterations, so
+    the number of iterations should match that of a sequential run.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator])
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 25,
+                          n_speculative=3)
+
+    assert_equal(len(result.statistics.objectives), 26)
+
+    counts = result.statistics.repair_operator_counts["0"]
+    assert_equal(sum(counts), 25)
+
+
+_worker_value = None
+
+
+def set_worker_value(value):
+    """
+    Picklable test initializer, setting a value in the worker process.
+    """
+    global _worker_value
+    _worker_value = value
+
+
+def worker_value_operator(state, rnd_state):
+    """
+    Picklable test repair operator, returning a state with the value set in
+    the worker process.
+    """
+    return ValueState(_worker_value)
+
+
+def test_speculative_initializer():
+    """
+    The initializer should run in every worker process with the passed-in
+    arguments, before any candidate is generated there.
+    """
+    alns = get_alns_instance([identity_operator], [worker_value_operator])
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10,
+                          n_speculative=2, initializer=set_worker_value,
+                          initargs=(.5,))
+
+    assert_equal(result.best_state.objective(), .5)
+
+
+def test_speculative_fixed_seed_outcomes():
+    """
+    Speculative runs with the same random state and number of candidates
+    should follow the same trajectory, regardless of the timing of the worker
+    processes.
+    """
+    def run():
+        alns = get_alns_instance([identity_operator], [random_value_operator],
+                                 seed=7)
+
+        result = alns.iterate(One(), [1, 1, 1, 1], .5,
+                              SimulatedAnnealing(1, .1, .9), 25,
+                              n_speculative=3)
+
+        return result.statistics.objectives
+
+    assert_equal(run(), run())
+
+
+def test_speculative_matches_sequential():
+    """
+    Speculative runs should follow the same search path as a sequential run
+    with the same random state, as their candidates are selected and seeded
+    as in the sequential run.
+    """
+    def run(n_speculative):
+        alns = get_alns_instance([identity_operator, random_value_operator],
+                                 [identity_operator, random_value_operator],
+                                 seed=7)
+
+        return alns.iterate(One(), [5, 3, 2, 1], .5,
+                            SimulatedAnnealing(1, .1, .9), 50,
+                            n_speculative=n_speculative).statistics
+
+    sequential = run(None)
+
+    for n_speculative in [1, 2, 3]:
+        speculative = run(n_speculative)
+
+        assert_equal(speculative.objectives, sequential.objectives)
+        assert_equal(speculative.destroy_operator_counts,
+                     sequential.destroy_operator_counts)
+        assert_equal(speculative.repair_operator_counts,
+                     sequential.repair_operator_counts)
+
+
+def test_speculative_with_stopping_criterion():
+    """
+    The stopping criterion should be evaluated before every considered
+    candidate, also when speculating.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator])
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), None,
+                          stop=MaxIterations(10), n_speculative=4)
+
+    assert_equal(len(result.statistics.objectives), 11)
+    assert_equal(result.stop_reason, "MaxIterations")
+
+
+def test_speculative_passes_no_context():
+    """
+    Speculative candidates are generated before they are considered, so
+    repair operators should not be passed a context to abort on.
+    """
+    alns = get_alns_instance(destroy_operators=[identity_operator], seed=1)
+    alns.add_repair_operator(aborting_operator, context=True)
+
+    result = alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10,
+                          n_speculative=2)
+
+    assert_(result.best_state.objective() < 1)
+
+
+def test_speculative_raises_invalid_arguments():
+    """
+    There should be at least one speculative candidate, and the operators
+    should be picklable.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator])
+
+    with assert_raises(ValueError):
+        alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10,
+                     n_speculative=0)
+
+    alns = get_alns_instance([lambda state, rnd: Zero()],
+                             [lambda state, rnd: Zero()])
+
+    with assert_raises(ValueError):
+        alns.iterate(One(), [1, 1, 1, 1], .5, HillClimbing(), 10,
+                     n_speculative=2)
+
+
+# ISLANDS ----------------------------------------------------------------------
+
+
+def test_islands_ring_migration():
+    """
+    In a ring, each island receives the best solution of the previous island
+    at every migration. Using hill climbing, the current solution after a
+    migration can thus be no worse than that of the previous island before it.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator])
+
+    best, results = alns.iterate_islands(One(), [1, 1, 1, 1], .5,
+                                         HillClimbing(), 20, seeds=[0, 1, 2],
+                                         migration_interval=10)
+
+    assert_equal(len(results), 3)
+
+    for island, result in enumerate(results):
+        previous = results[island - 1].statistics.objectives
+        assert_(result.statistics.objectives[11] <= previous[10])
+
+    objectives = [result.best_state.objective() for result in results]
+    assert_equal(best.best_state.objective(), min(objectives))
+
+
+def test_islands_broadcast_migration():
+    """
+    With broadcast, every island receives the best solution of all other
+    islands at every migration.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator])
+
+    _, results = alns.iterate_islands(One(), [1, 1, 1, 1], .5, HillClimbing(),
+                                      20, seeds=[0, 1, 2],
+                                      migration_interval=10,
+                                      topology="broadcast",
+                                      share_weights=True)
+
+    best_before = min(result.statistics.objectives[10] for result in results)
+
+    for result in results:
+        assert_(result.statistics.objectives[11] <= best_before)
+
+
+def test_islands_fixed_seed_outcomes():
+    """
+    Migration is synchronous, so fixing the seeds should result in
+    deterministic outcomes.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator])
+
+    def run():
+        _, results = alns.iterate_islands(One(), [1, 1, 1, 1], .5,
+                                          HillClimbing(), 25, seeds=[3, 4],
+                                          migration_interval=5)
+
+        return [result.statistics.objectives for result in results]
+
+    assert_equal(run(), run())
+
+
+def test_islands_raises_invalid_parameters():
+    """
+    The migration interval must be positive, and the topology known.
+    """
+    alns = get_alns_instance([identity_operator], [random_value_operator])
+
+    with assert_raises(ValueError):
+        alns.iterate_islands(One(), [1, 1, 1, 1], .5, HillClimbing(), 10,
+                             seeds=[0], migration_interval=0)
+
+    with assert_raises(ValueError):
+        alns.iterate_islands(One(), [1, 1, 1, 1], .5, HillClimbing(), 10,
+                             seeds=[0], topology="star")
+
+
 # TODO test more complicated examples?
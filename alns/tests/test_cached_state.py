@@ -0,0 +1,157 @@
+import numpy.random as rnd
+from numpy.testing import assert_equal, assert_raises
+
+from alns.ALNS import ALNS
+from alns.CachedState import CachedState
+from alns.criteria.HillClimbing import HillClimbing
+from alns.exceptions_warnings import ObjectiveMismatchError
+
+
+class CountingState(CachedState):
+    """
+    Cached state that counts how often its objective is computed.
+    """
+
+    def __init__(self, value):
+        self.value = value
+        self.num_computed = 0
+
+    def compute_objective(self):
+        self.num_computed += 1
+        return self.value
+
+
+def test_objective_is_cached():
+    """
+    The objective should only be computed once, however often it is asked
+    for.
+    """
+    state = CountingState(5)
+
+    for _ in range(10):
+        assert_equal(state.objective(), 5)
+
+    assert_equal(state.num_computed, 1)
+
+
+def test_invalidate_recomputes_objective():
+    """
+    After invalidation, the objective should be recomputed.
+    """
+    state = CountingState(5)
+    state.objective()
+
+    state.value = 3
+    assert_equal(state.objective(), 5)      # still cached
+
+    state.invalidate()
+    assert_equal(state.objective(), 3)
+    assert_equal(state.num_computed, 2)
+
+
+def test_update_objective_shifts_cached_value():
+    """
+    Updating the objective should shift the cached value by the given delta,
+    without recomputing the objective.
+    """
+    state = CountingState(5)
+    state.objective()
+
+    state.value = 3
+    state.update_objective(-2)
+
+    assert_equal(state.objective(), 3)
+    assert_equal(state.num_computed, 1)
+
+
+def test_update_objective_without_cached_value():
+    """
+    When no objective is cached, updating it should do nothing: the objective
+    is computed in full when it is first asked for.
+    """
+    state = CountingState(5)
+    state.update_objective(-2)
+
+    assert_equal(state.objective(), 5)
+    assert_equal(state.num_computed, 1)
+
+
+def delta_repair(delta):
+    """
+    Returns a repair operator that decreases the state's value by one, and
+    updates the cached objective by the passed-in delta.
+    """
+    def repair(state, rnd_state):
+        repaired = CountingState(state.value)
+        repaired.objective()
+
+        repaired.value -= 1
+        repaired.update_objective(delta)
+        return repaired
+
+    return repair
+
+
+def test_check_objectives_correct_delta():
+    """
+    Checking the objectives should pass when the operators report the exact
+    change in objective value.
+    """
+    alns = ALNS(rnd.RandomState(1), check_objectives=True)
+    alns.add_destroy_operator(lambda state, rnd_state: state)
+    alns.add_repair_operator(delta_repair(-1))
+
+    result = alns.iterate(CountingState(10), [1, 1, 1, 1], .5, HillClimbing(),
+                          5)
+
+    assert_equal(result.best_state.objective(), 5)
+
+
+def test_check_objectives_incorrect_delta():
+    """
+    Checking the objectives should raise when an operator reports a change in
+    objective value that does not match the recomputed objective.
+    """
+    alns = ALNS(rnd.RandomState(1), check_objectives=True)
+    alns.add_destroy_operator(lambda state, rnd_state: state)
+    alns.add_repair_operator(delta_repair(-2))
+
+    with assert_raises(ObjectiveMismatchError):
+        alns.iterate(CountingState(10), [1, 1, 1, 1], .5, HillClimbing(), 5)
+
+
+def test_incorrect_delta_unchecked_by_default():
+    """
+    By default, objectives are not checked, and an incorrect delta goes
+    unnoticed.
+    """
+    alns = ALNS(rnd.RandomState(1))
+    alns.add_destroy_operator(lambda state, rnd_state: state)
+    alns.add_repair_operator(delta_repair(-2))
+
+    result = alns.iterate(CountingState(10), [1, 1, 1, 1], .5, HillClimbing(),
+                          5)
+
+    assert_equal(result.best_state.objective(), 4)
+    assert_equal(result.best_state.compute_objective(), 5)
+
+
+def test_alns_computes_objective_once_per_candidate():
+    """
+    ALNS and the acceptance criterion ask for a candidate's objective several
+    times, but a cached state should compute it only once.
+    """
+    candidates = []
+
+    def repair(state, rnd_state):
+        candidates.append(CountingState(rnd_state.random()))
+        return candidates[-1]
+
+    alns = ALNS(rnd.RandomState(1))
+    alns.add_destroy_operator(lambda state, rnd_state: state)
+    alns.add_repair_operator(repair)
+
+    alns.iterate(CountingState(1), [1, 1, 1, 1], .5, HillClimbing(), 50)
+
+    for candidate in candidates:
+        assert_equal(candidate.num_computed, 1)
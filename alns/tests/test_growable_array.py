@@ -0,0 +1,84 @@
+import pickle
+
+import numpy as np
+from numpy.testing import assert_, assert_equal, assert_raises
+
+from alns.GrowableArray import GrowableArray
+
+
+def test_raises_non_positive_capacity():
+    """
+    The initial capacity should be at least one.
+    """
+    with assert_raises(ValueError):
+        GrowableArray(capacity=0)
+
+
+def test_append_grows_buffer():
+    """
+    Appending beyond the initial capacity should grow the buffer, and keep the
+    values appended so far.
+    """
+    array = GrowableArray(capacity=2)
+
+    for value in range(10):
+        array.append(value)
+
+    assert_equal(len(array), 10)
+    assert_equal(array.values, np.arange(10))
+    assert_equal(array.values.dtype, np.float64)
+
+
+def test_values_read_only_view():
+    """
+    The values should be a read-only view into the buffer, not a copy.
+    """
+    array = GrowableArray(np.int64)
+
+    for value in range(5):
+        array.append(value)
+
+    first, second = array.values, array.values
+
+    assert_(np.shares_memory(first, second))
+    assert_(not first.flags.writeable)
+
+    with assert_raises(ValueError):
+        first[0] = 10
+
+
+def test_views_remain_valid_after_growing():
+    """
+    Views taken before the buffer grows should keep their values.
+    """
+    array = GrowableArray(capacity=1)
+    array.append(1)
+
+    view = array.values
+
+    for value in range(2, 10):
+        array.append(value)
+
+    assert_equal(view, [1])
+    assert_equal(array.values, np.arange(1, 10))
+
+
+def test_pickle_round_trip():
+    """
+    Pickling should preserve the values and type, and allow further appends.
+    """
+    array = GrowableArray(np.int64)
+
+    for value in range(3):
+        array.append(value)
+
+    unpickled = pickle.loads(pickle.dumps(array))
+    assert_equal(unpickled.values, [0, 1, 2])
+    assert_equal(unpickled.values.dtype, np.int64)
+
+    unpickled.append(3)
+    assert_equal(unpickled.values, [0, 1, 2, 3])
+
+    empty = pickle.loads(pickle.dumps(GrowableArray()))
+    empty.append(1)
+    assert_equal(empty.values, [1])
@@ -0,0 +1,87 @@
+from numpy.testing import (assert_, assert_almost_equal, assert_equal,
+                           assert_raises)
+
+from alns.OperatorRuntimes import MIN_RUNTIME, OperatorRuntimes
+
+
+def test_raises_decay_outside_unit_interval():
+    """
+    The decay parameter should be in the unit interval.
+    """
+    with assert_raises(ValueError):
+        OperatorRuntimes(2, -0.5)
+
+    with assert_raises(ValueError):
+        OperatorRuntimes(2, 1.5)
+
+
+def test_first_measurement_is_runtime():
+    """
+    The first measurement of an operator should be taken as its runtime, and
+    operators that have not been measured should not have a runtime.
+    """
+    runtimes = OperatorRuntimes(2, .5)
+    runtimes.update(0, 2.)
+
+    assert_equal(runtimes.runtimes[0], 2.)
+    assert_(all(runtimes.runtimes[1:] != runtimes.runtimes[1:]))     # NaN
+
+
+def test_update_smooths_runtimes():
+    """
+    Later measurements should be smoothed into the runtime as an exponential
+    moving average.
+    """
+    runtimes = OperatorRuntimes(1, .75)
+
+    runtimes.update(0, 4.)
+    runtimes.update(0, 8.)
+    assert_almost_equal(runtimes.runtimes[0], .75 * 4 + .25 * 8)
+
+    runtimes.update(0, 0.)
+    assert_almost_equal(runtimes.runtimes[0], .75 * 5)
+
+
+def test_relative_cost():
+    """
+    The relative cost should be the runtime relative to the mean runtime of
+    the measured operators, or one for operators that were not measured.
+    """
+    runtimes = OperatorRuntimes(3, .5)
+
+    runtimes.update(0, 1.)
+    runtimes.update(1, 3.)
+
+    assert_almost_equal(runtimes.relative_cost(0), .5)
+    assert_almost_equal(runtimes.relative_cost(1), 1.5)
+    assert_almost_equal(runtimes.relative_cost(2), 1.)
+
+
+def test_relative_cost_clamps_runtimes():
+    """
+    An operator that took no measurable time at all should not be infinitely
+    rewarded, and should cost the same as one that took a tiny time, as both
+    runtimes are clamped.
+    """
+    runtimes = OperatorRuntimes(3, .5)
+
+    runtimes.update(0, 0.)
+    runtimes.update(1, 1e-12)
+    runtimes.update(2, 3e-3)
+
+    assert_almost_equal(runtimes.relative_cost(0), MIN_RUNTIME / 1e-3)
+    assert_almost_equal(runtimes.relative_cost(1), runtimes.relative_cost(0))
+
+
+def test_relative_cost_all_fast():
+    """
+    When all operators are faster than the clamped runtime, they should all
+    cost the same, rather than be compared on timer noise.
+    """
+    runtimes = OperatorRuntimes(2, .5)
+
+    runtimes.update(0, 0.)
+    runtimes.update(1, 1e-9)
+
+    assert_almost_equal(runtimes.relative_cost(0), 1.)
+    assert_almost_equal(runtimes.relative_cost(1), 1.)
@@ -0,0 +1,116 @@
+import numpy as np
+from numpy.random import RandomState
+from numpy.testing import (assert_, assert_almost_equal, assert_equal,
+                           assert_raises)
+
+from alns.OperatorSelector import OperatorSelector
+
+
+def test_raises_no_operators():
+    """
+    There should be at least one operator to select from.
+    """
+    with assert_raises(ValueError):
+        OperatorSelector([])
+
+
+def test_weights_are_float64():
+    """
+    The weights should be stored in double precision, regardless of the type
+    of the passed-in weights.
+    """
+    selector = OperatorSelector(np.ones(3, dtype=np.float16))
+
+    assert_equal(selector.weights.dtype, np.float64)
+    assert_equal(selector.weights, [1, 1, 1])
+    assert_equal(len(selector), 3)
+
+
+def test_same_choices_as_random_state_choice():
+    """
+    Given the same random state, the selector should make the same choices as
+    ``RandomState.choice``, which the engine used previously.
+    """
+    weights = [3, 0.5, 1, 2, 0.25, 4, 1.5]
+    selector = OperatorSelector(weights)
+
+    rnd_selector = RandomState(1)
+    rnd_choice = RandomState(1)
+
+    for _ in range(1000):
+        expected = rnd_choice.choice(len(weights),
+                                     p=np.divide(weights, np.sum(weights)))
+
+        assert_equal(selector.select(rnd_selector), expected)
+
+
+def test_zero_weight_never_selected():
+    """
+    Operators without weight should never be selected.
+    """
+    selector = OperatorSelector([1, 0, 1, 0, 1])
+    rnd_state = RandomState(1)
+
+    for _ in range(1000):
+        assert_(selector.select(rnd_state) in [0, 2, 4])
+
+
+def test_update():
+    """
+    Updating a single weight should change the selection probabilities to
+    match the new weights.
+    """
+    selector = OperatorSelector([1, 1, 1])
+    selector.update(1, 8)
+
+    assert_equal(selector[1], 8)
+    assert_equal(selector.total, 10)
+
+    rnd_state = RandomState(1)
+    counts = np.bincount([selector.select(rnd_state) for _ in range(10000)],
+                         minlength=3)
+
+    assert_almost_equal(counts / 10000, [0.1, 0.8, 0.1], decimal=2)
+
+
+def test_many_updates():
+    """
+    After many incremental updates, the running sums should still match the
+    weights, so the selector should agree with a newly built one.
+    """
+    selector = OperatorSelector(np.ones(6))
+    rnd_state = RandomState(1)
+
+    for _ in range(5000):
+        selector.update(rnd_state.randint(6), 10 * rnd_state.random_sample())
+
+    fresh = OperatorSelector(selector.weights)
+    assert_almost_equal(selector.total, fresh.total)
+
+    rnd_selector = RandomState(2)
+    rnd_fresh = RandomState(2)
+
+    for _ in range(1000):
+        assert_equal(selector.select(rnd_selector), fresh.select(rnd_fresh))
+
+
+def test_set_weights():
+    """
+    Setting all weights at once should replace the existing weights.
+    """
+    selector = OperatorSelector([1, 2, 3])
+    selector.set_weights([0, 0, 5])
+
+    assert_equal(selector.weights, [0, 0, 5])
+    assert_equal(selector.total, 5)
+    assert_equal(selector.select(RandomState(1)), 2)
+
+
+def test_set_weights_raises_wrong_length():
+    """
+    The number of new weights should match the number of operators.
+    """
+    selector = OperatorSelector([1, 2, 3])
+
+    with assert_raises(ValueError):
+        selector.set_weights([1, 2])
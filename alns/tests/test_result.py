@@ -6,6 +6,7 @@ from numpy.testing import assert_, assert_raises
 from alns.Result import Result
 from alns.Statistics import Statistics
 from alns.exceptions_warnings import NotCollectedError
+from alns.sink.NpzSink import NpzSink
 from .states import Sentinel
 
 try:
@@ -45,6 +46,11 @@ def get_statistics():
         statistics.collect_destroy_operator("d_" + operator, state.randint(4))
         statistics.collect_repair_operator("r_" + operator, state.randint(4))
 
+        statistics.collect_destroy_operator_time("d_" + operator,
+                                                 state.random_sample())
+        statistics.collect_repair_operator_time("r_" + operator,
+                                                state.random_sample())
+
     return statistics
 
 
@@ -113,6 +119,36 @@ def get_operator_plot(figure, destroy, repair, legend=None, suptitle=None,
                   loc="lower center")
 
 
+def get_timings_plot(figure, destroy, repair, suptitle=None, **kwargs):
+    """
+    Helper method.
+    """
+
+    def _helper(ax, operator_times, title):
+        operator_names = list(operator_times.keys())
+
+        totals = np.array([times.sum() for times in operator_times.values()])
+        means = np.array([times.mean() for times in operator_times.values()])
+
+        ax.barh(operator_names, totals, height=0.5, **kwargs)
+
+        for y, (x, mean) in enumerate(zip(totals / 2, means)):
+            ax.text(x, y, "{0:.3g} ms/call".format(1000 * mean),
+                    ha='center', va='center')
+
+        ax.set_title(title)
+        ax.set_xlabel("Total time spent in operator (s)")
+        ax.set_ylabel("Operator")
+
+    if suptitle is not None:
+        figure.suptitle(suptitle)
+
+    d_ax, r_ax = figure.subplots(nrows=2)
+
+    _helper(d_ax, destroy, "Destroy operators")
+    _helper(r_ax, repair, "Repair operators")
+
+
 # TESTS ------------------------------------------------------------------------
 
 
@@ -139,6 +175,78 @@ def test_raises_missing_statistics():
     result.statistics  # pylint: disable=pointless-statement
 
 
+def test_stop_reason_and_runtime():
+    """
+    Tests if the result object correctly returns the passed-in stopping reason
+    and runtime, and that these default to None.
+    """
+    result = Result(Sentinel(), Statistics(), "MaxRuntime", 1.5)
+
+    assert_(result.stop_reason == "MaxRuntime")
+    assert_(result.runtime == 1.5)
+
+    result = Result(Sentinel())
+
+    assert_(result.stop_reason is None)
+    assert_(result.runtime is None)
+
+
+def test_raises_missing_trace():
+    """
+    Accessing the trace when no sink has been passed-in should raise.
+    """
+    with assert_raises(NotCollectedError):
+        get_result(Sentinel()).trace  # pylint: disable=pointless-statement
+
+
+def test_trace_is_loaded_once(tmp_path):
+    """
+    The trace should be loaded from the sink on first access, and kept.
+    """
+    with NpzSink(str(tmp_path)) as sink:
+        sink.write(2, 2, "destroy", "repair", 1)
+
+    result = Result(Sentinel(), sink=sink)
+
+    assert_(result.trace is result.trace)
+    assert_(result.trace["current"][0] == 2)
+
+
+@pytest.mark.matplotlib
+@check_figures_equal(extensions=['png'])
+def test_plot_objectives_from_trace(fig_test, fig_ref, tmp_path):
+    """
+    Without statistics, ``plot_objectives`` should plot the objective values
+    from the trace, at the iterations they were recorded at, along with the
+    recorded best objective values.
+    """
+    objectives = np.arange(100, 0, -1) % 7
+    best = np.arange(101, 1, -1)
+
+    with NpzSink(str(tmp_path), chunk_size=7) as sink:
+        sink.write_initial(101)
+
+        for objective, best_objective in zip(objectives[1:], best[1:]):
+            sink.write(objective, best_objective, "destroy", "repair", 0)
+
+    objectives[0] = 101
+
+    result = Result(Sentinel(), sink=sink)
+    result.plot_objectives(fig_test.subplots())
+
+    ax = fig_ref.subplots()
+    iterations = np.arange(100)
+
+    ax.plot(iterations, objectives)
+    ax.plot(iterations, best)
+
+    ax.set_title("Objective value at each iteration")
+    ax.set_ylabel("Objective value")
+    ax.set_xlabel("Iteration (#)")
+
+    ax.legend(["Current", "Best"], loc="upper right")
+
+
 @pytest.mark.matplotlib
 @check_figures_equal(extensions=['png'])
 def test_plot_objectives(fig_test, fig_ref):
@@ -287,3 +395,33 @@ def test_plot_operator_counts_legend_length(fig_test, fig_ref):
                       result.statistics.destroy_operator_counts,
                       result.statistics.repair_operator_counts,
                       legend=["Best"])
+
+
+@pytest.mark.matplotlib
+@check_figures_equal(extensions=['png'])
+def test_plot_operator_timings(fig_test, fig_ref):
+    """
+    Tests if the ``plot_operator_timings`` method returns the same figure as a
+    reference plot below.
+    """
+    result = get_result(Sentinel())
+
+    # Tested plot
+    result.plot_operator_timings(fig_test, title="Timings", color="r")
+
+    # Reference plot
+    get_timings_plot(fig_ref,
+                     result.statistics.destroy_operator_times,
+                     result.statistics.repair_operator_times,
+                     suptitle="Timings",
+                     color="r")
+
+
+@pytest.mark.matplotlib
+def test_plot_operator_timings_default_figure():
+    """
+    When a figure is not passed, the ``plot_operator_timings`` method should
+    create a new figure.
+    """
+    result = get_result(Sentinel())
+    result.plot_operator_timings()
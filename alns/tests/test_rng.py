@@ -0,0 +1,56 @@
+import numpy.random as rnd
+from numpy.testing import assert_, assert_equal
+
+from alns.rng import draw_seed, get_rng, spawn
+
+
+def test_get_rng_returns_pcg64_generator():
+    """
+    Seeds should result in a Generator using the PCG64 bit generator.
+    """
+    for seed in [None, 1, rnd.SeedSequence(1)]:
+        rng = get_rng(seed)
+
+        assert_(isinstance(rng, rnd.Generator))
+        assert_(isinstance(rng.bit_generator, rnd.PCG64))
+
+
+def test_get_rng_returns_existing_generators():
+    """
+    Generators and legacy random states should be returned as-is.
+    """
+    for rng in [rnd.default_rng(1), rnd.RandomState(1)]:
+        assert_(get_rng(rng) is rng)
+
+
+def test_get_rng_same_seed_same_stream():
+    """
+    The same seed should result in the same stream of random numbers.
+    """
+    assert_equal(get_rng(42).random(10), get_rng(42).random(10))
+
+
+def test_draw_seed():
+    """
+    Seeds drawn from the same stream should be the same, and non-negative.
+    """
+    for rng in [get_rng(1), rnd.RandomState(1)]:
+        seed = draw_seed(rng)
+        assert_(seed >= 0)
+
+    assert_equal(draw_seed(get_rng(1)), draw_seed(get_rng(1)))
+
+
+def test_spawn_independent_reproducible_streams():
+    """
+    Spawned streams should differ from each other, but be reproducible from
+    the same generator.
+    """
+    first = [get_rng(seq).random(5) for seq in spawn(get_rng(1), 3)]
+    second = [get_rng(seq).random(5) for seq in spawn(get_rng(1), 3)]
+
+    assert_equal(len(first), 3)
+    assert_equal(first, second)
+
+    assert_(not (first[0] == first[1]).all())
+    assert_(not (first[1] == first[2]).all())
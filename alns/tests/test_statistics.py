@@ -1,4 +1,6 @@
-from numpy.testing import assert_equal, assert_almost_equal
+import numpy as np
+from numpy.testing import (assert_, assert_almost_equal, assert_equal,
+                           assert_raises)
 
 from alns.Statistics import Statistics
 
@@ -13,6 +15,13 @@ def test_empty_new_statistics():
     assert_equal(len(statistics.destroy_operator_counts), 0)
     assert_equal(len(statistics.repair_operator_counts), 0)
 
+    assert_equal(len(statistics.destroy_operator_times), 0)
+    assert_equal(len(statistics.repair_operator_times), 0)
+    assert_equal(len(statistics.acceptance_times), 0)
+    assert_equal(len(statistics.callback_times), 0)
+    assert_equal(len(statistics.iteration_times), 0)
+    assert_equal(len(statistics.iterations_per_second()), 0)
+
 
 def test_collect_objectives():
     """
@@ -58,3 +67,153 @@ def test_collect_repair_counts_example():
     for idx, count in enumerate([0, 0, 1, 0]):
         assert_equal(statistics.repair_operator_counts["repair_test"][idx],
                      count)
+
+
+def test_collect_operator_pair_counts():
+    """
+    Tests if collecting for a pair of operators counts per pair, separately
+    from the other pairs.
+    """
+    statistics = Statistics()
+
+    statistics.collect_operator_pair("destroy", "repair", 0)
+    statistics.collect_operator_pair("destroy", "repair", 3)
+    statistics.collect_operator_pair("destroy", "other", 3)
+
+    counts = statistics.operator_pair_counts
+
+    assert_equal(counts["destroy", "repair"], [1, 0, 0, 1])
+    assert_equal(counts["destroy", "other"], [0, 0, 0, 1])
+    assert_equal(len(counts), 2)
+
+
+def test_collect_operator_times():
+    """
+    Tests if a Statistics object collects the time of each operator call,
+    separately for each operator.
+    """
+    statistics = Statistics()
+
+    statistics.collect_destroy_operator_time("destroy_test", 1.)
+    statistics.collect_destroy_operator_time("destroy_test", 2.)
+    statistics.collect_repair_operator_time("repair_test", 3.)
+
+    assert_almost_equal(statistics.destroy_operator_times["destroy_test"],
+                        [1, 2])
+    assert_almost_equal(statistics.repair_operator_times["repair_test"], [3])
+
+
+def test_collect_acceptance_and_callback_times():
+    """
+    Tests if a Statistics object collects the time of each acceptance check
+    and callback.
+    """
+    statistics = Statistics()
+
+    statistics.collect_acceptance_time(.5)
+    statistics.collect_acceptance_time(.25)
+    statistics.collect_callback_time(2.)
+
+    assert_almost_equal(statistics.acceptance_times, [.5, .25])
+    assert_almost_equal(statistics.callback_times, [2])
+
+
+def test_timing_summary():
+    """
+    Tests if the timing summary correctly computes the number of calls, the
+    total and mean time, and the requested percentiles.
+    """
+    statistics = Statistics()
+
+    for seconds in range(1, 101):
+        statistics.collect_repair_operator_time("repair_test", seconds)
+
+    summary = statistics.timing_summary(percentiles=[0, 50, 100])
+    repair = summary["repair"]["repair_test"]
+
+    assert_equal(repair["calls"], 100)
+    assert_almost_equal(repair["total"], 5050)
+    assert_almost_equal(repair["mean"], 50.5)
+    assert_almost_equal(repair["percentiles"], [1, 50.5, 100])
+
+    # Nothing was collected for these, so there is nothing to summarise.
+    assert_equal(len(summary["destroy"]), 0)
+    assert_equal(summary["acceptance"]["calls"], 0)
+    assert_equal(summary["on_best"]["total"], 0)
+    assert_(np.all(np.isnan(summary["on_best"]["percentiles"])))
+
+
+def test_iterations_per_second():
+    """
+    Tests if the iterations per second are computed as a moving average over
+    the iteration times.
+    """
+    statistics = Statistics()
+
+    for seconds in [.5, .5, .25, .25]:
+        statistics.collect_iteration_time(seconds)
+
+    assert_almost_equal(statistics.iterations_per_second(window=1),
+                        [2, 2, 4, 4])
+    assert_almost_equal(statistics.iterations_per_second(window=2),
+                        [2, 2 / .75, 4])
+
+    # When the window exceeds the number of iterations, it is shrunk to match.
+    assert_almost_equal(statistics.iterations_per_second(window=10), [8 / 3])
+
+
+def test_iterations_per_second_raises_window():
+    """
+    The window should span at least one iteration.
+    """
+    statistics = Statistics()
+
+    with assert_raises(ValueError):
+        statistics.iterations_per_second(window=0)
+
+
+def test_objectives_read_only_view():
+    """
+    The objectives should be returned as a read-only view, rather than a copy.
+    """
+    statistics = Statistics()
+
+    for objective in range(10):
+        statistics.collect_objective(objective)
+
+    assert_(np.shares_memory(statistics.objectives, statistics.objectives))
+    assert_(not statistics.objectives.flags.writeable)
+
+    assert_equal(statistics.objective_iterations, np.arange(10))
+    assert_equal(statistics.num_objectives, 10)
+
+
+def test_raises_non_positive_decimation():
+    """
+    The decimation should be at least one.
+    """
+    with assert_raises(ValueError):
+        Statistics(decimation=0)
+
+
+def test_decimation_keeps_best_improvements():
+    """
+    When decimating, only every k-th objective value should be stored, along
+    with all values that improve upon the best so far.
+    """
+    statistics = Statistics(decimation=3)
+    objectives = [5, 6, 4, 7, 8, 9, 6, 3, 7, 8]
+
+    for objective in objectives:
+        statistics.collect_objective(objective)
+
+    assert_equal(statistics.decimation, 3)
+    assert_equal(statistics.num_objectives, len(objectives))
+
+    # Every third value (at 0, 3, 6, 9), and improvements (at 2, and 7).
+    assert_equal(statistics.objective_iterations, [0, 2, 3, 6, 7, 9])
+    assert_equal(statistics.objectives, [5, 4, 7, 6, 3, 8])
+
+    # The best objective over time is exact at the stored iterations.
+    assert_equal(np.minimum.accumulate(statistics.objectives),
+                 np.minimum.accumulate(objectives)[[0, 2, 3, 6, 7, 9]])
@@ -0,0 +1,82 @@
+"""
+Micro-benchmark of the per-iteration overhead of the ALNS engine itself, and
+of operator selection in particular. Run from the repository root, as
+
+    python -m benchmarks.operator_selection [num_operators] [iterations]
+
+The engine is run on a trivial state with no-op operators, so that the
+measured time is that of the engine: operator selection, the acceptance
+criterion, and the weight updates.
+"""
+import sys
+import timeit
+
+import numpy as np
+import numpy.random as rnd
+
+from alns.ALNS import ALNS
+from alns.OperatorSelector import OperatorSelector
+from alns.State import State
+from alns.criteria.HillClimbing import HillClimbing
+from alns.rng import get_rng
+
+
+class ConstantState(State):
+
+    def objective(self):
+        return 0
+
+
+def no_op(state, rnd_state):
+    return state
+
+
+def choice_select(weights, rnd_state):
+    # Previous selection approach, which normalised the weights on every call.
+    return rnd_state.choice(np.arange(0, len(weights)),
+                            p=weights / np.sum(weights))
+
+
+def per_call(timer, number):
+    # Best of several repeats, in microseconds per call.
+    return 1e6 * min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main(num_operators=4, iterations=20000):
+    legacy_state = rnd.RandomState(1)
+    generator = get_rng(1)
+
+    weights = generator.uniform(0.5, 5, num_operators)
+
+    float16_weights = weights.astype(np.float16)
+    selector = OperatorSelector(weights)
+
+    print("Selecting one of {0} operators (us/call)".format(num_operators))
+    print("  RandomState.choice:      {0:8.2f}".format(per_call(
+        timeit.Timer(lambda: choice_select(float16_weights, legacy_state)),
+        10000)))
+    print("  Generator.choice:        {0:8.2f}".format(per_call(
+        timeit.Timer(lambda: choice_select(weights, generator)), 10000)))
+    print("  OperatorSelector.select: {0:8.2f}".format(per_call(
+        timeit.Timer(lambda: selector.select(generator)), 10000)))
+    print("  OperatorSelector.update: {0:8.2f}".format(per_call(
+        timeit.Timer(lambda: selector.update(1, 2.5)), 10000)))
+
+    alns = ALNS(1)
+
+    for idx in range(num_operators):
+        alns.add_destroy_operator(no_op, "destroy_{0}".format(idx))
+        alns.add_repair_operator(no_op, "repair_{0}".format(idx))
+
+    for collect_stats in [False, True]:
+        timer = timeit.Timer(lambda: alns.iterate(ConstantState(),
+                                                  [3, 2, 1, 0.5], 0.8,
+                                                  HillClimbing(), iterations,
+                                                  collect_stats))
+
+        print("Engine overhead, collect_stats={0} (us/iteration): {1:.2f}"
+              .format(collect_stats, per_call(timer, 1) / iterations))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,80 @@
+"""
+Micro-benchmark of travel time lookups between pairs of nodes, as done in
+every schedule step of route evaluation. Run from the repository root, as
+
+    python -m benchmarks.travel_lookup [num_nodes] [num_lookups]
+
+Compares indexing the problem's ``np.matrix`` (or ``np.memmap``) directly
+with the ``TravelData`` accessor, for in-memory and memory-mapped matrices,
+and with batch lookups of index vectors.
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+import numpy as np
+
+from technician_planning.TravelData import TravelData
+
+
+def per_call(timer, number, lookups):
+    # Best of several repeats, in nanoseconds per lookup.
+    return 1e9 * min(timer.repeat(repeat=5, number=number)) / lookups
+
+
+def lookup_all(lookup, pairs):
+    # The sum includes the cost of arithmetic on the returned values, which
+    # is slower for NumPy scalars than for plain Python numbers.
+    total = 0.
+    for from_idx, to_idx in pairs:
+        total += lookup(from_idx, to_idx)
+    return total
+
+
+def main(num_nodes=1000, num_lookups=100000):
+    generator = np.random.default_rng(1)
+
+    times = generator.uniform(0, 3600, (num_nodes, num_nodes))
+    matrix = np.matrix(times)
+
+    from_indices = generator.integers(num_nodes, size=num_lookups)
+    to_indices = generator.integers(num_nodes, size=num_lookups)
+    pairs = list(zip(from_indices.tolist(), to_indices.tolist()))
+
+    travel_data = TravelData(matrix, matrix)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "times.npy")
+        np.save(path, times.astype(np.float32))
+
+        mapped = np.load(path, mmap_mode="r")
+        mapped_data = TravelData(mapped, mapped)
+
+        print("Travel time lookups between {0} nodes (ns/lookup)"
+              .format(num_nodes))
+        print("  np.matrix[i, j]:            {0:8.1f}".format(per_call(
+            timeit.Timer(lambda: lookup_all(lambda i, j: matrix[i, j],
+                                            pairs)),
+            1, num_lookups)))
+        print("  np.memmap[i, j] (float32):  {0:8.1f}".format(per_call(
+            timeit.Timer(lambda: lookup_all(lambda i, j: mapped[i, j],
+                                            pairs)),
+            1, num_lookups)))
+        print("  TravelData.time:            {0:8.1f}".format(per_call(
+            timeit.Timer(lambda: lookup_all(travel_data.time, pairs)),
+            1, num_lookups)))
+        print("  TravelData.time (memmap):   {0:8.1f}".format(per_call(
+            timeit.Timer(lambda: lookup_all(mapped_data.time, pairs)),
+            1, num_lookups)))
+        print("  TravelData.times (batch):   {0:8.1f}".format(per_call(
+            timeit.Timer(lambda: travel_data.times(from_indices,
+                                                   to_indices).sum()),
+            1, num_lookups)))
+
+        # The memory map must be closed before the directory is removed.
+        del mapped, mapped_data
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -344,6 +344,7 @@ def buildSolutionParallelStyle(solution):
                     del unroutedCustomers[unroutedCustomers.index(unroutedCust)]
                     toDelete.append(unroutedCust)
                     solution.unassignedRequests.append(unroutedCust)
+                    solution.update_objective(unroutedCust.profitForcast)
                 else:
                     bestFitPerCust[unroutedCust] = allOvercheapestPlaceCost
             
@@ -5,11 +5,10 @@ Pisinger, David and Ropke, Stefan. Large Neighborhood Search. Handbook of Metahe
 
 import numpy as np
 import networkx as nx
-import copy
-import random
 import matplotlib.pyplot as plt
 from technician_planning.Solution import Solution
 from technician_planning.Route import Route
+from alns.exceptions_warnings import RepairAborted
 
 
 # global operator parameters
@@ -20,12 +19,12 @@ holdingListRemoval = 0.5
 relatednessWeights = [3,1,5]
 
 
-def determineDegreeOfDestruction(problem):
+def determineDegreeOfDestruction(problem, random_state):
     # As mentioned by Ropke and Pisinger the degree of destruction is choosen at random depending on the instance size. In this case between 10 and 50 percent.
-   return round(np.random.uniform(destructionRange[0], destructionRange[1]) * len(problem.demand))
+   return round(random_state.uniform(destructionRange[0], destructionRange[1]) * len(problem.demand))
 
 def randomRemoval(current, random_state):
-    destroyed = copy.deepcopy(current)
+    destroyed = current.clone()
     
     solutionSpace = []
     nodeToRoute = {}
@@ -41,7 +40,7 @@ def randomRemoval(current, random_state):
 
     random_state.shuffle(combinedSearchSpace)
 
-    destructionDegree = determineDegreeOfDestruction(destroyed.problem)
+    destructionDegree = determineDegreeOfDestruction(destroyed.problem, random_state)
     targetsToRemove = random_state.choice(combinedSearchSpace, destructionDegree, replace=False)
 
     for target in targetsToRemove:
@@ -52,6 +51,7 @@ def randomRemoval(current, random_state):
         elif(target in destroyed.unassignedRequests):
             el = destroyed.unassignedRequests.pop(destroyed.unassignedRequests.index(target))
             destroyed.removalCache.append(el)
+            destroyed.update_objective(-el.profitForcast)
         else:
             raise Exception("The target can not be located.")
     
@@ -69,11 +69,14 @@ def randomRemoval(current, random_state):
     return destroyed
 
 
-def greedyInsertion(current, random_state):
+def greedyInsertion(current, random_state, context=None):
     
     removalCacheNotEmpty = current.removalCache
     changedRoute = None
     cheapestCostsPerCust= {}
+
+    # route costs are never negative, so the penalties of the unrouted customers are a lower bound on the objective of the repaired solution
+    unroutedPenalty = current.calculateRequestCoverageCost()
     
     while(removalCacheNotEmpty):
 
@@ -141,11 +144,17 @@ def greedyInsertion(current, random_state):
                     del current.removalCache[current.removalCache.index(unroutedCust)]
                     toDelete.append(unroutedCust)
                     current.unassignedRequests.append(unroutedCust)
+                    current.update_objective(unroutedCust.profitForcast)
+                    unroutedPenalty+= unroutedCust.profitForcast
                 else:
                     bestFitPerCust[unroutedCust] = cheapest
             
             for el in toDelete:
                 del cheapestCostsPerCust[el]
+
+            # the candidate is certainly rejected once the lower bound exceeds the acceptance threshold, so there is no need to complete it
+            if(context is not None and context.should_abort(unroutedPenalty)):
+                raise RepairAborted()
             
             if(not cheapestCostsPerCust):
 
@@ -175,10 +184,13 @@ def greedyInsertion(current, random_state):
     return current
 
 
-def k_regretInsertion(current, random_state):
+def k_regretInsertion(current, random_state, context=None):
     removalCacheNotEmpty = current.removalCache
     changedRoute = None
     cheapestCostsPerCust= {}
+
+    # route costs are never negative, so the penalties of the unrouted customers are a lower bound on the objective of the repaired solution
+    unroutedPenalty = current.calculateRequestCoverageCost()
     
     while(removalCacheNotEmpty):
 
@@ -246,11 +258,17 @@ def k_regretInsertion(current, random_state):
                     del current.removalCache[current.removalCache.index(unroutedCust)]
                     toDelete.append(unroutedCust)
                     current.unassignedRequests.append(unroutedCust)
+                    current.update_objective(unroutedCust.profitForcast)
+                    unroutedPenalty+= unroutedCust.profitForcast
                 else:
                     bestFitPerCust[unroutedCust] = cheapest
             
             for el in toDelete:
                 del cheapestCostsPerCust[el]
+
+            # the candidate is certainly rejected once the lower bound exceeds the acceptance threshold, so there is no need to complete it
+            if(context is not None and context.should_abort(unroutedPenalty)):
+                raise RepairAborted()
             
             if(not cheapestCostsPerCust):
 
@@ -334,8 +352,8 @@ def k_regretInsertion(current, random_state):
 
 def distancedBasedWorstRemoval(current, random_state):
     
-    destroyed = copy.deepcopy(current)
-    destructionDegree = determineDegreeOfDestruction(destroyed.problem)
+    destroyed = current.clone()
+    destructionDegree = determineDegreeOfDestruction(destroyed.problem, random_state)
 
     changedRoute = None
     removed = 0
@@ -379,7 +397,7 @@ def distancedBasedWorstRemoval(current, random_state):
         # insert customers from the holding list at random positions
 
         for onHoldCust in targetsOnHoldToRemove:
-            sortedCosts.insert(random.randrange(0, len(sortedCosts)-1), onHoldCust)
+            sortedCosts.insert(random_state.integers(0, len(sortedCosts)-1), onHoldCust)
 
         # choose a customer to remove
         diversificationBaseFactor = random_state.uniform(0, 1)
@@ -390,6 +408,7 @@ def distancedBasedWorstRemoval(current, random_state):
         if(target in targetsOnHoldToRemove):
             destroyed.unassignedRequests.remove(target)
             destroyed.removalCache.append(target)
+            destroyed.update_objective(-target.profitForcast)
             changedRoute = -1
         else:
             targetRoute = target[2]
@@ -404,8 +423,8 @@ def distancedBasedWorstRemoval(current, random_state):
 
 def timeBasedWorstRemoval(current, random_state):
     
-    destroyed = copy.deepcopy(current)
-    destructionDegree = determineDegreeOfDestruction(destroyed.problem)
+    destroyed = current.clone()
+    destructionDegree = determineDegreeOfDestruction(destroyed.problem, random_state)
 
     changedRoute = None
     removed = 0
@@ -451,7 +470,7 @@ def timeBasedWorstRemoval(current, random_state):
         # insert customers from the holding list at random positions
 
         for onHoldCust in targetsOnHoldToRemove:
-            sortedCosts.insert(random.randrange(0, len(sortedCosts)-1), onHoldCust)
+            sortedCosts.insert(random_state.integers(0, len(sortedCosts)-1), onHoldCust)
 
         # choose a customer to remove
         diversificationBaseFactor = random_state.uniform(0, 1)
@@ -462,6 +481,7 @@ def timeBasedWorstRemoval(current, random_state):
         if(target in targetsOnHoldToRemove):
             destroyed.unassignedRequests.remove(target)
             destroyed.removalCache.append(target)
+            destroyed.update_objective(-target.profitForcast)
             changedRoute = -1
         else:
             targetRoute = target[2]
@@ -493,9 +513,9 @@ def relatedness(stopA, stopB, problem):
 
 def relatedRemoval(current, random_state):
 
-    destroyed = copy.deepcopy(current)
+    destroyed = current.clone()
 
-    destructionDegree = determineDegreeOfDestruction(destroyed.problem)
+    destructionDegree = determineDegreeOfDestruction(destroyed.problem, random_state)
 
     if(destructionDegree < 1):
         return destroyed
@@ -517,32 +537,32 @@ def relatedRemoval(current, random_state):
 
     relatedCustsToRemove = []
 
+    # the relatedness between all customers is precomputed once per problem and weights, see Problem.relatednessMatrix
+    problem = destroyed.problem
+    relatednessMatrix = problem.relatednessMatrix(relatednessWeights)
+
     # choose a random element from the solution space to start with
     startingTarget = random_state.choice(combinedSearchSpace, 1, replace=False)
     
     relatedCustsToRemove.append(startingTarget[0])
     combinedSearchSpace.remove(startingTarget[0])
 
+    # the columns of the relatedness matrix of the customers not removed yet, in the order of the search space
+    searchSpacePositions = np.array([problem.demandPosition(stop) for stop in combinedSearchSpace], dtype=int)
+
     while(len(relatedCustsToRemove) < destructionDegree):
         
         # a random pick from the customers to remove that we will use to calculate the relatedness with every other node not removed yet
         pick = random_state.choice(relatedCustsToRemove, 1, replace=False)[0]
-        relatednessToPick = []
-
-        # calculate the relatedness
-        for stop in combinedSearchSpace:
-            relatednessScore = relatedness(pick, stop, destroyed.problem)
-            relatednessToPick.append([relatednessScore, stop])
-        
-        sortedList = sorted(relatednessToPick, key= lambda el: el[0])
+        relatednessToPick = relatednessMatrix[problem.demandPosition(pick), searchSpacePositions]
 
-        # pick the most related customer controlled by a diversification factor
+        # pick the most related customer controlled by a diversification factor. Only the customer at the target rank has to be found, rather than sorting all of them.
         diversificationBaseFactor = random_state.uniform(0, 1)
-        targetIdx = int((diversificationBaseFactor**degreeOfDiversification)*len(sortedList))
-        target = sortedList[targetIdx]
+        targetIdx = int((diversificationBaseFactor**degreeOfDiversification)*len(relatednessToPick))
+        searchSpaceIdx = np.argpartition(relatednessToPick, targetIdx)[targetIdx]
 
-        relatedCustsToRemove.append(target[1])
-        combinedSearchSpace.remove(target[1])
+        relatedCustsToRemove.append(combinedSearchSpace.pop(searchSpaceIdx))
+        searchSpacePositions = np.delete(searchSpacePositions, searchSpaceIdx)
     
     # after we gathered all customers to remove we drive them into the removal cache and out of their current positions
     for target in relatedCustsToRemove:
@@ -553,6 +573,7 @@ def relatedRemoval(current, random_state):
         elif(target in destroyed.unassignedRequests):
             el = destroyed.unassignedRequests.pop(destroyed.unassignedRequests.index(target))
             destroyed.removalCache.append(el)
+            destroyed.update_objective(-el.profitForcast)
         else:
             raise Exception("The target can not be located.")
     
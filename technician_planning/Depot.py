@@ -1,3 +1,4 @@
+import copy
 from .Node import Node
 
 class Depot(Node):
@@ -21,6 +22,11 @@ class Depot(Node):
   def clusterCache(self):
       return self._clusterCache
 
+  def __deepcopy__(self, memo):
+      depot = super().__deepcopy__(memo)
+      depot._clusterCache = copy.deepcopy(self._clusterCache, memo)
+      return depot
+
 # Calculates the maximum working time of the fleet assigned to this Depot
   def calculateTemporalWorkforce(self):
       temporalWorkForce = 0
@@ -1,3 +1,5 @@
+import copy
+
 class Node:
     def __init__(self, index, lat ,lng, serviceDuration, schedule, serviceTime):
         self._index = index
@@ -33,6 +35,13 @@ class Node:
     @property
     def serviceTime(self):
         return self._serviceTime
+
+    # The location, service duration and time window are instance data and are shared between copies. Only the schedule differs from one solution to another.
+    def __deepcopy__(self, memo):
+        node = copy.copy(self)
+        memo[id(self)] = node
+        node._schedule = copy.copy(self._schedule)
+        return node
  
 
 
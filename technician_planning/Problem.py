@@ -1,3 +1,8 @@
+import contextlib
+import hashlib
+import os
+import tempfile
+import uuid
 import numpy as np
 import pandas
 import networkx as nx
@@ -9,30 +14,81 @@ from .Depot import Depot
 from .PlaningHorizon import PlanningHorizon
 from .ServiceStop import ServiceStop
 from .Route import Route
+from .TravelData import TravelData
 from operators import *
 from construction import Construction
 
+# The version of the compiled instance format. It is part of the content hash, so compiled instances of an older format are not picked up.
+COMPILED_FORMAT_VERSION = 1
+
+# The maximum number of matrix entries processed at once when precomputing the normalisation constants, which bounds the memory used for large instances.
+PRECOMPUTATION_CHUNK_SIZE = 2 ** 20
+
+# The problems shared with this process by their keys, see Problem.shared
+_sharedProblems = {}
+
+# Look up a shared problem on unpickling, see Problem.shared
+def sharedProblem(key):
+    if(key not in _sharedProblems):
+        raise Exception("The problem is not shared with this process. Pass the initializer and arguments of Problem.shared to the worker pool.")
+    return _sharedProblems[key]
+
 class Problem:
 
-    def __init__(self, instanceFilePath, routingDataFilePath):
+    # If a cache directory is passed, the instance is loaded from its compiled form in that directory, which is keyed by the content of both input files. If there is none yet, the instance is read from the input files and compiled into the cache directory.
+    # With mapMatrices, the time and distance matrices are stored as files of the given matrixDtype in the cache directory, and memory-mapped read-only rather than loaded into memory. All processes that load the instance then share the same pages.
+    def __init__(self, instanceFilePath, routingDataFilePath, cacheDirectory=None, mapMatrices=False, matrixDtype=np.float32):
 
-        depots, demand, fleet, timeMatrix, distanceMatrix, lunchBreak, lunchDuration = self.readInstance(instanceFilePath, routingDataFilePath)
+        if(mapMatrices and cacheDirectory is None):
+            raise Exception("Memory-mapped matrices are stored in the cache directory, so a cache directory is required.")
 
-        self._depots = depots
-        self._demand = demand
-        self._fleet = fleet
-        self._timeMatrix = timeMatrix
-        self._distanceMatrix = distanceMatrix
-        self._lunchBreak = lunchBreak
-        self._lunchDuration = lunchDuration
+        if(mapMatrices and not (np.issubdtype(matrixDtype, np.integer) or np.dtype(matrixDtype) in (np.float32, np.float64))):
+            raise Exception("Memory-mapped matrices are stored as integers, or floating point numbers of single or double precision.")
+
+        self._matrixFiles = None
+        self._sharedKey = None
+
+        compiledPath = None
+        if(cacheDirectory is not None):
+            compiledPath = os.path.join(cacheDirectory, Problem.contentHash(instanceFilePath, routingDataFilePath) + ".npz")
+
+        if(compiledPath is not None and os.path.exists(compiledPath)):
+            # the full matrices are only needed when the memory-mapped files still have to be written
+            loadMatrices = not mapMatrices or not all(os.path.exists(path) for path in Problem.matrixFilePaths(compiledPath, matrixDtype))
+            self.loadCompiled(compiledPath, loadMatrices)
+        else:
+            depots, demand, fleet, timeMatrix, distanceMatrix, lunchBreak, lunchDuration = self.readInstance(instanceFilePath, routingDataFilePath)
+
+            self._depots = depots
+            self._demand = demand
+            self._fleet = fleet
+            self._timeMatrix = timeMatrix
+            self._distanceMatrix = distanceMatrix
+            self._lunchBreak = lunchBreak
+            self._lunchDuration = lunchDuration
 
-        self._serviceMap = self.buildServiceMap()
-        self._maxServiceStartDistance = self.calculateMaxServiceStartDistance()
-        self._maxTravelTimeOccurences = self.calculcateMaxTravelTimeOccurences()
-        self._maxTimeWindowDistance = self.calculateMaxTimeWindowDistance()
-        self._maxTimeWindowLength =  self.calculateMaxTimeWindowLength()
-        self._maxServiceTime = self.calculateMaxServiceTime()
-        self._avgDrivingCost = 0.0001
+            self._serviceMap = self.buildServiceMap()
+            self._maxServiceStartDistance = self.calculateMaxServiceStartDistance()
+            self._maxTravelTimeOccurences = self.calculcateMaxTravelTimeOccurences()
+            self._maxTimeWindowDistance = self.calculateMaxTimeWindowDistance()
+            self._maxTimeWindowLength =  self.calculateMaxTimeWindowLength()
+            self._maxServiceTime = self.calculateMaxServiceTime()
+            self._avgDrivingCost = 0.0001
+
+            if(compiledPath is not None):
+                os.makedirs(cacheDirectory, exist_ok=True)
+                self.saveCompiled(compiledPath)
+
+        if(mapMatrices):
+            self.memoryMapMatrices(compiledPath, matrixDtype)
+
+        self._timeTolerance = Problem.roundingTolerance(np.asarray(self._timeMatrix))
+
+        self._travelData = TravelData(self._timeMatrix, self._distanceMatrix)
+
+        self._demandPositions = {stop.index: position for position, stop in enumerate(self._demand)}
+        self._relatedness = None
+        self._relatednessWeights = None
 
     
     @property
@@ -64,6 +120,28 @@ class Problem:
     def distanceMatrix(self):
         return self._distanceMatrix
 
+    # Negative detours and delays down to minus this tolerance are rounding errors of the travel times rather than violations of the triangle inequality, see roundingTolerance
+    @property
+    def timeTolerance(self):
+        return self._timeTolerance
+
+    # Fast per-pair and batch lookups of the travel times and distances, see TravelData
+    @property
+    def travelData(self):
+        return self._travelData
+
+    # The relatedness (see Operators.relatedness) between all pairs of customers for the given weights, with rows and columns in the order of the demand, see demandPosition. It is built once and kept until it is requested with different weights.
+    def relatednessMatrix(self, weights):
+        weights = tuple(weights)
+        if(self._relatednessWeights != weights):
+            self._relatedness = self.calculateRelatednessMatrix(weights)
+            self._relatednessWeights = weights
+        return self._relatedness
+
+    # The row and column of a customer in the relatedness matrix
+    def demandPosition(self, stop):
+        return self._demandPositions[stop.index]
+
     @property
     def lunchBreak(self):
         return self._lunchBreak                      
@@ -92,6 +170,201 @@ class Problem:
     def avgDrivingCost(self):
         return self._avgDrivingCost
     
+    # The problem instance is never changed by the search. Solutions and routes copied from one another share it instead of copying the matrices and nodes.
+    def __deepcopy__(self, memo):
+        return self
+
+    # Memory-mapped matrices are pickled as the paths of their files, so that worker processes map the same files rather than receiving a copy of the matrices.
+    # The travel data is rebuilt from the matrices on unpickling.
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_travelData"]
+        # the relatedness matrix is rebuilt on demand
+        state["_relatedness"] = None
+        state["_relatednessWeights"] = None
+        if(self._matrixFiles is not None):
+            del state["_timeMatrix"]
+            del state["_distanceMatrix"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if(self._matrixFiles is not None):
+            self._timeMatrix = np.load(self._matrixFiles[0], mmap_mode="r")
+            self._distanceMatrix = np.load(self._matrixFiles[1], mmap_mode="r")
+        self._travelData = TravelData(self._timeMatrix, self._distanceMatrix)
+
+    # A shared problem is pickled as its key only, so that solutions sent to and from worker processes do not carry a copy of the problem, see shared
+    def __reduce_ex__(self, protocol):
+        if(self._sharedKey is not None):
+            return (sharedProblem, (self._sharedKey,))
+        return super().__reduce_ex__(protocol)
+
+    # Share the problem with worker processes, e.g. those generating speculative candidates in ALNS.iterate, within a with block. Within the block, pickling the problem, or a solution or route referencing it, pickles only its key, and unpickling looks the problem up among those shared with the process. Once the block is left, the problem is pickled in full again.
+    # Yields the initializer and its arguments for the worker pool, which send the problem to every worker once when it starts. Candidates returned by the workers then reference the problem of this process again.
+    @contextlib.contextmanager
+    def shared(self):
+        if(self._sharedKey is not None):
+            # already shared by an enclosing block, which also unshares it
+            yield (Problem.registerShared, (self._sharedKey, self.__getstate__()))
+            return
+
+        self._sharedKey = uuid.uuid4().hex
+        _sharedProblems[self._sharedKey] = self
+        try:
+            yield (Problem.registerShared, (self._sharedKey, self.__getstate__()))
+        finally:
+            del _sharedProblems[self._sharedKey]
+            self._sharedKey = None
+
+    # Rebuild a shared problem from its state in a worker process, see shared
+    @staticmethod
+    def registerShared(key, state):
+        if(key not in _sharedProblems):
+            problem = Problem.__new__(Problem)
+            problem.__setstate__(state)
+            _sharedProblems[key] = problem
+
+    # The error by which a detour over three matrix entries (a + b - c) can be off because of the precision the matrix is stored in. Detours are never negative by the triangle inequality, but those of zero can come out negative once the entries are rounded to whole units or to single precision. The bound is three entries, each rounded by up to half a unit, or half a unit in the last place of the biggest entry. Double precision matrices hold the travel data as read, so there is no rounding.
+    @staticmethod
+    def roundingTolerance(array):
+        if(np.issubdtype(array.dtype, np.integer)):
+            return 1.5
+        if(array.size == 0 or np.finfo(array.dtype).eps <= np.finfo(np.float64).eps):
+            return 0.
+        return 1.5 * np.finfo(array.dtype).eps * float(np.abs(array).max())
+
+    # A hash of the content of both input files, which identifies a compiled instance
+    @staticmethod
+    def contentHash(instanceFilePath, routingDataFilePath):
+        digest = hashlib.sha256(str(COMPILED_FORMAT_VERSION).encode())
+
+        for path in [instanceFilePath, routingDataFilePath]:
+            with open(path, "rb") as file:
+                content = file.read()
+            # the length separates the content of the two files
+            digest.update(str(len(content)).encode())
+            digest.update(content)
+
+        return digest.hexdigest()
+
+    # Write the instance, including the service map and the precomputed normalisation constants, to a compiled .npz file. The file is written atomically, see writeAtomically.
+    def saveCompiled(self, compiledPath):
+        vehicleIndex = {}
+        for idx, vehicle in enumerate(self._fleet):
+            vehicleIndex[id(vehicle)] = idx
+
+        vehicleSkills = [sorted(vehicle.skillSet) for vehicle in self._fleet]
+        depotVehicles = [[vehicleIndex[id(vehicle)] for vehicle in depot.vehicles] for depot in self._depots]
+        stopSkills = [sorted(stop.requirements) for stop in self._demand]
+
+        arrays = {
+            "lunch": np.array([self._lunchBreak.earliest, self._lunchBreak.latest, self._lunchDuration], dtype=float),
+            "vehicles": np.array([[vehicle.overtimeThreshold, vehicle.maxOvertime, vehicle.overTimeCost] for vehicle in self._fleet], dtype=float).reshape(-1, 3),
+            "vehicleSkills": np.array([skill for skills in vehicleSkills for skill in skills], dtype=float),
+            "vehicleSkillCounts": np.array([len(skills) for skills in vehicleSkills], dtype=int),
+            "depots": np.array([[depot.lat, depot.lng] for depot in self._depots], dtype=float).reshape(-1, 2),
+            "depotVehicles": np.array([idx for vehicles in depotVehicles for idx in vehicles], dtype=int),
+            "depotVehicleCounts": np.array([len(vehicles) for vehicles in depotVehicles], dtype=int),
+            "stops": np.array([[stop.lat, stop.lng, stop.serviceDuration, stop.serviceTime.earliest, stop.serviceTime.latest, stop.profitForcast] for stop in self._demand], dtype=float).reshape(-1, 6),
+            "stopSkills": np.array([skill for skills in stopSkills for skill in skills], dtype=float),
+            "stopSkillCounts": np.array([len(skills) for skills in stopSkills], dtype=int),
+            "timeMatrix": np.asarray(self._timeMatrix),
+            "distanceMatrix": np.asarray(self._distanceMatrix),
+            "serviceMap": self.buildServiceMatrix(),
+            "constants": np.array([self._maxServiceStartDistance, self._maxTravelTimeOccurences[0], self._maxTravelTimeOccurences[1], self._maxTimeWindowDistance, self._maxTimeWindowLength, self._maxServiceTime, self._avgDrivingCost], dtype=float),
+        }
+
+        Problem.writeAtomically(compiledPath, lambda file: np.savez(file, **arrays))
+
+    # Load the instance from a compiled .npz file, as written by saveCompiled. No parsing or precomputation is needed. Without loadMatrices, the time and distance matrices are not read, e.g. because they are memory-mapped instead.
+    def loadCompiled(self, compiledPath, loadMatrices=True):
+        with np.load(compiledPath) as data:
+            arrays = {key: data[key] for key in data.files if loadMatrices or key not in ["timeMatrix", "distanceMatrix"]}
+
+        lunchStart, lunchEnd, lunchDuration = arrays["lunch"].tolist()
+        self._lunchBreak = TimeInterval(lunchStart, lunchEnd)
+        self._lunchDuration = lunchDuration
+
+        vehicleSkills = np.split(arrays["vehicleSkills"], np.cumsum(arrays["vehicleSkillCounts"])[:-1])
+        self._fleet = []
+        for row, skills in zip(arrays["vehicles"].tolist(), vehicleSkills):
+            self._fleet.append(Vehicle(set(skills.tolist()), row[0], row[1], row[2]))
+
+        nodeIndex = 0
+
+        depotVehicles = np.split(arrays["depotVehicles"], np.cumsum(arrays["depotVehicleCounts"])[:-1])
+        self._depots = []
+        for (lat, lng), vehicles in zip(arrays["depots"].tolist(), depotVehicles):
+            # magic numbers: A depot can be visited any time across the 24 hour planning horzion, as in readInstance.
+            self._depots.append(Depot(nodeIndex, lat, lng, 0, PlanningHorizon(0,0,0), TimeInterval(0, 86400), [self._fleet[idx] for idx in vehicles.tolist()]))
+            nodeIndex+=1
+
+        stopSkills = np.split(arrays["stopSkills"], np.cumsum(arrays["stopSkillCounts"])[:-1])
+        self._demand = []
+        for row, skills in zip(arrays["stops"].tolist(), stopSkills):
+            lat, lng, serviceDuration, earliestService, latestService, profitForcast = row
+            self._demand.append(ServiceStop(nodeIndex, lat, lng, serviceDuration, PlanningHorizon(0, 0, 0), TimeInterval(earliestService, latestService), set(skills.tolist()), profitForcast))
+            nodeIndex+=1
+
+        if(loadMatrices):
+            self._timeMatrix = np.asmatrix(arrays["timeMatrix"])
+            self._distanceMatrix = np.asmatrix(arrays["distanceMatrix"])
+
+        self._serviceMap = {}
+        for stop, canServe in zip(self._demand, arrays["serviceMap"]):
+            self._serviceMap[stop.index] = [self._fleet[idx] for idx in np.flatnonzero(canServe).tolist()]
+
+        constants = arrays["constants"].tolist()
+        self._maxServiceStartDistance = constants[0]
+        self._maxTravelTimeOccurences = constants[1:3]
+        self._maxTimeWindowDistance = constants[3]
+        self._maxTimeWindowLength = constants[4]
+        self._maxServiceTime = constants[5]
+        self._avgDrivingCost = constants[6]
+
+    # The paths of the time and distance matrix files of the given dtype that belong to a compiled instance
+    @staticmethod
+    def matrixFilePaths(compiledPath, matrixDtype):
+        base = compiledPath[:-len(".npz")]
+        dtypeName = np.dtype(matrixDtype).name
+        return base + "-time-" + dtypeName + ".npy", base + "-distance-" + dtypeName + ".npy"
+
+    # Store the time and distance matrices as files of the given dtype next to the compiled instance, if not done before, and replace them by read-only memory maps of those files.
+    # float32 halves the size of the matrices, at a relative rounding error of about 1e-7 in the travel times and distances. That is enough to change close decisions, such as time window checks, so runs differ from runs on float64 matrices. Integer dtypes round to whole seconds and metres.
+    def memoryMapMatrices(self, compiledPath, matrixDtype=np.float32):
+        matrixFiles = Problem.matrixFilePaths(compiledPath, matrixDtype)
+
+        for path, attribute in zip(matrixFiles, ["_timeMatrix", "_distanceMatrix"]):
+            if(not os.path.exists(path)):
+                values = np.asarray(getattr(self, attribute))
+                if(np.issubdtype(matrixDtype, np.integer)):
+                    values = np.rint(values)
+                    limits = np.iinfo(matrixDtype)
+                else:
+                    limits = np.finfo(matrixDtype)
+                # values out of range would wrap around or become infinite
+                if(values.size and (values.min() < limits.min or values.max() > limits.max)):
+                    raise Exception("The travel data does not fit into matrices of type " + np.dtype(matrixDtype).name + ".")
+                values = values.astype(matrixDtype)
+                Problem.writeAtomically(path, lambda file: np.save(file, values))
+
+        self._matrixFiles = matrixFiles
+        self._timeMatrix = np.load(matrixFiles[0], mmap_mode="r")
+        self._distanceMatrix = np.load(matrixFiles[1], mmap_mode="r")
+
+    # Write a file under a temporary name and then rename it, so concurrent jobs never read a partially written file
+    @staticmethod
+    def writeAtomically(path, write):
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, tmpPath = tempfile.mkstemp(suffix=os.path.splitext(path)[1], dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                write(file)
+            os.replace(tmpPath, path)
+        except BaseException:
+            os.remove(tmpPath)
+            raise
 
     # Read an instance from the local disk
     def readInstance(self, instanceFilepath, routingDataFilePath):
@@ -203,27 +476,87 @@ class Problem:
                     serviceMap[stop.index].append(vehicle)
         return serviceMap
 
+    # The service map as a compatibility bit-matrix, with a row per customer in the order of the demand and a column per vehicle in the order of the fleet
+    def buildServiceMatrix(self):
+        vehicleIndex = {}
+        for idx, vehicle in enumerate(self._fleet):
+            vehicleIndex[id(vehicle)] = idx
+
+        serviceMatrix = np.zeros((len(self._demand), len(self._fleet)), dtype=bool)
+        for row, stop in enumerate(self._demand):
+            for vehicle in self._serviceMap[stop.index]:
+                serviceMatrix[row, vehicleIndex[id(vehicle)]] = True
+        return serviceMatrix
+
+    # The relatedness matrix for the given weights, computed for chunks of rows at once with the same terms as Operators.relatedness. The number of vehicles two customers can both be served by is the product of the compatibility bit-matrix with its transpose.
+    def calculateRelatednessMatrix(self, weights):
+        stopIndices = np.array([stop.index for stop in self._demand], dtype=int)
+        earliest = np.array([stop.serviceTime.earliest for stop in self._demand], dtype=float)
+        latest = np.array([stop.serviceTime.latest for stop in self._demand], dtype=float)
+        serviceDuration = np.array([stop.serviceDuration for stop in self._demand], dtype=float) / self._maxServiceTime
+        timeWindowLength = (latest - earliest) / self._maxTimeWindowLength
+
+        canServe = self.buildServiceMatrix().astype(float)
+        numVehicles = canServe.sum(axis=1)
+
+        # the vehicle affinity is relative to the fewest vehicles either customer can be served by, so it is undefined for a customer no vehicle can serve
+        if(np.any(numVehicles == 0)):
+            unserviceable = self._demand[int(np.argmin(numVehicles))]
+            raise Exception("Customer " + str(unserviceable.index) + " cannot be served by any vehicle, so its relatedness to other customers is undefined.")
+
+        timeMatrix = np.asarray(self._timeMatrix)
+        maxTravelTime = self._maxTravelTimeOccurences[0] + self._maxTravelTimeOccurences[1]
+
+        relatedness = np.empty((len(self._demand), len(self._demand)))
+        chunkRows = max(1, PRECOMPUTATION_CHUNK_SIZE // max(1, len(self._demand)))
+        row = 0
+        while(row < len(self._demand)):
+            rows = slice(row, row + chunkRows)
+            chunkIndices = stopIndices[rows]
+
+            travelTime = np.asarray(timeMatrix[np.ix_(chunkIndices, stopIndices)], dtype=float) + np.asarray(timeMatrix[np.ix_(stopIndices, chunkIndices)], dtype=float).T
+            travelTimeScore = travelTime / maxTravelTime
+            timeWindowStartScore = np.abs(earliest[rows, None] - earliest[None, :]) / self._maxServiceStartDistance
+            timeWindowLengthScore = np.abs(timeWindowLength[rows, None] - timeWindowLength[None, :])
+            serviceDurationScore = np.abs(serviceDuration[rows, None] - serviceDuration[None, :])
+
+            sharedVehicles = canServe[rows] @ canServe.T
+            vehicleAffinityScore = 1 - sharedVehicles / np.minimum(numVehicles[rows, None], numVehicles[None, :])
 
+            relatedness[rows] = weights[0] * travelTimeScore + weights[1] * (timeWindowStartScore + timeWindowLengthScore + serviceDurationScore) + weights[2] * vehicleAffinityScore
+            row+= chunkRows
+
+        return relatedness
+
+
+    # The two biggest travel times between customers, in ascending order. The matrix is partitioned in chunks of rows, so that no copy of the full matrix is made for large instances.
     def calculcateMaxTravelTimeOccurences(self):
-       customersOnly = self._timeMatrix[len(self.depots):,len(self.depots):]
-       sortedAsList = np.sort(customersOnly.ravel()).tolist()[0]
-       biggestTwo = sortedAsList[len(sortedAsList) - 2:]
-       return biggestTwo
+        customersOnly = np.asarray(self._timeMatrix)[len(self.depots):, len(self.depots):]
+
+        if(customersOnly.size < 2):
+            return np.sort(customersOnly.ravel()).tolist()
+
+        chunkRows = max(1, PRECOMPUTATION_CHUNK_SIZE // customersOnly.shape[1])
+        candidates = []
+        row = 0
+        while(row < customersOnly.shape[0]):
+            chunk = customersOnly[row:row + chunkRows].ravel()
+            if(chunk.size < 2):
+                candidates.append(chunk)
+            else:
+                candidates.append(np.partition(chunk, -2)[-2:])
+            row+= chunkRows
+
+        biggestTwo = np.partition(np.concatenate(candidates), -2)[-2:]
+        return biggestTwo.tolist()
     
+    # The biggest distance between the earliest service start of two customers. Over all pairs this is the distance between the latest and the earliest start, so it takes linear rather than quadratic time.
     def calculateMaxServiceStartDistance(self):
-        max = -1
-        i = 0
-        # the temporal distance is a symmetric measure
-        while(i < len(self._demand)):
-            j = 0
-            while(j < len(self._demand)):
-                if i < j:
-                    temporalDistance = self._demand[i].getServiceTimeStartDistance(self._demand[j])
-                    if temporalDistance > max:
-                        max = temporalDistance
-                j+=1
-            i+=1
-        return max
+        if(len(self._demand) < 2):
+            return -1
+
+        earliest = np.array([stop.serviceTime.earliest for stop in self._demand])
+        return earliest.max() - earliest.min()
     
     def calculateMaxTimeWindowLength(self):
         twlenghts = []
@@ -243,21 +576,15 @@ class Problem:
         return maximum
         
     
+    # The biggest time window distance (see Construction.tansiniDTW) between two customers. Depots are excluded since they are always 0 in distance since their time windows are nested.
+    # The distance between two windows is the gap between the start of the later and the end of the earlier one, or 0 when they overlap. Over all pairs, the biggest gap is that between the latest start and the earliest end, so it takes linear rather than quadratic time.
     def calculateMaxTimeWindowDistance(self):
-        # Depots are excluded since they are always 0 in distance since their time windows are nested
-        max = -1
-        i = 0
-        # the tw distance is a symmetric measure.
-        while(i < len(self._demand)):
-            j = 0
-            while(j < len(self._demand)):
-                if i <=j:
-                    twDistance = Construction.tansiniDTW(self._demand[i], self._demand[j])
-                    if twDistance > max:
-                        max = twDistance
-                j+=1
-            i+=1
-        return max
+        if(not self._demand):
+            return -1
+
+        earliest = np.array([stop.serviceTime.earliest for stop in self._demand])
+        latest = np.array([stop.serviceTime.latest for stop in self._demand])
+        return max(0, (earliest.max() - latest.min()).item())
 
     def plot(self):
         G = nx.DiGraph(directed=True)
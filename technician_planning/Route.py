@@ -5,6 +5,10 @@ class Route:
         self._depot = depot
         self._vehicle = vehicle
         self._stops = []
+        # The distance traveled and overtime cost of this route. It is updated whenever the stops of this route change.
+        self._cost = 0
+        # The solution this route belongs to. Changes in the cost of this route are reported to its cached objective.
+        self._solution = None
     
     @property
     def problem(self):
@@ -22,6 +26,40 @@ class Route:
     def stops(self):
         return self._stops
     
+    @property
+    def cost(self):
+        return self._cost
+    
+    @property
+    def solution(self):
+        return self._solution
+    
+    @solution.setter
+    def solution(self, value):
+        self._solution = value
+    
+    # The problem and the vehicle are shared. The depot and the stops are copied since their schedules belong to this route.
+    def __deepcopy__(self, memo):
+        route = Route.__new__(Route)
+        memo[id(self)] = route
+        route._problem = self._problem
+        route._vehicle = self._vehicle
+        route._depot = copy.deepcopy(self._depot, memo)
+        route._stops = copy.deepcopy(self._stops, memo)
+        route._cost = self._cost
+        # only link to the solution if that is copied as well
+        route._solution = memo.get(id(self._solution))
+        return route
+    
+    # Recomputes the cost of this route after its stops changed. This takes time linear in the route length, like the change itself, and the solution objective is updated by the difference.
+    def updateCost(self):
+        cost = self.calculateDistanceTraveledCost() + self.calculateOvertime() * self.vehicle.overTimeCost
+        delta = cost - self._cost
+        self._cost = cost
+
+        if(self._solution is not None):
+            self._solution.update_objective(delta)
+    
     def calculateOvertime(self, onInstance = None):
         
         if (onInstance is None):
@@ -49,14 +87,14 @@ class Route:
         i = 0
         # working time: every nodes service time on site and the time it is waiting in addition to the travel time to the next customer
         while(i < len(onInstance) - 1):
-            workTime+= onInstance[i].serviceDuration + onInstance[i].schedule.waitingTime + self.problem.timeMatrix[onInstance[i].index, onInstance[i + 1].index]
+            workTime+= onInstance[i].serviceDuration + onInstance[i].schedule.waitingTime + self.problem.travelData.time(onInstance[i].index, onInstance[i + 1].index)
             i+=1
         
         # the travel time from the departure from the depot to the first node is working time as well
-        workTime+= self.problem.timeMatrix[self.depot.index, onInstance[0].index]
+        workTime+= self.problem.travelData.time(self.depot.index, onInstance[0].index)
         
         # working time from the last node including its traveltime back to the depot
-        workTime+= onInstance[len(onInstance) - 1].serviceDuration + onInstance[len(onInstance) - 1].schedule.waitingTime + self.problem.timeMatrix[onInstance[len(onInstance) - 1].index, self.depot.index]
+        workTime+= onInstance[len(onInstance) - 1].serviceDuration + onInstance[len(onInstance) - 1].schedule.waitingTime + self.problem.travelData.time(onInstance[len(onInstance) - 1].index, self.depot.index)
 
         return workTime
     
@@ -71,13 +109,13 @@ class Route:
             i = 0
             # distance from each customer to his sucessive customer. 
             while(i < len(onInstance) - 1):
-                distanceTraveled+= self.problem.distanceMatrix[onInstance[i].index, onInstance[i + 1].index]
+                distanceTraveled+= self.problem.travelData.distance(onInstance[i].index, onInstance[i + 1].index)
                 i+=1
             # distance from the depot to the first customer
-            distanceTraveled+= self.problem.distanceMatrix[self.depot.index, onInstance[0].index]
+            distanceTraveled+= self.problem.travelData.distance(self.depot.index, onInstance[0].index)
 
             # distance from the last customer back to the depot
-            distanceTraveled+= self.problem.distanceMatrix[onInstance[len(self._stops) - 1].index, self.depot.index]
+            distanceTraveled+= self.problem.travelData.distance(onInstance[len(self._stops) - 1].index, self.depot.index)
 
             return distanceTraveled * self.problem.avgDrivingCost
         else:
@@ -102,7 +140,7 @@ class Route:
 
         # If there is only one node inside the Route, meaning we inserted the first one whe have to inject the pause. After that the serach takes care of it self.
         # Also if the depot is the lunch target we will do a lookup
-        pauseAtDepotCanBeTakenAtTheEnd = prototype[len(prototype) - 1].schedule.departureTime + self.problem.timeMatrix[prototype[len(prototype) - 1].index, self.depot.index] <= self.problem.lunchBreak.latest
+        pauseAtDepotCanBeTakenAtTheEnd = prototype[len(prototype) - 1].schedule.departureTime + self.problem.travelData.time(prototype[len(prototype) - 1].index, self.depot.index) <= self.problem.lunchBreak.latest
         
         if ((len(prototype) == 1) or (self.depot.schedule.departureIncludesBreak and not pauseAtDepotCanBeTakenAtTheEnd) or self.depot.schedule.travelIncludesBreak):
             lunchRescedulingNeeded = True
@@ -145,6 +183,7 @@ class Route:
         if(insertCall):
 
             self._stops = pauseInjectedPrototype
+            self.updateCost()
             
             # update the depot schedule
             self.updateDepotScheduleOnChange()
@@ -169,11 +208,11 @@ class Route:
             # An insert at the beginning is an edge case. The predecessor is a the depot. Its departure time is set exactly to meet the earliest arrival treshhold of the new node.
             if (i == 0):
                 predeccesor = copy.deepcopy(self.depot)
-                predeccesor.schedule.departureTime = current.serviceTime.earliest - self.problem.timeMatrix[predeccesor.index, current.index]
+                predeccesor.schedule.departureTime = current.serviceTime.earliest - self.problem.travelData.time(predeccesor.index, current.index)
             else:
                 predeccesor = trialPlan[i - 1]
 
-            current.schedule.arrivalTime = predeccesor.schedule.departureTime + self.problem.timeMatrix[predeccesor.index, current.index]
+            current.schedule.arrivalTime = predeccesor.schedule.departureTime + self.problem.travelData.time(predeccesor.index, current.index)
             
             # if we are to late this does not work
             if (current.schedule.arrivalTime > current.serviceTime.latest):
@@ -207,7 +246,7 @@ class Route:
 
         earliestLunchStart = self.problem.lunchBreak.earliest
         latestLunchStart = self.problem.lunchBreak.latest
-        depotArrival = prototype[len(prototype) - 1].schedule.departureTime + self.problem.timeMatrix[prototype[len(prototype) - 1].index, self.depot.index]
+        depotArrival = prototype[len(prototype) - 1].schedule.departureTime + self.problem.travelData.time(prototype[len(prototype) - 1].index, self.depot.index)
 
         i = 0
         while(i < len(prototype)):
@@ -285,8 +324,8 @@ class Route:
 
         # depot Edge Cases
         if(additionalStay == -1 and additionalDrive == -1):
-            depotDeparture = trialPlan[0].serviceTime.earliest - self.problem.timeMatrix[self.depot.index, trialPlan[0].index]
-            depotArrival = trialPlan[len(trialPlan) - 1].schedule.departureTime + self.problem.timeMatrix[trialPlan[len(trialPlan) - 1].index, self.depot.index]
+            depotDeparture = trialPlan[0].serviceTime.earliest - self.problem.travelData.time(self.depot.index, trialPlan[0].index)
+            depotArrival = trialPlan[len(trialPlan) - 1].schedule.departureTime + self.problem.travelData.time(trialPlan[len(trialPlan) - 1].index, self.depot.index)
 
             # lunch can be inserted only between the depot and the first customer
             if(depotDeparture <= earliestLunchStart and trialPlan[0].schedule.arrivalTime >= latestLunchStart):
@@ -335,7 +374,7 @@ class Route:
                 predeccesor = copy.deepcopy(self.depot)
                 # the travel from the depot incldues a break
                 if(predeccesor.schedule.travelIncludesBreak):
-                    predeccesor.schedule.departureTime = current.serviceTime.earliest - self.problem.timeMatrix[predeccesor.index, current.index]
+                    predeccesor.schedule.departureTime = current.serviceTime.earliest - self.problem.travelData.time(predeccesor.index, current.index)
                     predeccesor.schedule.departureTime+= self.problem.lunchDuration
 
                 # we take the lunch at the depot as early as possible to leave when ever needed
@@ -344,7 +383,7 @@ class Route:
             else:
                 predeccesor = trialPlan[i - 1]
 
-            current.schedule.arrivalTime = predeccesor.schedule.departureTime + self.problem.timeMatrix[predeccesor.index, current.index]
+            current.schedule.arrivalTime = predeccesor.schedule.departureTime + self.problem.travelData.time(predeccesor.index, current.index)
 
             if ((i - 1)  == injectAt and additionalDrive != -1):
                 current.schedule.arrivalTime+= additionalDrive
@@ -382,7 +421,7 @@ class Route:
         if(self.stops):
 
             # the departure is taken so that the we arrive at the first customer as soon as we can start our work. This has been scheduled to the first stop already.
-            self.depot.schedule.departureTime = self._stops[0].serviceTime.earliest - self.problem.timeMatrix[self.depot.index, self._stops[0].index]
+            self.depot.schedule.departureTime = self._stops[0].serviceTime.earliest - self.problem.travelData.time(self.depot.index, self._stops[0].index)
 
             # lunch is taken on the road
             if(self.depot.schedule.travelIncludesBreak):
@@ -392,7 +431,7 @@ class Route:
             if ((self.depot.schedule.departureTime >= self.problem.lunchBreak.latest) and (self.problem.lunchBreak.earliest + self.problem.lunchDuration  > self.depot.schedule.departureTime)):
                 self.depot.schedule.departureTime = self.problem.lunchBreak.earliest + self.problem.lunchDuration
 
-            self.depot.schedule.arrivalTime = self._stops[len(self._stops) - 1].schedule.departureTime + self.problem.timeMatrix[self._stops[len(self._stops) - 1].index, self.depot.index]
+            self.depot.schedule.arrivalTime = self._stops[len(self._stops) - 1].schedule.departureTime + self.problem.travelData.time(self._stops[len(self._stops) - 1].index, self.depot.index)
 
             # if we could only take the lunch break on the way back to the depot we will arrive later
             if(self._stops[len(self._stops) - 1].schedule.travelIncludesBreak):
@@ -416,13 +455,13 @@ class Route:
             # An insert at the beginning is an edge case. The predecessor is a the depot. Its departure time is set exactly to meet the earliest arrival treshhold of the new node.
             if (i == 0):
                 predeccesor = copy.deepcopy(self.depot)
-                predeccesor.schedule.departureTime = current.serviceTime.earliest - self.problem.timeMatrix[predeccesor.index, current.index]
+                predeccesor.schedule.departureTime = current.serviceTime.earliest - self.problem.travelData.time(predeccesor.index, current.index)
             else:
                 predeccesor = self._stops[i - 1]
 
-            current.schedule.arrivalTime = predeccesor.schedule.departureTime + self.problem.timeMatrix[predeccesor.index, current.index]
+            current.schedule.arrivalTime = predeccesor.schedule.departureTime + self.problem.travelData.time(predeccesor.index, current.index)
             
-            if (current.schedule.arrivalTime > current.serviceTime.latest):
+            if (current.schedule.arrivalTime > current.serviceTime.latest + self.problem.timeTolerance):
                 raise Exception("We can never be too late asssuming triangle inequality across the problem space")
 
             # ... but if it does, do we have to wait here?
@@ -450,6 +489,7 @@ class Route:
             raise Exception("With less time in the field a pause is insertable no matter what")
 
         self._stops = pauseInjectedPrototype
+        self.updateCost()
 
         self.updateDepotScheduleOnChange()
 
@@ -472,6 +512,7 @@ class Route:
         if(not self.stops):
             # removed everything. Reset the depot schedule.
             self.updateDepotScheduleOnChange()
+            self.updateCost()
         else:
             self.removeServiceStop(firstToDelete, True, lunchDetected)
         
@@ -493,9 +534,9 @@ class Route:
         else:
             pred = self.stops[targetIdx -1]
         
-        predToTarget = self.problem.distanceMatrix[pred.index, target.index]
-        targetToSucc = self.problem.distanceMatrix[target.index, succ.index]
-        predToSucc = self.problem.distanceMatrix[pred.index, succ.index]
+        predToTarget = self.problem.travelData.distance(pred.index, target.index)
+        targetToSucc = self.problem.travelData.distance(target.index, succ.index)
+        predToSucc = self.problem.travelData.distance(pred.index, succ.index)
 
         cost = predToTarget + targetToSucc - predToSucc
         
@@ -517,9 +558,9 @@ class Route:
         else:
             pred = self.stops[targetIdx -1]
         
-        predToTarget = self.problem.timeMatrix[pred.index, target.index]
-        targetToSucc = self.problem.timeMatrix[target.index, succ.index]
-        predToSucc = self.problem.timeMatrix[pred.index, succ.index]
+        predToTarget = self.problem.travelData.time(pred.index, target.index)
+        targetToSucc = self.problem.travelData.time(target.index, succ.index)
+        predToSucc = self.problem.travelData.time(pred.index, succ.index)
 
         detour = predToTarget + targetToSucc - predToSucc
 
@@ -530,7 +571,7 @@ class Route:
             currentServiceAtSucc = succ.schedule.arrivalTime
             
             if(targetIdx != 0):
-                serviceAtSuccWithoutTarget = pred.schedule.departureTime + self.problem.timeMatrix[pred.index, succ.index]
+                serviceAtSuccWithoutTarget = pred.schedule.departureTime + self.problem.travelData.time(pred.index, succ.index)
             else:
                 serviceAtSuccWithoutTarget = succ.serviceTime.earliest
         
@@ -545,10 +586,11 @@ class Route:
             else:
                 introducedDelay = currentServiceAtSucc - serviceAtSuccWithoutTarget
             
-        if(introducedDelay < 0 ):
+        # delays down to the tolerance are rounding errors of the travel times, see Problem.timeTolerance
+        if(introducedDelay < -self.problem.timeTolerance):
             raise Exception("The delay can not be negative.")
     
-        return  [detour, introducedDelay]
+        return  [detour, max(introducedDelay, 0)]
 
     
     def getDistanceBasedInsertionCost(self, pred, succ, newStop):
@@ -563,9 +605,9 @@ class Route:
         else:
             pred = self.depot
 
-        predToNew = self.problem.distanceMatrix[pred.index, newStop.index]
-        newToSucc = self.problem.distanceMatrix[newStop.index, succ.index]
-        predToSucc = self.problem.distanceMatrix[pred.index, succ.index]
+        predToNew = self.problem.travelData.distance(pred.index, newStop.index)
+        newToSucc = self.problem.travelData.distance(newStop.index, succ.index)
+        predToSucc = self.problem.travelData.distance(pred.index, succ.index)
 
         cost = predToNew + newToSucc - predToSucc
         
@@ -583,16 +625,17 @@ class Route:
         else:
             pred = self.depot
 
-        predToNew = self.problem.timeMatrix[pred.index, newStop.index]
-        newToSucc = self.problem.timeMatrix[newStop.index, succ.index]
-        predToSucc = self.problem.timeMatrix[pred.index, succ.index]
+        predToNew = self.problem.travelData.time(pred.index, newStop.index)
+        newToSucc = self.problem.travelData.time(newStop.index, succ.index)
+        predToSucc = self.problem.travelData.time(pred.index, succ.index)
 
         cost = predToNew + newToSucc - predToSucc
 
-        if(cost < 0):
+        # costs down to the tolerance are rounding errors of the travel times, see Problem.timeTolerance
+        if(cost < -self.problem.timeTolerance):
             raise Exception("A negative cost is impossible")
 
-        return cost
+        return max(cost, 0)
     
     def getIntroducedDelay(self, pred, succ, newStop):
 
@@ -608,7 +651,7 @@ class Route:
         currentServiceAtSucc = succ.schedule.arrivalTime
         
         if(pred != -1):
-            arrivalAtNewStop = pred.schedule.departureTime + self.problem.timeMatrix[pred.index, newStop.index]
+            arrivalAtNewStop = pred.schedule.departureTime + self.problem.travelData.time(pred.index, newStop.index)
         # the arrival at the first stop, if the predecessor is a depot, is always the ealiest service time
         else:
             arrivalAtNewStop = newStop.serviceTime.earliest
@@ -622,7 +665,7 @@ class Route:
         
         departureAtNewStop = arrivalAtNewStop + waitAtNewStop + newStop.serviceDuration
         
-        shiftedSuccArrival = departureAtNewStop + self.problem.timeMatrix[newStop.index, succ.index]
+        shiftedSuccArrival = departureAtNewStop + self.problem.travelData.time(newStop.index, succ.index)
 
 
         # do we wait with the shifted succ arrival or are we perfectly on time? Then there is no delay
@@ -634,10 +677,10 @@ class Route:
         else:
             introducedDelay = shiftedSuccArrival - currentServiceAtSucc
 
-        if(introducedDelay < 0 ):
+        if(introducedDelay < -self.problem.timeTolerance):
             raise Exception("A negative delay is not possible.")
 
-        return introducedDelay
+        return max(introducedDelay, 0)
 
     
 
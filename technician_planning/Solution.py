@@ -1,13 +1,19 @@
+import copy
 import networkx as nx
 import matplotlib.pyplot as plt
+from alns.CachedState import CachedState
 
-class Solution:
+# The objective value is cached and kept up-to-date by deltas. Routes report the change in their cost when their stops change, changes to the list of unassigned requests have to be reported via update_objective().
+class Solution(CachedState):
 
     def __init__(self, routes, unassignedRequests, problem):
         self._routes = routes
         self._unassignedRequests = unassignedRequests
         self._removalCache = []
         self._problem = problem
+
+        for route in routes:
+            route.solution = self
     
     @property
     def routes(self):
@@ -25,6 +31,22 @@ class Solution:
     def problem(self):
         return self._problem
     
+    # Copies the routes, the stops and their schedules. The problem instance is shared, so the cost of a copy scales with the solution and not with the instance.
+    def clone(self):
+        return copy.deepcopy(self)
+    
+    def __deepcopy__(self, memo):
+        solution = Solution.__new__(Solution)
+        memo[id(self)] = solution
+        solution._problem = self._problem
+        # a single memo keeps depots shared by several routes shared in the copy as well
+        solution._routes = copy.deepcopy(self._routes, memo)
+        solution._unassignedRequests = copy.deepcopy(self._unassignedRequests, memo)
+        solution._removalCache = copy.deepcopy(self._removalCache, memo)
+        # the copy has the same objective value, later changes are applied to it as deltas
+        solution._cached_objective = self._cached_objective
+        return solution
+    
     def calculateRequestCoverageCost(self):
         requestCoverageCost = 0
 
@@ -60,7 +82,7 @@ class Solution:
         
         return totalOvertimeCost
     
-    def objective(self):
+    def compute_objective(self):
         return self.calculateRequestCoverageCost() + self.calculateTotalDistanceTraveledCost() + self.calculateTotalOvertimeCost()
     
     def toGraph(self):
@@ -0,0 +1,32 @@
+import numpy as np
+
+# Fast access to the travel times and distances between nodes. Indexing an np.matrix goes through a slow generic __getitem__ and returns a NumPy scalar, which also makes the arithmetic on the result slow. Here both matrices are viewed as flat sequences with precomputed row offsets.
+class TravelData:
+
+    def __init__(self, timeMatrix, distanceMatrix):
+        self._timeArray = np.asarray(timeMatrix)
+        self._distanceArray = np.asarray(distanceMatrix)
+
+        numColumns = self._timeArray.shape[1]
+        self._rowOffsets = [row * numColumns for row in range(self._timeArray.shape[0])]
+
+        # memoryviews of the flattened matrices return plain Python numbers, and keep memory-mapped matrices mapped rather than copying them. They are also more compact than lists of Python floats, which keeps random lookups in large matrices cache friendly.
+        self._times = memoryview(np.ascontiguousarray(self._timeArray).reshape(-1))
+        self._distances = memoryview(np.ascontiguousarray(self._distanceArray).reshape(-1))
+
+    @property
+    def numNodes(self):
+        return len(self._rowOffsets)
+
+    def time(self, fromIndex, toIndex):
+        return self._times[self._rowOffsets[fromIndex] + toIndex]
+
+    def distance(self, fromIndex, toIndex):
+        return self._distances[self._rowOffsets[fromIndex] + toIndex]
+
+    # Batch lookups of the travel times and distances between pairs of nodes, given as index vectors of equal length, or broadcastable against each other.
+    def times(self, fromIndices, toIndices):
+        return self._timeArray[np.asarray(fromIndices), np.asarray(toIndices)]
+
+    def distances(self, fromIndices, toIndices):
+        return self._distanceArray[np.asarray(fromIndices), np.asarray(toIndices)]
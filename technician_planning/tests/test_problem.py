@@ -0,0 +1,379 @@
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+from numpy.testing import (assert_, assert_allclose, assert_equal,
+                           assert_raises)
+
+from construction import Construction
+from operators import Operators
+from technician_planning import Problem as ProblemModule
+from technician_planning.Problem import Problem
+
+DATASETS = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir,
+                        "examples", "Datasets")
+
+
+def get_paths(dataset):
+    return (os.path.join(DATASETS, "Data_{0}.csv".format(dataset)),
+            os.path.join(DATASETS, "Matrix_{0}.json".format(dataset)))
+
+
+def build_initial_solution(problem):
+    solution = Construction.parallelUrgencyAssignment(problem)
+    Construction.buildSolutionParallelStyle(solution)
+    return solution
+
+
+@pytest.mark.parametrize("dataset", [1, 3])
+def test_builds_solution_on_single_precision_matrices(dataset, tmp_path):
+    """
+    Rounding the travel times to single precision makes some detours of zero
+    slightly negative. These are rounding errors, so building an initial
+    solution on memory-mapped float32 matrices should not fail on them.
+    """
+    problem = Problem(*get_paths(dataset), cacheDirectory=str(tmp_path),
+                      mapMatrices=True, matrixDtype=np.float32)
+
+    assert_equal(problem.timeMatrix.dtype, np.float32)
+    assert_(problem.timeTolerance > 0)
+
+    solution = build_initial_solution(problem)
+    assert_(np.isfinite(solution.objective()))
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64, np.int32])
+def test_mapped_matrices_round_trip(dtype, tmp_path):
+    """
+    A problem with memory-mapped matrices of each supported type should load
+    from the cache, survive pickling with its matrices mapped again from the
+    same files, and allow building an initial solution.
+    """
+    paths = get_paths(1)
+    parsed = Problem(*paths)
+
+    Problem(*paths, cacheDirectory=str(tmp_path), mapMatrices=True,
+            matrixDtype=dtype)
+    loaded = Problem(*paths, cacheDirectory=str(tmp_path), mapMatrices=True,
+                     matrixDtype=dtype)
+
+    assert_(isinstance(loaded.timeMatrix, np.memmap))
+    assert_equal(loaded.timeMatrix.dtype, dtype)
+
+    if np.issubdtype(dtype, np.integer):
+        expected = np.rint(np.asarray(parsed.timeMatrix)).astype(dtype)
+    else:
+        expected = np.asarray(parsed.timeMatrix).astype(dtype)
+
+    assert_equal(np.asarray(loaded.timeMatrix), expected)
+
+    unpickled = pickle.loads(pickle.dumps(loaded))
+
+    assert_(isinstance(unpickled.timeMatrix, np.memmap))
+    assert_equal(unpickled.timeMatrix.filename, loaded.timeMatrix.filename)
+    assert_equal(np.asarray(unpickled.distanceMatrix),
+                 np.asarray(loaded.distanceMatrix))
+    assert_equal(unpickled.travelData.time(1, 2), loaded.travelData.time(1, 2))
+
+    solution = build_initial_solution(unpickled)
+    assert_(np.isfinite(solution.objective()))
+
+
+@pytest.mark.parametrize("dtype", [np.int16, np.float16, np.bool_])
+def test_raises_unsupported_matrix_dtype(dtype, tmp_path):
+    """
+    Matrix types that cannot represent the travel data, because it is out of
+    their range or they are not numbers of a supported precision, should be
+    rejected.
+    """
+    with assert_raises(Exception):
+        Problem(*get_paths(2), cacheDirectory=str(tmp_path),
+                mapMatrices=True, matrixDtype=dtype)
+
+
+def test_raises_mapped_matrices_without_cache(tmp_path):
+    """
+    Memory-mapped matrices are stored in the cache directory, so mapping them
+    without one should raise.
+    """
+    with assert_raises(Exception):
+        Problem(*get_paths(1), mapMatrices=True)
+
+
+@pytest.mark.parametrize("dataset", [1, 2, 3, 4])
+def test_cached_load_matches_parsed(dataset, tmp_path):
+    """
+    A problem loaded from its compiled form in the cache should match one
+    parsed from the input files: the fleet, depots, demand, service map,
+    matrices and normalisation constants.
+    """
+    paths = get_paths(dataset)
+    parsed = Problem(*paths)
+
+    Problem(*paths, cacheDirectory=str(tmp_path))
+    assert_equal(len(os.listdir(str(tmp_path))), 1)
+
+    cached = Problem(*paths, cacheDirectory=str(tmp_path))
+
+    for attr in ["maxServiceStartDistance", "maxTravelTimeOccurences",
+                 "maxTimeWindowDistance", "maxTimeWindowLength",
+                 "maxServiceTime", "avgDrivingCost", "lunchDuration"]:
+        assert_equal(getattr(cached, attr), getattr(parsed, attr))
+
+    assert_equal(cached.lunchBreak.earliest, parsed.lunchBreak.earliest)
+    assert_equal(cached.lunchBreak.latest, parsed.lunchBreak.latest)
+
+    assert_(isinstance(cached.timeMatrix, np.matrix))
+    assert_equal(cached.timeMatrix, parsed.timeMatrix)
+    assert_equal(cached.distanceMatrix, parsed.distanceMatrix)
+
+    assert_equal(len(cached.fleet), len(parsed.fleet))
+    for ours, theirs in zip(cached.fleet, parsed.fleet):
+        assert_equal(ours.skillSet, theirs.skillSet)
+        assert_equal(ours.overtimeThreshold, theirs.overtimeThreshold)
+        assert_equal(ours.maxOvertime, theirs.maxOvertime)
+        assert_equal(ours.overTimeCost, theirs.overTimeCost)
+
+    assert_equal(len(cached.depots), len(parsed.depots))
+    for ours, theirs in zip(cached.depots, parsed.depots):
+        assert_equal((ours.index, ours.lat, ours.lng),
+                     (theirs.index, theirs.lat, theirs.lng))
+        assert_equal([cached.fleet.index(vehicle)
+                      for vehicle in ours.vehicles],
+                     [parsed.fleet.index(vehicle)
+                      for vehicle in theirs.vehicles])
+
+    assert_equal(len(cached.demand), len(parsed.demand))
+    for ours, theirs in zip(cached.demand, parsed.demand):
+        assert_equal((ours.index, ours.lat, ours.lng, ours.serviceDuration,
+                      ours.serviceTime.earliest, ours.serviceTime.latest,
+                      ours.requirements, ours.profitForcast),
+                     (theirs.index, theirs.lat, theirs.lng,
+                      theirs.serviceDuration, theirs.serviceTime.earliest,
+                      theirs.serviceTime.latest, theirs.requirements,
+                      theirs.profitForcast))
+
+    assert_equal(sorted(cached.serviceMap), sorted(parsed.serviceMap))
+    for index in parsed.serviceMap:
+        assert_equal([cached.fleet.index(vehicle)
+                      for vehicle in cached.serviceMap[index]],
+                     [parsed.fleet.index(vehicle)
+                      for vehicle in parsed.serviceMap[index]])
+
+
+def test_changed_input_file_changes_hash(tmp_path):
+    """
+    The compiled instance is keyed by the content of both input files, so
+    changing either of them should give a new hash, and a new entry in the
+    cache rather than the stale one.
+    """
+    instance_path, routing_path = get_paths(1)
+
+    copied_instance = str(tmp_path / "Data.csv")
+    copied_routing = str(tmp_path / "Matrix.json")
+
+    with open(instance_path, "rb") as fh:
+        instance = fh.read()
+    with open(routing_path, "rb") as fh:
+        routing = fh.read()
+
+    with open(copied_instance, "wb") as fh:
+        fh.write(instance)
+    with open(copied_routing, "wb") as fh:
+        fh.write(routing)
+
+    original = Problem.contentHash(copied_instance, copied_routing)
+    assert_equal(original, Problem.contentHash(instance_path, routing_path))
+
+    with open(copied_routing, "wb") as fh:
+        fh.write(routing + b" ")
+
+    changed_routing = Problem.contentHash(copied_instance, copied_routing)
+    assert_(changed_routing != original)
+
+    with open(copied_routing, "wb") as fh:
+        fh.write(routing)
+    with open(copied_instance, "wb") as fh:
+        fh.write(instance + b"\n")
+
+    changed_instance = Problem.contentHash(copied_instance, copied_routing)
+    assert_(changed_instance != original)
+    assert_(changed_instance != changed_routing)
+
+    cache = tmp_path / "cache"
+    Problem(copied_instance, copied_routing, cacheDirectory=str(cache))
+    assert_(os.path.exists(str(cache / (changed_instance + ".npz"))))
+
+
+def test_shared_problem_pickles_key(monkeypatch):
+    """
+    While shared, pickling a solution should pickle only the key of its
+    problem. Unpickling should give the problem of the process, which a
+    worker receives once through the initializer yielded by shared. Once the
+    block is left, the problem should be pickled in full again.
+    """
+    monkeypatch.setattr(ProblemModule, "_sharedProblems", {})
+
+    problem = Problem(*get_paths(1))
+    solution = build_initial_solution(problem)
+    unshared = len(pickle.dumps(solution))
+
+    with problem.shared() as (initializer, initargs):
+        shared = pickle.dumps(solution)
+
+        assert_(len(shared) < unshared / 2)
+        assert_(pickle.loads(shared).problem is problem)
+
+        # A worker process has no shared problems until the initializer is
+        # run.
+        monkeypatch.setattr(ProblemModule, "_sharedProblems", {})
+
+        with assert_raises(Exception):
+            pickle.loads(shared)
+
+        initializer(*pickle.loads(pickle.dumps(initargs)))
+        received = pickle.loads(shared)
+
+        assert_(received.problem is not problem)
+        assert_(received.problem is pickle.loads(shared).problem)
+        assert_equal(received.problem.timeMatrix, problem.timeMatrix)
+        assert_equal(received.objective(), solution.objective())
+
+        monkeypatch.setattr(ProblemModule, "_sharedProblems",
+                            {problem._sharedKey: problem})
+
+    assert_equal(ProblemModule._sharedProblems, {})
+
+    unpickled = pickle.loads(pickle.dumps(solution))
+    assert_(unpickled.problem is not problem)
+    assert_equal(unpickled.problem.timeMatrix, problem.timeMatrix)
+
+
+def solution_objective(solution):
+    return solution.objective()
+
+
+def test_shared_problem_in_spawned_workers():
+    """
+    Worker processes that are spawned rather than forked know nothing of the
+    parent's shared problems. Solutions sent to them should carry the problem
+    unless it is shared, and a shared problem should reach them through the
+    initializer.
+    """
+    problem = Problem(*get_paths(1))
+    solution = build_initial_solution(problem)
+    context = multiprocessing.get_context("spawn")
+
+    with ProcessPoolExecutor(1, mp_context=context) as pool:
+        objective = pool.submit(solution_objective, solution).result()
+        assert_equal(objective, solution.objective())
+
+    with problem.shared() as (initializer, initargs):
+        with ProcessPoolExecutor(1, mp_context=context,
+                                 initializer=initializer,
+                                 initargs=initargs) as pool:
+            objective = pool.submit(solution_objective, solution).result()
+            assert_equal(objective, solution.objective())
+
+    with ProcessPoolExecutor(1, mp_context=context) as pool:
+        objective = pool.submit(solution_objective, solution).result()
+        assert_equal(objective, solution.objective())
+
+
+def assert_matches_scalar_relatedness(problem, matrix):
+    for stop_a in problem.demand:
+        for stop_b in problem.demand:
+            position = (problem.demandPosition(stop_a),
+                        problem.demandPosition(stop_b))
+            assert_allclose(matrix[position],
+                            Operators.relatedness(stop_a, stop_b, problem))
+
+
+@pytest.mark.parametrize("dataset", [1, 4])
+def test_relatedness_matrix_matches_scalar(dataset, monkeypatch):
+    """
+    Every entry of the relatedness matrix should equal the relatedness of the
+    two customers computed one pair at a time, for the same weights. The
+    matrix should be kept for the same weights, and rebuilt when they change.
+    """
+    problem = Problem(*get_paths(dataset))
+
+    matrix = problem.relatednessMatrix(Operators.relatednessWeights)
+    assert_equal(matrix.shape, (len(problem.demand), len(problem.demand)))
+    assert_matches_scalar_relatedness(problem, matrix)
+
+    assert_(problem.relatednessMatrix(Operators.relatednessWeights) is matrix)
+
+    monkeypatch.setattr(Operators, "relatednessWeights", [1, 2, 0])
+    changed = problem.relatednessMatrix(Operators.relatednessWeights)
+
+    assert_(changed is not matrix)
+    assert_matches_scalar_relatedness(problem, changed)
+
+
+def test_relatedness_matrix_raises_unserviceable_customer():
+    """
+    The vehicle affinity of a customer no vehicle can serve is undefined, so
+    computing the relatedness matrix should raise, as computing its
+    relatedness to any other customer does.
+    """
+    problem = Problem(*get_paths(1))
+    stop_a, stop_b = problem.demand[:2]
+    problem.serviceMap[stop_a.index] = []
+
+    with assert_raises(ZeroDivisionError):
+        Operators.relatedness(stop_a, stop_b, problem)
+
+    with assert_raises(Exception):
+        problem.relatednessMatrix(Operators.relatednessWeights)
+
+
+def pairwise_max_service_start_distance(demand):
+    distances = [stop_a.getServiceTimeStartDistance(stop_b)
+                 for idx, stop_a in enumerate(demand)
+                 for stop_b in demand[idx + 1:]]
+    return max(distances, default=-1)
+
+
+def pairwise_max_time_window_distance(demand):
+    distances = [Construction.tansiniDTW(stop_a, stop_b)
+                 for idx, stop_a in enumerate(demand)
+                 for stop_b in demand[idx:]]
+    return max(distances, default=-1)
+
+
+@pytest.mark.parametrize("chunk_size", [ProblemModule.PRECOMPUTATION_CHUNK_SIZE,
+                                        3])
+@pytest.mark.parametrize("num_customers", [0, 1, 2, 5, 10])
+def test_precomputation_matches_pairwise(num_customers, chunk_size,
+                                         monkeypatch):
+    """
+    The normalisation constants are computed without visiting every pair of
+    customers. They should match their definitions over all pairs, also for
+    fewer than two customers, and when the travel times are processed in
+    chunks of rows.
+    """
+    monkeypatch.setattr(ProblemModule, "PRECOMPUTATION_CHUNK_SIZE", chunk_size)
+
+    problem = Problem(*get_paths(4))
+    problem._demand = problem.demand[:num_customers]
+
+    assert_equal(problem.calculateMaxServiceStartDistance(),
+                 pairwise_max_service_start_distance(problem.demand))
+    assert_equal(problem.calculateMaxTimeWindowDistance(),
+                 pairwise_max_time_window_distance(problem.demand))
+
+    num_nodes = len(problem.depots) + num_customers
+    rnd = np.random.default_rng(num_customers)
+    problem._timeMatrix = np.matrix(rnd.integers(0, 100, (num_nodes,
+                                                          num_nodes)))
+
+    travel_times = sorted(problem.timeMatrix[i, j]
+                          for i in range(len(problem.depots), num_nodes)
+                          for j in range(len(problem.depots), num_nodes))
+
+    assert_equal(problem.calculcateMaxTravelTimeOccurences(),
+                 travel_times[-2:])
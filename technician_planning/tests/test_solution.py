@@ -0,0 +1,87 @@
+import os
+
+from numpy.testing import assert_, assert_equal
+
+from construction import Construction
+from technician_planning.Problem import Problem
+
+DATASETS = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir,
+                        "examples", "Datasets")
+
+
+def build_initial_solution(dataset):
+    problem = Problem(os.path.join(DATASETS, "Data_{0}.csv".format(dataset)),
+                      os.path.join(DATASETS, "Matrix_{0}.json".format(dataset)))
+
+    solution = Construction.parallelUrgencyAssignment(problem)
+    Construction.buildSolutionParallelStyle(solution)
+    return solution
+
+
+def test_clone_shares_problem_and_copies_routes():
+    """
+    A clone should share the problem instance and the vehicles, but have its
+    own routes, stops and schedules. Depots shared by several routes should
+    be shared by the cloned routes as well.
+    """
+    solution = build_initial_solution(1)
+    clone = solution.clone()
+
+    assert_(clone.problem is solution.problem)
+    assert_equal(len(clone.routes), len(solution.routes))
+
+    for ours, theirs in zip(clone.routes, solution.routes):
+        assert_(ours is not theirs)
+        assert_(ours.problem is theirs.problem)
+        assert_(ours.vehicle is theirs.vehicle)
+
+        assert_(ours.depot is not theirs.depot)
+        assert_equal(ours.depot.index, theirs.depot.index)
+
+        assert_(ours.stops is not theirs.stops)
+        assert_equal(len(ours.stops), len(theirs.stops))
+
+        for our_stop, their_stop in zip(ours.stops, theirs.stops):
+            assert_(our_stop is not their_stop)
+            assert_(our_stop.schedule is not their_stop.schedule)
+            assert_(our_stop.serviceTime is their_stop.serviceTime)
+
+            assert_equal(our_stop.index, their_stop.index)
+            assert_equal(our_stop.schedule.arrivalTime,
+                         their_stop.schedule.arrivalTime)
+
+    for idx, route in enumerate(solution.routes):
+        for other, other_route in enumerate(solution.routes):
+            assert_equal(route.depot is other_route.depot,
+                         clone.routes[idx].depot is clone.routes[other].depot)
+
+    assert_(any(route.depot is other.depot
+                for route in clone.routes for other in clone.routes
+                if route is not other))
+
+    assert_equal(clone.objective(), solution.objective())
+
+
+def test_changing_clone_leaves_original_unchanged():
+    """
+    Removing a stop from a route of the clone should change neither the
+    routes, the schedules nor the objective of the original solution.
+    """
+    solution = build_initial_solution(1)
+
+    stops = [[stop.index for stop in route.stops] for route in solution.routes]
+    arrivals = [[stop.schedule.arrivalTime for stop in route.stops]
+                for route in solution.routes]
+    objective = solution.objective()
+
+    clone = solution.clone()
+    route = next(route for route in clone.routes if len(route.stops) > 1)
+    route.removeServiceStop(0)
+
+    assert_(clone.objective() != objective)
+
+    assert_equal([[stop.index for stop in route.stops]
+                  for route in solution.routes], stops)
+    assert_equal([[stop.schedule.arrivalTime for stop in route.stops]
+                  for route in solution.routes], arrivals)
+    assert_equal(solution.objective(), objective)
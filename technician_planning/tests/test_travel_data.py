@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+from numpy.testing import assert_, assert_equal
+
+from technician_planning.TravelData import TravelData
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32, np.int32,
+                                   np.uint16])
+def test_lookups_match_matrix_entries(dtype):
+    """
+    The per-pair and batch lookups should return the entries of the matrices
+    they were built from, for every matrix type. The per-pair lookups should
+    return plain Python numbers.
+    """
+    rnd = np.random.default_rng(1)
+    time_matrix = np.matrix(rnd.uniform(0, 1000, (5, 5))).astype(dtype)
+    distance_matrix = np.matrix(rnd.uniform(0, 1000, (5, 5))).astype(dtype)
+
+    travel_data = TravelData(time_matrix, distance_matrix)
+    assert_equal(travel_data.numNodes, 5)
+
+    for i in range(5):
+        for j in range(5):
+            time = travel_data.time(i, j)
+            distance = travel_data.distance(i, j)
+
+            assert_(type(time) in (int, float))
+            assert_(type(distance) in (int, float))
+
+            assert_equal(time, time_matrix[i, j])
+            assert_equal(distance, distance_matrix[i, j])
+
+    from_indices = np.array([0, 4, 2, 2])
+    to_indices = np.array([1, 0, 2, 3])
+
+    times = travel_data.times(from_indices, to_indices)
+    distances = travel_data.distances(from_indices, to_indices)
+
+    assert_equal(times.dtype, dtype)
+    assert_equal(times, np.asarray(time_matrix)[from_indices, to_indices])
+    assert_equal(distances,
+                 np.asarray(distance_matrix)[from_indices, to_indices])
+
+    # Index vectors broadcast against each other, e.g. from one node to many.
+    assert_equal(travel_data.times(3, to_indices),
+                 np.asarray(time_matrix)[3, to_indices])